@@ -0,0 +1,379 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Backtesting throughput benchmark: generates a synthetic backtesting data file for 1, 10 and 100 pairs on several time
+frames, runs it through an ExchangeSimulator and its backtesting updaters with a minimal trading mode and reports
+candles/s, orders/s, peak RSS and time spent in each channel as json. Each scenario runs in a fresh process to get its
+own peak RSS. Runs offline.
+Usage: python benchmarks/backtesting_throughput_benchmark.py [candles_count] [output.json] [--candle-fill-engine]
+[--skip-idle-timestamps] [--no-preloaded-data]
+"""
+import asyncio
+import collections
+import concurrent.futures
+import decimal
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import async_channel.channels as channels
+import octobot_backtesting.api as backtesting_api
+import octobot_backtesting.backtesting as backtesting
+import octobot_backtesting.channels_manager as backtesting_channels_manager
+import octobot_backtesting.collectors as collectors
+import octobot_backtesting.constants as backtesting_constants
+import octobot_backtesting.data as backtesting_data
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.importers as importers
+import octobot_commons.channels_name as channels_name
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+import octobot_commons.tests.test_config as test_config
+
+import octobot_trading.api as trading_api
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.exchange_channel as exchange_channel
+import octobot_trading.exchanges as exchanges
+import octobot_trading.personal_data as personal_data
+
+PAIRS_COUNTS = [1, 10, 100]
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS,
+               commons_enums.TimeFrames.ONE_DAY]
+# trading mode candles: shorter time frames candles closes are idle timestamps
+TRADING_MODE_TIME_FRAME = commons_enums.TimeFrames.FOUR_HOURS
+START_TIMESTAMP = 1577836800
+EXCHANGE_NAME = "binance"
+REFERENCE_MARKET = "USDT"
+ORDER_COST = decimal.Decimal(10)
+ORDER_PRICE_DELTA = decimal.Decimal("0.005")
+
+
+def _get_pairs(pairs_count):
+    return [f"P{index}/{REFERENCE_MARKET}" for index in range(pairs_count)]
+
+
+def _get_time_frame_seconds(time_frame):
+    return commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+
+
+def _generate_candles(seed, time_frame, candles_count):
+    # deterministic random walk
+    generator = random.Random(seed)
+    time_frame_seconds = _get_time_frame_seconds(time_frame)
+    candles = []
+    close_price = 100
+    for index in range(candles_count):
+        open_price = close_price
+        close_price = max(open_price * (1 + generator.gauss(0, 0.01)), 0.01)
+        candles.append([
+            START_TIMESTAMP + index * time_frame_seconds,
+            open_price,
+            max(open_price, close_price) * (1 + abs(generator.gauss(0, 0.003))),
+            min(open_price, close_price) * (1 - abs(generator.gauss(0, 0.003))),
+            close_price,
+            generator.uniform(10, 1000)
+        ])
+    return candles
+
+
+class _MinimalTradingMode:
+    """
+    Keeps a buy limit order below and a sell limit order above the last close price of each pair
+    """
+
+    def __init__(self, exchange_manager, time_frame):
+        self.exchange_manager = exchange_manager
+        self.time_frame = time_frame
+        self.created_orders_count = 0
+        self.duration = 0
+
+    async def start(self):
+        await exchange_channel.get_chan(constants.OHLCV_CHANNEL, self.exchange_manager.id) \
+            .new_consumer(self.ohlcv_callback, time_frame=self.time_frame)
+        # recent trades (and therefore orders price events) are only handled when the channel has consumers
+        await exchange_channel.get_chan(constants.RECENT_TRADES_CHANNEL, self.exchange_manager.id) \
+            .new_consumer(self.recent_trades_callback)
+
+    async def ohlcv_callback(self, exchange: str, exchange_id: str, cryptocurrency: str, symbol: str,
+                             time_frame, candle):
+        start_time = time.perf_counter()
+        if not self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(symbol=symbol):
+            close_price = decimal.Decimal(str(candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value]))
+            buy_price = close_price * (1 - ORDER_PRICE_DELTA)
+            await self._create_order(enums.TraderOrderType.BUY_LIMIT, symbol, close_price,
+                                     ORDER_COST / buy_price, buy_price)
+            available_quantity = self.exchange_manager.exchange_personal_data.portfolio_manager.portfolio \
+                .get_currency_portfolio(cryptocurrency)
+            if available_quantity > constants.ZERO:
+                await self._create_order(enums.TraderOrderType.SELL_LIMIT, symbol, close_price,
+                                         available_quantity, close_price * (1 + ORDER_PRICE_DELTA))
+        self.duration += time.perf_counter() - start_time
+
+    async def recent_trades_callback(self, exchange: str, exchange_id: str, cryptocurrency: str, symbol: str,
+                                     recent_trades):
+        pass
+
+    async def _create_order(self, order_type, symbol, current_price, quantity, price):
+        trader = self.exchange_manager.trader
+        await trader.create_order(personal_data.create_order_instance(trader=trader,
+                                                                      order_type=order_type,
+                                                                      symbol=symbol,
+                                                                      current_price=current_price,
+                                                                      quantity=quantity,
+                                                                      price=price))
+        self.created_orders_count += 1
+
+
+async def _create_data_file(directory, pairs, candles_count):
+    """
+    Write a backtesting data file using the exchange data collectors format
+    :return: the data file path and its candles count
+    """
+    shortest_time_frame_seconds = _get_time_frame_seconds(TIME_FRAMES[0])
+    file_path = os.path.join(directory, f"{collectors.ExchangeDataCollector.__name__}"
+                                        f"{backtesting_constants.BACKTESTING_DATA_FILE_SEPARATOR}{START_TIMESTAMP}"
+                                        f"{backtesting_constants.BACKTESTING_DATA_FILE_EXT}")
+    database = backtesting_data.DataBase(file_path)
+    await database.initialize()
+    end_timestamp = START_TIMESTAMP + candles_count * shortest_time_frame_seconds
+    await database.insert(backtesting_enums.DataTables.DESCRIPTION,
+                          timestamp=time.time(),
+                          version=collectors.ExchangeDataCollector.VERSION,
+                          exchange=EXCHANGE_NAME,
+                          symbols=json.dumps(pairs),
+                          time_frames=json.dumps([time_frame.value for time_frame in TIME_FRAMES]),
+                          start_timestamp=START_TIMESTAMP,
+                          end_timestamp=end_timestamp)
+    total_candles_count = 0
+    for pair_index, pair in enumerate(pairs):
+        for time_frame_index, time_frame in enumerate(TIME_FRAMES):
+            candles = _generate_candles(pair_index * len(TIME_FRAMES) + time_frame_index, time_frame,
+                                        candles_count * shortest_time_frame_seconds //
+                                        _get_time_frame_seconds(time_frame))
+            await database.insert_all(backtesting_enums.ExchangeDataTables.OHLCV,
+                                      timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+                                                 for candle in candles],
+                                      exchange_name=EXCHANGE_NAME,
+                                      cryptocurrency=pair.split("/")[0],
+                                      symbol=pair,
+                                      time_frame=time_frame.value,
+                                      candle=[json.dumps(candle) for candle in candles])
+            total_candles_count += len(candles)
+    await database.stop()
+    return file_path, total_candles_count
+
+
+def _get_config(pairs):
+    config = test_config.load_test_config()
+    config[backtesting_constants.CONFIG_BACKTESTING] = {commons_constants.CONFIG_ENABLED_OPTION: True}
+    config[commons_constants.CONFIG_TIME_FRAME] = TIME_FRAMES
+    config[commons_constants.CONFIG_CRYPTO_CURRENCIES] = {
+        pair.split("/")[0]: {commons_constants.CONFIG_CRYPTO_PAIRS: [pair]}
+        for pair in pairs
+    }
+    config[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_STARTING_PORTFOLIO] = {
+        REFERENCE_MARKET: 10 ** 9
+    }
+    config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_REFERENCE_MARKET] = REFERENCE_MARKET
+    return config
+
+
+async def _create_backtesting(config, data_file):
+    backtesting_instance = backtesting.Backtesting(config=config, exchange_ids=[], matrix_id="",
+                                                   backtesting_files=[data_file])
+    await backtesting_instance.initialize()
+    # importers are usually identified from tentacles collectors
+    importer = importers.ExchangeDataImporter(config, data_file)
+    await importer.initialize()
+    backtesting_instance.importers = [importer]
+    await backtesting_api.adapt_backtesting_channels(backtesting_instance, config, importers.ExchangeDataImporter)
+    # timestamps are pushed by _run_backtesting instead of the time updater task
+    await backtesting_instance.time_channel.register_producer(backtesting_instance.time_updater)
+    return backtesting_instance
+
+
+async def _create_exchange_manager(config, backtesting_instance, use_candle_fill_engine, use_preloaded_data):
+    exchange_manager = await exchanges.create_exchange_builder_instance(config, EXCHANGE_NAME) \
+        .is_simulated() \
+        .is_rest_only() \
+        .is_backtesting(backtesting_instance) \
+        .use_direct_dispatch_channels() \
+        .use_preloaded_backtesting_data(use_preloaded_data) \
+        .use_candle_fill_engine(use_candle_fill_engine) \
+        .disable_trading_mode() \
+        .build()
+    backtesting_instance.exchange_ids.append(exchange_manager.id)
+    return exchange_manager
+
+
+class _TradingChannelsManager(backtesting_channels_manager.ChannelsManager):
+    """
+    Backtesting channels manager ignoring evaluators channels: OctoBot-Evaluators is not required
+    """
+
+    def _get_evaluator_producers(self):
+        return []
+
+
+def _time_consumers(exchange_manager, channels_time):
+    """
+    Accumulate the time spent in each channel consumers into channels_time, nested sends included
+    """
+    channels_to_time = [channels.get_chan(channels_name.OctoBotBacktestingChannelsName.TIME_CHANNEL.value)] + [
+        exchange_channel.get_chan(channel_name.value, exchange_manager.id)
+        for channel_name in channels_name.OctoBotTradingChannelsName
+    ]
+    for channel in channels_to_time:
+        for consumer in channel.get_consumers():
+            consumer.callback = _get_timed_callback(consumer.callback, channel.get_name(), channels_time)
+
+
+def _get_timed_callback(callback, channel_name, channels_time):
+    async def timed_callback(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return await callback(*args, **kwargs)
+        finally:
+            channels_time[channel_name] += time.perf_counter() - start_time
+    return timed_callback
+
+
+async def _run_backtesting(backtesting_instance, exchange_manager, channels_manager, skip_idle_timestamps):
+    """
+    Push every backtesting timestamp like the backtesting time updater, skipping timestamps without candle close on
+    the trading mode time frame nor order fill when skip_idle_timestamps is True
+    :return: the handled timestamps count
+    """
+    time_manager = backtesting_instance.time_manager
+    timestamp = time_manager.current_timestamp
+    handled_timestamps_count = 0
+    while True:
+        await backtesting_instance.time_updater.push(timestamp)
+        await channels_manager.handle_new_iteration()
+        handled_timestamps_count += 1
+        if time_manager.has_finished():
+            return handled_timestamps_count
+        next_timestamp = timestamp + time_manager.time_interval
+        if skip_idle_timestamps:
+            interesting_timestamp = trading_api.get_next_interesting_backtesting_timestamp(
+                exchange_manager, timestamp, [TRADING_MODE_TIME_FRAME])
+            if interesting_timestamp is not None:
+                next_timestamp = max(next_timestamp, interesting_timestamp)
+        timestamp = min(next_timestamp, time_manager.finishing_timestamp)
+
+
+async def _run_scenario(pairs_count, candles_count, use_candle_fill_engine, skip_idle_timestamps,
+                        use_preloaded_data):
+    pairs = _get_pairs(pairs_count)
+    config = _get_config(pairs)
+    with tempfile.TemporaryDirectory() as directory:
+        data_file, total_candles_count = await _create_data_file(directory, pairs, candles_count)
+        backtesting_instance = await _create_backtesting(config, data_file)
+        exchange_manager = await _create_exchange_manager(config, backtesting_instance, use_candle_fill_engine,
+                                                          use_preloaded_data)
+        trading_mode = _MinimalTradingMode(exchange_manager, TRADING_MODE_TIME_FRAME.value)
+        await trading_mode.start()
+
+        start_time = time.perf_counter()
+        # starts the backtesting updaters which are preloading their data when enabled
+        channels_manager = _TradingChannelsManager(exchange_ids=backtesting_instance.exchange_ids, matrix_id=None)
+        await channels_manager.initialize()
+        initialization_duration = time.perf_counter() - start_time
+        channels_time = collections.Counter()
+        _time_consumers(exchange_manager, channels_time)
+        handled_timestamps_count = await _run_backtesting(backtesting_instance, exchange_manager, channels_manager,
+                                                          skip_idle_timestamps)
+        duration = time.perf_counter() - start_time
+
+        filled_orders_count = len(exchange_manager.exchange_personal_data.trades_manager.trades)
+        await exchange_manager.stop()
+        await backtesting_instance.stop()
+        for importer in backtesting_instance.importers:
+            await importer.stop()
+    if trading_mode.created_orders_count == 0:
+        # orders creation errors are logged by channels consumers: don't report a benchmark measuring nothing
+        raise RuntimeError(f"No order created in {pairs_count} pairs scenario, check logs for errors")
+    return {
+        "pairs": pairs_count,
+        "time_frames": [time_frame.value for time_frame in TIME_FRAMES],
+        "candle_fill_engine": use_candle_fill_engine,
+        "skip_idle_timestamps": skip_idle_timestamps,
+        "preloaded_data": use_preloaded_data,
+        "duration": duration,
+        "initialization_duration": initialization_duration,
+        "handled_timestamps": handled_timestamps_count,
+        "candles": total_candles_count,
+        "candles_per_second": total_candles_count / duration,
+        "created_orders": trading_mode.created_orders_count,
+        "filled_orders": filled_orders_count,
+        "orders_per_second": (trading_mode.created_orders_count + filled_orders_count) / duration,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "channels_time": {
+            **channels_time,
+            "trading_mode": trading_mode.duration,
+        },
+    }
+
+
+def _run_scenario_process(pairs_count, candles_count, use_candle_fill_engine, skip_idle_timestamps,
+                          use_preloaded_data):
+    return asyncio.run(_run_scenario(pairs_count, candles_count, use_candle_fill_engine, skip_idle_timestamps,
+                                     use_preloaded_data))
+
+
+def _get_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(candles_count, output_path, use_candle_fill_engine, skip_idle_timestamps, use_preloaded_data):
+    results = {
+        "commit": _get_commit(),
+        "python": platform.python_version(),
+        "candles_count": candles_count,
+        "scenarios": []
+    }
+    for pairs_count in PAIRS_COUNTS:
+        # use a new process for each scenario to get its own peak RSS
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1,
+                                                    mp_context=multiprocessing.get_context("spawn")) as executor:
+            scenario = executor.submit(_run_scenario_process, pairs_count, candles_count, use_candle_fill_engine,
+                                       skip_idle_timestamps, use_preloaded_data).result()
+        print(f"{pairs_count} pairs: {scenario['candles_per_second']:.0f} candles/s, "
+              f"{scenario['orders_per_second']:.0f} orders/s, {scenario['peak_rss_mb']:.0f} MB peak RSS")
+        results["scenarios"].append(scenario)
+    with open(output_path, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+    print(f"Results saved into {output_path}")
+
+
+if __name__ == "__main__":
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    main(int(arguments[0]) if arguments else 1000,
+         arguments[1] if len(arguments) > 1 else "backtesting_throughput_benchmark.json",
+         "--candle-fill-engine" in sys.argv,
+         "--skip-idle-timestamps" in sys.argv,
+         "--no-preloaded-data" not in sys.argv)
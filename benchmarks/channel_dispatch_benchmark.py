@@ -0,0 +1,87 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares queue based and direct dispatch synchronized channels.
+Usage: python benchmarks/channel_dispatch_benchmark.py [sends_count]
+"""
+import asyncio
+import sys
+import time
+import uuid
+
+import async_channel.enums as channel_enums
+
+import octobot_trading.exchange_data as exchange_data
+
+CONSUMERS_PRIORITY_LEVELS = [
+    channel_enums.ChannelConsumerPriorityLevels.HIGH.value,
+    channel_enums.ChannelConsumerPriorityLevels.MEDIUM.value,
+    channel_enums.ChannelConsumerPriorityLevels.OPTIONAL.value,
+]
+
+
+class _BenchmarkExchangeManager:
+    def __init__(self, use_direct_dispatch_channels):
+        self.id = str(uuid.uuid4())
+        self.exchange_name = "benchmark"
+        self.exchange = None
+        self.use_direct_dispatch_channels = use_direct_dispatch_channels
+
+
+async def _create_channel(use_direct_dispatch):
+    channel = exchange_data.TickerChannel(_BenchmarkExchangeManager(use_direct_dispatch))
+    channel.is_synchronized = True
+
+    async def callback(**_):
+        pass
+
+    for priority_level in CONSUMERS_PRIORITY_LEVELS:
+        await channel.new_consumer(callback, priority_level=priority_level)
+    return channel
+
+
+async def _perform_consumers_queues(channel):
+    # reproduces a synchronized iteration: consumers queues are emptied by priority level
+    for priority_level in CONSUMERS_PRIORITY_LEVELS:
+        for consumer in channel.consumers:
+            if consumer.priority_level == priority_level:
+                while not consumer.queue.empty():
+                    await consumer.perform(consumer.queue.get_nowait())
+
+
+async def _run(use_direct_dispatch, sends_count):
+    channel = await _create_channel(use_direct_dispatch)
+    producer = exchange_data.TickerProducer(channel)
+    ticker = {"close": 1}
+    start_time = time.perf_counter()
+    for _ in range(sends_count):
+        await producer.send("BTC", "BTC/USDT", ticker)
+        if not use_direct_dispatch:
+            await _perform_consumers_queues(channel)
+    return time.perf_counter() - start_time
+
+
+async def main(sends_count):
+    queue_duration = await _run(False, sends_count)
+    direct_duration = await _run(True, sends_count)
+    print(f"{sends_count} sends to {len(CONSUMERS_PRIORITY_LEVELS)} consumers")
+    print(f"queues:          {queue_duration:.3f}s ({sends_count / queue_duration:.0f} sends/s)")
+    print(f"direct dispatch: {direct_duration:.3f}s ({sends_count / direct_duration:.0f} sends/s)")
+    print(f"speedup:         x{queue_duration / direct_duration:.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
@@ -43,6 +43,7 @@ from octobot_trading.api.symbol_data import (
 )
 from octobot_trading.api.trades import (
     get_trade_history,
+    iter_trade_history,
     get_total_paid_trading_fees,
     get_trade_exchange_name,
     parse_trade_type,
@@ -78,6 +79,7 @@ from octobot_trading.api.exchange import (
     get_exchange_name,
     has_only_ohlcv,
     get_is_backtesting,
+    get_next_interesting_backtesting_timestamp,
     get_has_websocket,
     supports_websockets,
     is_compatible_account,
@@ -162,6 +164,7 @@ __all__ = [
     "force_set_mark_price",
     "is_mark_price_initialized",
     "get_trade_history",
+    "iter_trade_history",
     "get_total_paid_trading_fees",
     "get_trade_exchange_name",
     "parse_trade_type",
@@ -193,6 +196,7 @@ __all__ = [
     "get_exchange_name",
     "has_only_ohlcv",
     "get_is_backtesting",
+    "get_next_interesting_backtesting_timestamp",
     "get_has_websocket",
     "supports_websockets",
     "is_compatible_account",
@@ -19,6 +19,7 @@ import trading_backend
 
 import octobot_trading.constants
 import octobot_trading.enums
+import octobot_trading.exchange_channel as exchange_channel
 import octobot_trading.exchanges as exchanges
 import octobot_trading.exchange_data as exchange_data
 
@@ -166,6 +167,23 @@ def get_is_backtesting(exchange_manager) -> bool:
     return exchange_manager.is_backtesting
 
 
+def get_next_interesting_backtesting_timestamp(exchange_manager, timestamp, evaluated_time_frames=None) -> float:
+    """
+    :param evaluated_time_frames: the time frames evaluated by strategies, the configured time frames when None
+    :return: the next backtesting timestamp at which a candle closes on an evaluated time frame or an order can be
+    filled, None when unknown: every timestamp should then be handled
+    """
+    next_timestamps = [
+        producer.get_next_interesting_timestamp(timestamp, evaluated_time_frames)
+        for producer in exchange_channel.get_chan(octobot_trading.constants.OHLCV_CHANNEL,
+                                                  exchange_manager.id).producers
+        if isinstance(producer, exchange_data.OHLCVUpdaterSimulator)
+    ]
+    if not next_timestamps or None in next_timestamps:
+        return None
+    return min(next_timestamps)
+
+
 def get_has_websocket(exchange_manager) -> bool:
     return exchange_manager.has_websocket
 
@@ -183,7 +201,7 @@ def get_watched_timeframes(exchange_manager) -> list:
 
 
 def get_base_currency(exchange_manager, pair) -> str:
-    return exchange_manager.exchange.get_pair_cryptocurrency(pair)
+    return exchange_manager.get_pair_cryptocurrency(pair)
 
 
 def get_fees(exchange_manager, symbol) -> dict:
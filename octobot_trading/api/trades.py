@@ -13,31 +13,47 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import itertools
+
 import octobot_trading.enums
 import octobot_trading.personal_data as personal_data
 
 
-def get_trade_history(exchange_manager, symbol=None, since=None, as_dict=False, include_cancelled=False) -> list:
-    return [trade.to_dict() if as_dict else trade
-            for trade in exchange_manager.exchange_personal_data.trades_manager.trades.values()
-            if _trade_filter(trade, symbol, since, include_cancelled)]
-
-
-def _trade_filter(trade, symbol=None, timestamp=None, include_cancelled=False) -> bool:
-    if trade.status is octobot_trading.enums.OrderStatus.CANCELED and not include_cancelled:
-        return False
-    if symbol is None and timestamp is None:
-        return True
-    elif symbol is None and timestamp is not None:
-        return _is_trade_after(trade, timestamp)
-    elif symbol is not None and timestamp is None:
-        return trade.symbol == symbol
-    else:
-        return trade.symbol == symbol and _is_trade_after(trade, timestamp)
+def get_trade_history(exchange_manager, symbol=None, since=None, as_dict=False, include_cancelled=False,
+                      include_compacted=False, limit=None, offset=0) -> list:
+    """
+    :param symbol: the trades symbol, every symbol when None
+    :param since: the minimum trades time (excluded), ignored when None
+    :param as_dict: when True, trades are returned as dict
+    :param include_cancelled: when False, cancelled trades are not returned
+    :param include_compacted: when True, also return trades compacted after MAX_TRADES_COUNT, as dict
+    :param limit: the maximum count of trades to return, every trade when None
+    :param offset: the count of selected trades to skip
+    :return: the selected trades, oldest first
+    """
+    if include_compacted:
+        # compacted trades are only available as dict
+        trades = exchange_manager.exchange_personal_data.trades_manager.get_trades_history(
+            symbol=symbol, since=since, include_cancelled=include_cancelled
+        )
+        return trades[offset:] if limit is None else trades[offset:offset + limit]
+    return list(iter_trade_history(exchange_manager, symbol=symbol, since=since, as_dict=as_dict,
+                                   include_cancelled=include_cancelled, limit=limit, offset=offset))
 
 
-def _is_trade_after(trade, timestamp) -> bool:
-    return trade.executed_time > timestamp or trade.canceled_time > timestamp
+def iter_trade_history(exchange_manager, symbol=None, since=None, as_dict=False, include_cancelled=False,
+                       limit=None, offset=0):
+    """
+    Iterate over trades without creating the whole trades list, see get_trade_history
+    """
+    trades = itertools.islice(
+        exchange_manager.exchange_personal_data.trades_manager.iter_trades(
+            symbol=symbol, since=since, include_cancelled=include_cancelled
+        ),
+        offset, None if limit is None else offset + limit
+    )
+    for trade in trades:
+        yield trade.to_dict() if as_dict else trade
 
 
 def get_total_paid_trading_fees(exchange_manager) -> dict:
@@ -32,6 +32,7 @@ CURRENCY_DEFAULT_MAX_PRICE_DIGITS = 8
 
 # Order creation
 ORDER_DATA_FETCHING_TIMEOUT = 60
+MAX_CONCURRENT_ORDER_REQUESTS = 5
 
 # Tentacles
 TRADING_MODE_REQUIRED_STRATEGIES = "required_strategies"
@@ -41,8 +42,14 @@ TENTACLES_TRADING_MODE_PATH = "Mode"
 # Exchange
 DEFAULT_EXCHANGE_TIME_LAG = 10
 DEFAULT_BACKTESTING_TIME_LAG = 0
+MAX_PRELOADED_BACKTESTING_DATA_SIZE = 1024 * 1024 * 1024  # 1GB
 INFINITE_MAX_HANDLED_PAIRS_WITH_TIMEFRAME = -1
 
+# Websocket
+CONFIG_EXCHANGE_WEBSOCKET_MICRO_BATCHING = "websocket-micro-batching"
+CONFIG_MICRO_BATCHING_WINDOW = "window"  # in milliseconds
+CONFIG_MICRO_BATCHING_MAX_SIZE = "max-size"
+
 # Decimal default values (decimals are immutable, can be stored as constant)
 ZERO = decimal.Decimal(0)
 ONE = decimal.Decimal(1)
@@ -80,6 +87,19 @@ ORDERS_CHANNEL = "Orders"
 BALANCE_CHANNEL = "Balance"
 BALANCE_PROFITABILITY_CHANNEL = "BalanceProfitability"
 POSITIONS_CHANNEL = "Positions"
+# minimum delay in seconds between two mark price triggered profitability updates, 0 to update once per loop cycle
+BALANCE_PROFITABILITY_UPDATE_DELAY = 0.5
+
+# Portfolio valuation
+# maximum count of trading pairs used to convert a currency into the reference market
+MAX_CURRENCY_CONVERSION_HOPS = 3
+# intermediate currencies to convert through first, by order of preference
+CURRENCY_CONVERSION_BRIDGE_CURRENCIES = ["BTC", "USDT", "ETH"]
+
+# Trades history
+# compacted trades kept in memory before being moved to the history database
+COMPACT_TRADES_HISTORY_MEMORY_SIZE = 500000
+COMPACT_TRADES_HISTORY_INITIAL_CAPACITY = 1024
 
 # 946742400 is 01/01/2000, if trade time is lower, there is an issue.
 MINIMUM_VAL_TRADE_TIME = 946688400
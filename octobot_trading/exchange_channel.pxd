@@ -25,6 +25,9 @@ cdef class ExchangeChannel(channels.Channel):
     cdef int filter_send_counter
     cdef bint should_send_filter
 
+    cdef public bint use_direct_dispatch
+
+    cpdef bint is_direct_dispatch(self)
     cpdef object get_filtered_consumers(self, str cryptocurrency=*, str symbol=*)
 
 cdef class TimeFrameExchangeChannel(ExchangeChannel):
@@ -58,6 +58,30 @@ class ExchangeChannelProducer(producers.Producer):
     def trigger_single_update(self):
         asyncio.create_task(self.fetch_and_push())
 
+    async def send_to_consumers(self, consumers, data):
+        """
+        Send data to the given consumers
+        When the channel is using direct dispatch, consumers are called inline instead of being queued:
+        - consumers are called in priority level order (highest priority first), consumers sharing a priority
+        level are called in their registration order
+        - this method returns only when every consumer has processed data
+        - sends triggered by a consumer are processed (depth-first) before the next consumer of this send is called
+        - a consumer error is logged and doesn't prevent the next consumers from being called
+        :param consumers: the consumers to send data to
+        :param data: the data to send
+        """
+        if self.channel.is_direct_dispatch():
+            for consumer in sorted(consumers, key=_get_priority_level):
+                try:
+                    await consumer.perform(data)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.logger.exception(e, True, f"Error when calling {consumer} consumer: {e}")
+        else:
+            for consumer in consumers:
+                await consumer.queue.put(data)
+
 
 class ExchangeChannel(channels.Channel):
     PRODUCER_CLASS = ExchangeChannelProducer
@@ -75,6 +99,15 @@ class ExchangeChannel(channels.Channel):
         self.filter_send_counter = 0
         self.should_send_filter = False
 
+        # when True and the channel is synchronized, producers call consumers without using their queue
+        self.use_direct_dispatch = exchange_manager.use_direct_dispatch_channels
+
+    def is_direct_dispatch(self):
+        """
+        :return: True when consumers are called inline by producers (only available on synchronized channels)
+        """
+        return self.use_direct_dispatch and self.is_synchronized
+
     async def new_consumer(self,
                            callback: object = None,
                            consumer_instance: object = None,
@@ -145,6 +178,10 @@ class TimeFrameExchangeChannel(ExchangeChannel):
                                  symbol=symbol)
 
 
+def _get_priority_level(consumer):
+    return consumer.priority_level
+
+
 def set_chan(chan, name) -> None:
     chan_name = chan.get_name() if name else name
 
@@ -35,6 +35,7 @@ from octobot_trading.exchange_data.kline cimport (
 from octobot_trading.exchange_data cimport ohlcv
 from octobot_trading.exchange_data.ohlcv cimport (
     CandlesManager,
+    PreloadedCandles,
     get_symbol_close_candles,
     get_symbol_open_candles,
     get_symbol_high_candles,
@@ -76,6 +77,7 @@ from octobot_trading.exchange_data.recent_trades cimport (
     LiquidationsProducer,
     LiquidationsChannel,
     RecentTradesManager,
+    PreloadedRecentTrades,
     RecentTradeUpdater,
 )
 
@@ -111,6 +113,7 @@ __all__ = [
     "KlineManager",
     "KlineUpdater",
     "CandlesManager",
+    "PreloadedCandles",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -140,6 +143,7 @@ __all__ = [
     "LiquidationsProducer",
     "LiquidationsChannel",
     "RecentTradesManager",
+    "PreloadedRecentTrades",
     "RecentTradeUpdater",
     "TickerManager",
     "TickerUpdater",
@@ -33,6 +33,7 @@ from octobot_trading.exchange_data.kline import (
 from octobot_trading.exchange_data import ohlcv
 from octobot_trading.exchange_data.ohlcv import (
     CandlesManager,
+    PreloadedCandles,
     get_symbol_close_candles,
     get_symbol_open_candles,
     get_symbol_high_candles,
@@ -72,6 +73,7 @@ from octobot_trading.exchange_data.recent_trades import (
     LiquidationsProducer,
     LiquidationsChannel,
     RecentTradesManager,
+    PreloadedRecentTrades,
     RecentTradeUpdater,
     RecentTradeUpdaterSimulator,
 )
@@ -140,6 +142,7 @@ __all__ = [
     "KlineManager",
     "KlineUpdater",
     "CandlesManager",
+    "PreloadedCandles",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -170,6 +173,7 @@ __all__ = [
     "LiquidationsProducer",
     "LiquidationsChannel",
     "RecentTradesManager",
+    "PreloadedRecentTrades",
     "RecentTradeUpdater",
     "RecentTradeUpdaterSimulator",
     "TickerManager",
@@ -34,7 +34,10 @@ class ExchangeSymbolData:
         self.symbol = symbol
         self.exchange_manager = exchange_manager
 
-        self.price_events_manager = price_events_manager.PriceEventsManager()
+        market_fixed_point = self.exchange_manager.get_market_fixed_point(symbol)
+        self.price_events_manager = price_events_manager.PriceEventsManager(
+            None if market_fixed_point is None else market_fixed_point.price
+        )
         self.order_book_manager = order_book_manager.OrderBookManager()
         self.prices_manager = prices_manager.PricesManager(self.exchange_manager)
         self.recent_trades_manager = recent_trades_manager.RecentTradesManager()
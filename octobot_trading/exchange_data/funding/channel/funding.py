@@ -31,8 +31,7 @@ class FundingProducer(exchanges_channel.ExchangeChannelProducer):
                     .handle_funding_update(funding_rate=funding_rate,
                                            next_funding_time=next_funding_time,
                                            timestamp=timestamp)
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                get_pair_cryptocurrency(symbol),
+                await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
                                 funding_rate=funding_rate,
                                 next_funding_time=next_funding_time,
@@ -43,16 +42,15 @@ class FundingProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, funding_rate, next_funding_time, timestamp):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "funding_rate": funding_rate,
-                "next_funding_time": next_funding_time,
-                "timestamp": timestamp
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "funding_rate": funding_rate,
+            "next_funding_time": next_funding_time,
+            "timestamp": timestamp
+        })
 
 
 class FundingChannel(exchanges_channel.ExchangeChannel):
@@ -29,8 +29,7 @@ class KlineProducer(exchanges_channel.ExchangeChannelProducer):
             if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
                     self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame.value):
                 await self.channel.exchange_manager.get_symbol_data(symbol).handle_kline_update(time_frame, kline)
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                get_pair_cryptocurrency(symbol),
+                await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
                                 time_frame=time_frame.value,
                                 kline=kline)
@@ -42,15 +41,14 @@ class KlineProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, time_frame, kline):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "time_frame": time_frame,
-                "kline": kline
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "time_frame": time_frame,
+            "kline": kline
+        })
 
 
 class KlineChannel(exchanges_channel.TimeFrameExchangeChannel):
@@ -16,11 +16,15 @@
 
 from octobot_trading.exchange_data.ohlcv cimport candles_manager
 from octobot_trading.exchange_data.ohlcv cimport candles_adapter
+from octobot_trading.exchange_data.ohlcv cimport preloaded_candles
 from octobot_trading.exchange_data.ohlcv cimport channel
 
 from octobot_trading.exchange_data.ohlcv.candles_manager cimport (
     CandlesManager,
 )
+from octobot_trading.exchange_data.ohlcv.preloaded_candles cimport (
+    PreloadedCandles,
+)
 from octobot_trading.exchange_data.ohlcv.candles_adapter cimport (
     get_symbol_close_candles,
     get_symbol_open_candles,
@@ -40,6 +44,7 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater cimport (
 
 __all__ = [
     "CandlesManager",
+    "PreloadedCandles",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
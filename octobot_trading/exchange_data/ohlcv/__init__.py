@@ -16,11 +16,15 @@
 
 from octobot_trading.exchange_data.ohlcv import candles_manager
 from octobot_trading.exchange_data.ohlcv import candles_adapter
+from octobot_trading.exchange_data.ohlcv import preloaded_candles
 from octobot_trading.exchange_data.ohlcv import channel
 
 from octobot_trading.exchange_data.ohlcv.candles_manager import (
     CandlesManager,
 )
+from octobot_trading.exchange_data.ohlcv.preloaded_candles import (
+    PreloadedCandles,
+)
 from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_symbol_close_candles,
     get_symbol_open_candles,
@@ -41,6 +45,7 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater import (
 
 __all__ = [
     "CandlesManager",
+    "PreloadedCandles",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
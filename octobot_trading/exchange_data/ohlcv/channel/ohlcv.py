@@ -32,8 +32,7 @@ class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
                     .handle_candles_update(time_frame, candle, replace_all=replace_all, partial=partial)
                 if candle and (partial or replace_all):
                     candle = candle[-1]
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                get_pair_cryptocurrency(symbol),
+                await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                 time_frame=time_frame.value,
                                 symbol=symbol,
                                 candle=candle)
@@ -43,15 +42,14 @@ class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, time_frame, candle):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "time_frame": time_frame,
-                "candle": candle
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "time_frame": time_frame,
+            "candle": candle
+        })
 
 
 class OHLCVChannel(exchanges_channel.TimeFrameExchangeChannel):
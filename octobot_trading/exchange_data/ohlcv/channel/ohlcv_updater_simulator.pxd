@@ -37,3 +37,8 @@ cdef class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
     cdef bint require_last_init_candles_pairs_push
     cdef list traded_pairs
     cdef list traded_time_frame
+
+    cdef public dict preloaded_candles
+    cdef public long long preloaded_candles_memory_size
+
+    cpdef object get_next_interesting_timestamp(self, double timestamp, list evaluated_time_frames=*)
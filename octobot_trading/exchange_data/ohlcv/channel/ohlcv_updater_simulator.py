@@ -14,12 +14,15 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import octobot_backtesting.api as api
+import octobot_backtesting.data as backtesting_data
 import octobot_backtesting.errors as errors
 
 import octobot_commons.constants as constants
 import octobot_commons.enums as enums
 
+import octobot_trading.constants as trading_constants
 import octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater as ohlcv_updater
+import octobot_trading.exchange_data.ohlcv.preloaded_candles as preloaded_candles
 import octobot_trading.util as util
 
 
@@ -42,60 +45,63 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
         self.traded_pairs = self._get_traded_pairs()
         self.traded_time_frame = self._get_time_frames()
 
+        # PreloadedCandles by time frame by pair, used instead of database queries when available
+        self.preloaded_candles = {}
+        self.preloaded_candles_memory_size = 0
+
     async def start(self):
         if not self.is_initialized:
             await self._initialize(False)
+            if self.channel.exchange_manager.use_preloaded_backtesting_data:
+                await self._preload_candles()
         await self.resume()
 
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
+            # (time_frame, pair, candles) to push once every candle is selected
+            candles_to_push = []
             for pair in self.traded_pairs:
                 for time_frame in self.traded_time_frame:
                     # Use last_timestamp_pushed + 1 for inferior timestamp to avoid select of an already selected candle
                     # (selection is <= and >=)
                     # Use timestamp + self.future_candle_sec_length to include the future candle on the future candles
                     # time frame that will be sorted in exchange simulator for later uses.
-                    ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
-                        exchange_name=self.exchange_name,
-                        symbol=pair,
-                        time_frame=time_frame,
-                        inferior_timestamp=self.last_timestamp_pushed + 1,
-                        superior_timestamp=timestamp + (self.future_candle_sec_length
-                                                        if self.future_candle_time_frame is time_frame else 0)
+                    candles: list = await self._get_candles_from_timestamps(
+                        pair,
+                        time_frame,
+                        self.last_timestamp_pushed + 1,
+                        timestamp + (self.future_candle_sec_length
+                                     if self.future_candle_time_frame is time_frame else 0)
                     )
-                    if ohlcv_data:
+                    if candles:
                         current_candle_index = 0
                         if self.future_candle_time_frame is time_frame:
-                            if ohlcv_data[0][-1][enums.PriceIndexes.IND_PRICE_TIME.value] == timestamp:
+                            if candles[0][enums.PriceIndexes.IND_PRICE_TIME.value] == timestamp:
                                 # register future candle
                                 self.channel.exchange.get_current_future_candles()[pair][time_frame.value] = \
-                                    ohlcv_data[0][-1]
+                                    candles[0]
                                 # do not push future candle
                                 current_candle_index = 1
                             else:
                                 # if no future candle available
                                 # (end of backtesting of missing data: reset future candle)
                                 self.channel.exchange.get_current_future_candles()[pair][time_frame.value] = None
-                        if current_candle_index == 0 or len(ohlcv_data) > 1:
+                        if current_candle_index == 0 or len(candles) > 1:
                             # push current candle(s)
-                            await self.push(time_frame,
-                                            pair,
-                                            [ohlcv[-1] for ohlcv in ohlcv_data[current_candle_index:]],
-                                            partial=True)
+                            candles_to_push.append((time_frame, pair, candles[current_candle_index:]))
                     elif self.require_last_init_candles_pairs_push:
                         # triggered on first iteration to initialize large candles that might be pushed much later
                         # otherwise but are required to complete TA evaluation
                         if time_frame.value in self.last_candles_by_pair_by_time_frame[pair]:
-                            await self.push(time_frame,
-                                            pair,
-                                            [self.last_candles_by_pair_by_time_frame[pair][time_frame.value][-1]],
-                                            partial=True)
+                            last_candle = self.last_candles_by_pair_by_time_frame[pair][time_frame.value][-1]
+                            candles_to_push.append((time_frame, pair, [last_candle]))
+            await self._push_candles(candles_to_push, timestamp)
         except errors.DataBaseNotExists as e:
             self.logger.warning(f"Not enough data : {e}")
             await self.pause()
             await self.stop()
         except IndexError as e:
-            self.logger.warning(f"Failed to access ohlcv_data : {e}")
+            self.logger.warning(f"Failed to access candles : {e}")
         except Exception as e:
             self.logger.exception(e, True, f"Error when updating from timestamp: {e}")
         finally:
@@ -111,6 +117,140 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
     async def resume(self):
         await util.resume_time_consumer(self, self.handle_timestamp)
 
+    def get_next_interesting_timestamp(self, timestamp, evaluated_time_frames=None):
+        """
+        Next timestamp oracle used to skip idle backtesting timestamps. A timestamp is interesting when a candle
+        closes on an evaluated time frame or when a future candle reaches a pending price event (order fill)
+        threshold. Skipped candles are pushed on the next handled timestamp, before its own candles.
+        :param timestamp: the current timestamp
+        :param evaluated_time_frames: the time frames which candles closes are interesting, the configured time
+        frames when None: shorter real-time time frames candles closes are skipped
+        :return: the next interesting timestamp (the last candle time when nothing is interesting anymore), None when
+        it can't be computed because candles are not preloaded or when there is no more candle
+        """
+        if evaluated_time_frames is None:
+            evaluated_time_frames = self.channel.exchange_manager.exchange_config.available_required_time_frames
+        next_timestamps = []
+        last_timestamps = []
+        for pair in self.traded_pairs:
+            for time_frame in self.traded_time_frame:
+                try:
+                    candles = self.preloaded_candles[pair][time_frame.value]
+                except KeyError:
+                    # candles are read from database: any timestamp can be interesting
+                    return None
+                if time_frame in evaluated_time_frames:
+                    # the current candle closes when the next one starts
+                    next_timestamp = candles.get_next_candle_time(timestamp)
+                    if next_timestamp is not None:
+                        next_timestamps.append(next_timestamp)
+                if time_frame is self.future_candle_time_frame:
+                    upper_threshold, lower_threshold = self._get_pending_price_thresholds(pair)
+                    next_timestamp = candles.get_next_candle_time_reaching(timestamp, upper_threshold, lower_threshold)
+                    if next_timestamp is not None:
+                        next_timestamps.append(next_timestamp)
+                    if len(candles):
+                        last_timestamps.append(float(candles.times[-1]))
+        if next_timestamps:
+            return min(next_timestamps)
+        # nothing to wait for: go to the last candle
+        last_timestamp = max(last_timestamps, default=None)
+        return last_timestamp if last_timestamp is not None and last_timestamp > timestamp else None
+
+    async def _push_candles(self, candles_to_push, timestamp):
+        """
+        Push candles selected since the last pushed timestamp
+        :param candles_to_push: (time_frame, pair, candles) tuples, candles being most recent first
+        :param timestamp: the handled timestamp
+        """
+        if self.last_timestamp_pushed:
+            # candles of skipped timestamps are pushed first, oldest first, before any candle of the handled
+            # timestamp: consumers receive the same candles and prices as when every timestamp is handled
+            skipped_candles_max_time = timestamp - self.future_candle_sec_length
+            timestamp_candles_to_push = []
+            for time_frame, pair, candles in candles_to_push:
+                skipped_candles_index = len(candles)
+                while skipped_candles_index > 0 and \
+                        candles[skipped_candles_index - 1][enums.PriceIndexes.IND_PRICE_TIME.value] <= \
+                        skipped_candles_max_time:
+                    skipped_candles_index -= 1
+                if skipped_candles_index < len(candles):
+                    await self.push(time_frame, pair, candles[skipped_candles_index:][::-1], partial=True)
+                if skipped_candles_index > 0:
+                    timestamp_candles_to_push.append((time_frame, pair, candles[:skipped_candles_index]))
+            candles_to_push = timestamp_candles_to_push
+        for time_frame, pair, candles in candles_to_push:
+            await self.push(time_frame, pair, candles, partial=True)
+
+    def _get_pending_price_thresholds(self, pair):
+        upper_threshold, lower_threshold = self.channel.exchange_manager.get_symbol_data(pair)\
+            .price_events_manager.get_pending_price_thresholds()
+        candle_fill_engine = self.channel.exchange_manager.exchange_personal_data.candle_fill_engine
+        if candle_fill_engine is not None:
+            # orders filled by the candle fill engine are not registered in price events
+            engine_upper_threshold, engine_lower_threshold = candle_fill_engine.get_price_thresholds(pair)
+            if engine_upper_threshold is not None:
+                upper_threshold = engine_upper_threshold if upper_threshold is None \
+                    else min(upper_threshold, engine_upper_threshold)
+            if engine_lower_threshold is not None:
+                lower_threshold = engine_lower_threshold if lower_threshold is None \
+                    else max(lower_threshold, engine_lower_threshold)
+        return upper_threshold, lower_threshold
+
+    async def _get_candles_from_timestamps(self, pair, time_frame, inferior_timestamp, superior_timestamp):
+        """
+        :return: the candles between inferior_timestamp and superior_timestamp (included), most recent first
+        """
+        try:
+            return self.preloaded_candles[pair][time_frame.value]\
+                .get_candles_from_timestamps(inferior_timestamp, superior_timestamp)
+        except KeyError:
+            ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
+                exchange_name=self.exchange_name,
+                symbol=pair,
+                time_frame=time_frame,
+                inferior_timestamp=inferior_timestamp,
+                superior_timestamp=superior_timestamp
+            )
+            return [ohlcv[-1] for ohlcv in ohlcv_data]
+
+    async def _preload_candles(self):
+        """
+        Load every remaining candle of each traded pair and time frame into memory to avoid database queries
+        on each timestamp. Stops preloading when MAX_PRELOADED_BACKTESTING_DATA_SIZE is reached: remaining pairs
+        and time frames will use database queries.
+        Candles available in the exchange manager shared backtesting candles are read from there without copy.
+        """
+        candles_count = 0
+        shared_candles = self.channel.exchange_manager.shared_backtesting_candles
+        for pair in self.traded_pairs:
+            for time_frame in self.traded_time_frame:
+                candles = None if shared_candles is None \
+                    else shared_candles.get_preloaded_candles(self.exchange_name, pair, time_frame.value)
+                if candles is not None:
+                    self.preloaded_candles.setdefault(pair, {})[time_frame.value] = candles
+                    candles_count += len(candles)
+                    continue
+                if self.preloaded_candles_memory_size >= trading_constants.MAX_PRELOADED_BACKTESTING_DATA_SIZE:
+                    self.logger.warning(f"Preloaded candles size limit reached, {pair} {time_frame.value} candles "
+                                        f"will be read from database")
+                    continue
+                ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
+                    exchange_name=self.exchange_name,
+                    symbol=pair,
+                    time_frame=time_frame,
+                    limit=backtesting_data.DataBase.DEFAULT_SIZE,
+                    inferior_timestamp=self.last_timestamp_pushed + 1
+                )
+                candles = preloaded_candles.PreloadedCandles([ohlcv[-1] for ohlcv in ohlcv_data])
+                if pair not in self.preloaded_candles:
+                    self.preloaded_candles[pair] = {}
+                self.preloaded_candles[pair][time_frame.value] = candles
+                self.preloaded_candles_memory_size += candles.get_memory_size()
+                candles_count += len(candles)
+        self.logger.info(f"Preloaded {candles_count} candles using "
+                         f"{self.preloaded_candles_memory_size / 1024 / 1024:.2f} MB")
+
     def _get_traded_pairs(self):
         return api.get_available_symbols(self.exchange_data_importer)
 
@@ -0,0 +1,92 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_commons.enums as enums
+
+
+class PreloadedCandles:
+    """
+    Stores a whole (pair, time frame) candles history in contiguous arrays to be selected by timestamps
+    without database queries.
+    Selections are expected to be made with increasing inferior timestamps: a cursor on the first selectable
+    candle is kept to only search through the remaining candles.
+    """
+
+    def __init__(self, candles):
+        """
+        :param candles: the candles to preload (in any order) or a time sorted candles array to use without copy
+        """
+        if isinstance(candles, np.ndarray):
+            self.candles = candles
+        else:
+            self.candles = np.array(sorted(candles, key=_get_candle_time), dtype=np.float64) \
+                if candles else np.empty((0, len(enums.PriceIndexes)), dtype=np.float64)
+        self.times = np.ascontiguousarray(self.candles[:, enums.PriceIndexes.IND_PRICE_TIME.value])
+        self.cursor = 0
+
+    def get_candles_from_timestamps(self, inferior_timestamp, superior_timestamp):
+        """
+        Select candles like ExchangeDataImporter.get_ohlcv_from_timestamps: candles time is >= inferior_timestamp
+        and <= superior_timestamp, most recent candle first
+        :param inferior_timestamp: the minimum candle time
+        :param superior_timestamp: the maximum candle time
+        :return: the selected candles as lists
+        """
+        if self.cursor > 0 and self.times[self.cursor - 1] >= inferior_timestamp:
+            # going back in time: reset cursor
+            self.cursor = 0
+        self.cursor += int(np.searchsorted(self.times[self.cursor:], inferior_timestamp, side="left"))
+        end_index = self.cursor + int(np.searchsorted(self.times[self.cursor:], superior_timestamp, side="right"))
+        return self.candles[self.cursor:end_index][::-1].tolist()
+
+    def get_next_candle_time(self, timestamp):
+        """
+        :param timestamp: the reference timestamp
+        :return: the time of the first candle strictly after timestamp, None if there is no such candle
+        """
+        index = int(np.searchsorted(self.times, timestamp, side="right"))
+        return float(self.times[index]) if index < len(self.times) else None
+
+    def get_next_candle_time_reaching(self, timestamp, upper_price, lower_price):
+        """
+        :param timestamp: the reference timestamp
+        :param upper_price: the price to be reached by a candle high, ignored when None
+        :param lower_price: the price to be reached by a candle low, ignored when None
+        :return: the time of the first candle strictly after timestamp reaching upper_price or lower_price,
+        None if there is no such candle
+        """
+        index = int(np.searchsorted(self.times, timestamp, side="right"))
+        reached = np.zeros(len(self.times) - index, dtype=bool)
+        if upper_price is not None:
+            reached |= self.candles[index:, enums.PriceIndexes.IND_PRICE_HIGH.value] >= float(upper_price)
+        if lower_price is not None:
+            reached |= self.candles[index:, enums.PriceIndexes.IND_PRICE_LOW.value] <= float(lower_price)
+        reached_indexes = np.flatnonzero(reached)
+        return float(self.times[index + reached_indexes[0]]) if len(reached_indexes) else None
+
+    def get_memory_size(self):
+        """
+        :return: the preloaded arrays size in bytes
+        """
+        return self.candles.nbytes + self.times.nbytes
+
+    def __len__(self):
+        return len(self.times)
+
+
+def _get_candle_time(candle):
+    return candle[enums.PriceIndexes.IND_PRICE_TIME.value]
@@ -30,8 +30,7 @@ class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
                     self.channel.get_filtered_consumers(symbol=symbol):
                 if update_order_book:
                     self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(asks, bids)
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                get_pair_cryptocurrency(symbol),
+                await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
                                 asks=asks,
                                 bids=bids)
@@ -41,15 +40,14 @@ class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, asks, bids):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "asks": asks,
-                "bids": bids
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "asks": asks,
+            "bids": bids
+        })
 
 
 class OrderBookChannel(exchanges_channel.ExchangeChannel):
@@ -69,8 +67,7 @@ class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
                                                                                                       ask_price,
                                                                                                       bid_quantity,
                                                                                                       bid_price)
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                get_pair_cryptocurrency(symbol),
+                await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
                                 ask_quantity=ask_quantity, ask_price=ask_price,
                                 bid_quantity=bid_quantity, bid_price=bid_price)
@@ -80,17 +77,16 @@ class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, ask_quantity, ask_price, bid_quantity, bid_price):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "ask_quantity": ask_quantity,
-                "ask_price": ask_price,
-                "bid_quantity": bid_quantity,
-                "bid_price": bid_price
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "ask_quantity": ask_quantity,
+            "ask_price": ask_price,
+            "bid_quantity": bid_quantity,
+            "bid_price": bid_price
+        })
 
 
 class OrderBookTickerChannel(exchanges_channel.ExchangeChannel):
@@ -33,7 +33,7 @@ class MarkPriceProducer(exchanges_channel.ExchangeChannelProducer):
                                                                                                   mark_price_source):
                     # only send mark price if price got updated
                     # mark_price attribute access required to send calculation result
-                    await self.send(cryptocurrency=self.channel.exchange_manager.exchange.get_pair_cryptocurrency(
+                    await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(
                                         symbol),
                                     symbol=symbol,
                                     mark_price=self.channel.exchange_manager.get_symbol_data(
@@ -44,14 +44,13 @@ class MarkPriceProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, mark_price):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "mark_price": mark_price
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "mark_price": mark_price
+        })
 
 
 class MarkPriceChannel(exchanges_channel.ExchangeChannel):
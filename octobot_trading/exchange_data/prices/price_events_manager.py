@@ -24,6 +24,8 @@ class PriceEventsManager:
     """
     Manage price events for a specific price and timestamp
     Mainly used for updating Order status
+    When a price_converter is given, events prices are stored as fixed point integers to compare them with
+    handled prices without creating decimal.Decimal instances
     """
 
     """
@@ -31,9 +33,13 @@ class PriceEventsManager:
     """
     PRICE_EVENT_INDEX = 2
 
-    def __init__(self):
+    def __init__(self, price_converter=None):
+        """
+        :param price_converter: the symbol price FixedPointConverter, None to compare decimal.Decimal prices
+        """
         self.logger = logging.get_logger(self.__class__.__name__)
         self.events = []
+        self.price_converter = price_converter
 
     def reset(self):
         """
@@ -48,7 +54,9 @@ class PriceEventsManager:
         """
         for recent_trade in recent_trades:
             try:
-                for event_to_set in self._check_events(decimal.Decimal(str(recent_trade[ECOC.PRICE.value])),
+                upper_events_price, lower_events_price = \
+                    self._get_comparable_prices(recent_trade[ECOC.PRICE.value])
+                for event_to_set in self._check_events(upper_events_price, lower_events_price,
                                                        recent_trade[ECOC.TIMESTAMP.value]):
                     self._remove_and_set_event(event_to_set)
             except KeyError:
@@ -60,7 +68,8 @@ class PriceEventsManager:
         :param price: the price to check
         :param timestamp: the timestamp to check
         """
-        for event_to_set in self._check_events(decimal.Decimal(str(price)), timestamp):
+        upper_events_price, lower_events_price = self._get_comparable_prices(price)
+        for event_to_set in self._check_events(upper_events_price, lower_events_price, timestamp):
             self._remove_and_set_event(event_to_set)
 
     def add_event(self, price, timestamp, trigger_above):
@@ -71,6 +80,9 @@ class PriceEventsManager:
         :param trigger_above: True if waiting for an upper price
         :return: the price event
         """
+        if self.price_converter is not None:
+            # round toward the trigger direction not to trigger events before their price is reached
+            price = self.price_converter.to_fixed(price, round_up=trigger_above)
         price_event_tuple = _new_price_event(price, timestamp, trigger_above)
         self.events.append(price_event_tuple)
         return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
@@ -82,6 +94,37 @@ class PriceEventsManager:
         """
         return self._remove_event(event_to_remove)
 
+    def get_pending_price_thresholds(self):
+        """
+        :return: the (lowest upper trigger price, highest lower trigger price) tuple of the pending events,
+        None values when there is no pending event in this direction. Prices strictly between these thresholds
+        can't trigger any event.
+        """
+        upper_threshold = lower_threshold = None
+        for event_price, _, _, trigger_above in self.events:
+            if trigger_above:
+                if upper_threshold is None or event_price < upper_threshold:
+                    upper_threshold = event_price
+            elif lower_threshold is None or event_price > lower_threshold:
+                lower_threshold = event_price
+        if self.price_converter is not None:
+            upper_threshold = None if upper_threshold is None else self.price_converter.to_decimal(upper_threshold)
+            lower_threshold = None if lower_threshold is None else self.price_converter.to_decimal(lower_threshold)
+        return upper_threshold, lower_threshold
+
+    def _get_comparable_prices(self, price):
+        """
+        :param price: the float price to compare with events prices
+        :return: the (upper events price, lower events price) tuple of the price converted into events prices type.
+        Fixed point prices are rounded away from the events trigger direction: off-tick prices don't trigger
+        events which price is not reached.
+        """
+        if self.price_converter is None:
+            comparable_price = decimal.Decimal(str(price))
+            return comparable_price, comparable_price
+        return self.price_converter.from_float(price, round_up=False), \
+            self.price_converter.from_float(price, round_up=True)
+
     def _remove_and_set_event(self, event_to_set):
         """
         Set the event and remove it from event list
@@ -100,10 +143,11 @@ class PriceEventsManager:
             if event_to_remove in price_event_data:
                 return self.events.remove(price_event_data)
 
-    def _check_events(self, price, timestamp):
+    def _check_events(self, upper_events_price, lower_events_price, timestamp):
         """
         Check for each price, timestamp pair event if it should be triggered
-        :param price: the price used to check
+        :param upper_events_price: the price used to check events waiting for an upper price
+        :param lower_events_price: the price used to check events waiting for a lower price
         :param timestamp: the timestamp used to check
         :return: the event list that match
         """
@@ -112,8 +156,8 @@ class PriceEventsManager:
             for event_price, event_timestamp, event, trigger_above in self.events
             if event_timestamp <= timestamp and
             (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
+                (trigger_above and event_price <= upper_events_price) or
+                (not trigger_above and event_price >= lower_events_price)
             )
         ]
 
@@ -25,6 +25,7 @@ cdef class PricesManager(util.Initializable):
 
     cdef public double mark_price
     cdef public double mark_price_set_time
+    cdef public str mark_price_source
     cdef int price_validity
 
     cdef dict mark_price_from_sources
@@ -29,6 +29,7 @@ class PricesManager(util.Initializable):
         super().__init__()
         self.mark_price = 0
         self.mark_price_set_time = 0
+        self.mark_price_source = None
         self.mark_price_from_sources = {}
         self.exchange_manager = exchange_manager
         self.logger = logging.get_logger(f"{self.__class__.__name__}[{self.exchange_manager.exchange_name}]")
@@ -75,6 +76,7 @@ class PricesManager(util.Initializable):
             is_mark_price_updated = True
 
         if is_mark_price_updated:
+            self.mark_price_source = mark_price_source
             self.mark_price_from_sources[mark_price_source] = \
                 (mark_price, self.exchange_manager.exchange.get_exchange_current_time())
         return is_mark_price_updated
@@ -147,6 +149,7 @@ class PricesManager(util.Initializable):
         """
         self.mark_price = 0
         self.mark_price_set_time = 0
+        self.mark_price_source = None
         self.valid_price_received_event.clear()
         self.mark_price_from_sources = {}
 
@@ -18,6 +18,10 @@ from octobot_trading.exchange_data.recent_trades cimport recent_trades_manager
 from octobot_trading.exchange_data.recent_trades.recent_trades_manager cimport (
     RecentTradesManager,
 )
+from octobot_trading.exchange_data.recent_trades cimport preloaded_recent_trades
+from octobot_trading.exchange_data.recent_trades.preloaded_recent_trades cimport (
+    PreloadedRecentTrades,
+)
 from octobot_trading.exchange_data.recent_trades cimport channel
 from octobot_trading.exchange_data.recent_trades.channel cimport (
     RecentTradeUpdater,
@@ -32,5 +36,6 @@ __all__ = [
     "LiquidationsProducer",
     "LiquidationsChannel",
     "RecentTradesManager",
+    "PreloadedRecentTrades",
     "RecentTradeUpdater",
 ]
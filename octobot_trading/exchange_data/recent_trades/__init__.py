@@ -15,11 +15,15 @@
 #  License along with this library.
 
 from octobot_trading.exchange_data.recent_trades import recent_trades_manager
+from octobot_trading.exchange_data.recent_trades import preloaded_recent_trades
 from octobot_trading.exchange_data.recent_trades import channel
 
 from octobot_trading.exchange_data.recent_trades.recent_trades_manager import (
     RecentTradesManager,
 )
+from octobot_trading.exchange_data.recent_trades.preloaded_recent_trades import (
+    PreloadedRecentTrades,
+)
 from octobot_trading.exchange_data.recent_trades.channel import (
     RecentTradeUpdater,
     RecentTradeProducer,
@@ -37,6 +41,7 @@ __all__ = [
     "LiquidationsProducer",
     "LiquidationsChannel",
     "RecentTradesManager",
+    "PreloadedRecentTrades",
     "RecentTradeUpdater",
     "RecentTradeUpdaterSimulator",
 ]
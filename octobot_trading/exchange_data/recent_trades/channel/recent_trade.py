@@ -32,8 +32,7 @@ class RecentTradeProducer(exchanges_channel.ExchangeChannelProducer):
                     replace_all=replace_all)
 
                 if recent_trades:
-                    await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                    get_pair_cryptocurrency(symbol),
+                    await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                     symbol=symbol,
                                     recent_trades=recent_trades)
         except asyncio.CancelledError:
@@ -42,14 +41,13 @@ class RecentTradeProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, recent_trades):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "recent_trades": recent_trades
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "recent_trades": recent_trades
+        })
 
 
 class RecentTradeChannel(exchanges_channel.ExchangeChannel):
@@ -67,7 +65,7 @@ class LiquidationsProducer(exchanges_channel.ExchangeChannelProducer):
             if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
                     self.channel.get_filtered_consumers(symbol=symbol):
                 self.channel.exchange_manager.get_symbol_data(symbol).handle_liquidations(liquidations)
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.get_pair_cryptocurrency(symbol),
+                await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
                                 liquidations=liquidations)
         except asyncio.CancelledError:
@@ -76,14 +74,13 @@ class LiquidationsProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, liquidations):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "liquidations": liquidations
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "liquidations": liquidations
+        })
 
 
 class LiquidationsChannel(exchanges_channel.ExchangeChannel):
@@ -30,3 +30,6 @@ cdef class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
 
     cdef dict last_timestamp_pushed_by_symbol
     cdef str recent_trades_time_frame
+
+    cdef public dict preloaded_recent_trades
+    cdef public long long preloaded_recent_trades_memory_size
@@ -16,6 +16,7 @@
 import async_channel.channels as channels
 
 import octobot_backtesting.api as api
+import octobot_backtesting.data as backtesting_data
 import octobot_backtesting.errors as errors
 import octobot_backtesting.enums as backtesting_enums
 
@@ -26,6 +27,7 @@ import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.exchange_channel as exchanges_channel
 import octobot_trading.exchange_data.recent_trades.channel.recent_trade_updater as recent_trade_updater
+import octobot_trading.exchange_data.recent_trades.preloaded_recent_trades as preloaded_recent_trades
 import octobot_trading.util as util
 
 
@@ -43,12 +45,26 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
         # Only generate recent trades from the shortest handled time frame
         self.recent_trades_time_frame = self.channel.exchange_manager.exchange_config.get_shortest_time_frame().value
 
+        # PreloadedRecentTrades by pair, used instead of database queries when available
+        self.preloaded_recent_trades = {}
+        self.preloaded_recent_trades_memory_size = 0
+
     async def start(self):
+        if self.channel.exchange_manager.use_preloaded_backtesting_data and \
+                backtesting_enums.ExchangeDataTables.RECENT_TRADES in \
+                api.get_available_data_types(self.exchange_data_importer):
+            await self._preload_recent_trades()
         await self.resume()
 
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
             for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
+                if pair in self.preloaded_recent_trades:
+                    # push every recorded trade since the previous timestamp
+                    recent_trades = self.preloaded_recent_trades[pair].get_recent_trades_until(timestamp)
+                    if recent_trades:
+                        await self.push(pair, recent_trades)
+                    continue
                 recent_trades_data = (await self.exchange_data_importer.get_recent_trades_from_timestamps(
                     exchange_name=self.exchange_name,
                     symbol=pair,
@@ -76,20 +92,72 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
                 if last_candle_timestamp > self.last_timestamp_pushed_by_symbol[symbol]:
                     future_candle_low_price = future_candle[common_enums.PriceIndexes.IND_PRICE_LOW.value]
                     future_candle_high_price = future_candle[common_enums.PriceIndexes.IND_PRICE_HIGH.value]
-                    recent_trades = [self._generate_recent_trade(last_candle_timestamp, future_candle_low_price),
-                                     self._generate_recent_trade(last_candle_timestamp, future_candle_high_price)]
                     self.last_timestamp_pushed_by_symbol[symbol] = last_candle_timestamp
-                    await self.push(symbol, recent_trades)
+                    await self._push_simulated_prices(symbol, last_candle_timestamp,
+                                                      future_candle_low_price, future_candle_high_price)
             except (KeyError, TypeError):
                 # future candle not initialized or missing, should rarely happen: use received candle's close value
                 if candle:
                     last_candle_timestamp = candle[common_enums.PriceIndexes.IND_PRICE_TIME.value]
                     if last_candle_timestamp > self.last_timestamp_pushed_by_symbol[symbol]:
                         last_candle_close_price = candle[common_enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                        recent_trades = [self._generate_recent_trade(last_candle_timestamp, last_candle_close_price)] \
-                                        * self.SIMULATED_RECENT_TRADE_LIMIT
                         self.last_timestamp_pushed_by_symbol[symbol] = last_candle_timestamp
-                        await self.push(symbol, recent_trades)
+                        await self._push_simulated_prices(symbol, last_candle_timestamp,
+                                                          last_candle_close_price, last_candle_close_price)
+
+    async def _push_simulated_prices(self, symbol, timestamp, low_price, high_price):
+        candle_fill_engine = self.channel.exchange_manager.exchange_personal_data.candle_fill_engine
+        if candle_fill_engine is None:
+            # generate recent trades to trigger price events
+            await self.push(symbol, [self._generate_recent_trade(timestamp, low_price),
+                                     self._generate_recent_trade(timestamp, high_price)])
+        else:
+            # directly fill orders reached by this price range
+            await candle_fill_engine.fill_orders(symbol, timestamp, high_price, low_price)
+
+    async def _preload_recent_trades(self):
+        """
+        Load every recorded trade of each traded pair into memory to avoid database queries on each timestamp.
+        Stops preloading when MAX_PRELOADED_BACKTESTING_DATA_SIZE is reached: remaining pairs will use database
+        queries.
+        """
+        trades_count = 0
+        for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
+            if self.preloaded_recent_trades_memory_size >= constants.MAX_PRELOADED_BACKTESTING_DATA_SIZE:
+                self.logger.warning(f"Preloaded recent trades size limit reached, {pair} recent trades "
+                                    f"will be read from database")
+                continue
+            try:
+                recent_trades_data = await self.exchange_data_importer.get_recent_trades_from_timestamps(
+                    exchange_name=self.exchange_name,
+                    symbol=pair,
+                    limit=backtesting_data.DataBase.DEFAULT_SIZE)
+            except errors.DataBaseNotExists:
+                # handled by handle_timestamp
+                return
+            recent_trades = preloaded_recent_trades.PreloadedRecentTrades(
+                pair, [(data[0], data[-1]) for data in recent_trades_data]
+            )
+            self.preloaded_recent_trades[pair] = recent_trades
+            self.preloaded_recent_trades_memory_size += recent_trades.get_memory_size()
+            trades_count += len(recent_trades)
+        self.logger.info(f"Preloaded {trades_count} recent trades using "
+                         f"{self.preloaded_recent_trades_memory_size / 1024 / 1024:.2f} MB")
+
+    async def _disable_candle_fill_engine(self):
+        """
+        Fill limit based orders from recorded recent trades price events instead of candles
+        """
+        exchange_manager = self.channel.exchange_manager
+        exchange_manager.use_candle_fill_engine = False
+        exchange_personal_data = exchange_manager.exchange_personal_data
+        candle_fill_engine = exchange_personal_data.candle_fill_engine
+        if candle_fill_engine is None:
+            return
+        exchange_personal_data.candle_fill_engine = None
+        # orders previously handled by the engine are now waiting for their price events
+        for order in candle_fill_engine.get_handled_open_orders(None):
+            await order.update_order_status()
 
     @staticmethod
     def _generate_recent_trade(timestamp, price):
@@ -112,6 +180,9 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
             if self.time_consumer is None and not self.channel.is_paused:
                 if backtesting_enums.ExchangeDataTables.RECENT_TRADES in \
                         api.get_available_data_types(self.exchange_data_importer):
+                    if self.channel.exchange_manager.use_candle_fill_engine:
+                        self.logger.info("Recorded recent trades are available: candle fill engine disabled.")
+                        await self._disable_candle_fill_engine()
                     self.time_consumer = await channels.get_chan(
                         channels_name.OctoBotBacktestingChannelsName.TIME_CHANNEL.value).new_consumer(
                         self.handle_timestamp)
@@ -0,0 +1,28 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+
+cdef class PreloadedRecentTrades:
+    cdef public str symbol
+    cdef public object times
+    cdef public object prices
+    cdef public object amounts
+    cdef public list sides
+    cdef public list ids
+    cdef public int cursor
+
+    cpdef list get_recent_trades_until(self, double timestamp)
+    cpdef object get_next_trade_time(self)
+    cpdef long long get_memory_size(self)
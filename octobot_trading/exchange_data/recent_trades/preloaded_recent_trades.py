@@ -0,0 +1,112 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import sys
+
+import numpy as np
+
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
+
+# recorded trades timestamps above this ratio of their record timestamp are considered as milliseconds
+MILLISECONDS_TIMESTAMP_RATIO = 100
+
+
+class PreloadedRecentTrades:
+    """
+    Stores every recorded trade of a symbol in columnar arrays sorted by time.
+    Trades are read with increasing timestamps: a cursor on the first trade that hasn't been read yet is kept.
+    """
+
+    def __init__(self, symbol, recent_trades_records):
+        """
+        :param symbol: the trades symbol
+        :param recent_trades_records: (record_timestamp, recent_trades_list) tuples, recent trades lists can overlap
+        """
+        self.symbol = symbol
+        trades = _get_unique_trades(recent_trades_records)
+        trades.sort(key=lambda trade: trade[0])
+        self.times = np.array([trade[0] for trade in trades], dtype=np.float64)
+        self.prices = np.array([trade[1] for trade in trades], dtype=np.float64)
+        self.amounts = np.array([trade[2] for trade in trades], dtype=np.float64)
+        self.sides = [trade[3] for trade in trades]
+        self.ids = [trade[4] for trade in trades]
+        self.cursor = 0
+
+    def get_recent_trades_until(self, timestamp):
+        """
+        :param timestamp: the maximum trade time
+        :return: every trade of time <= timestamp that hasn't been returned yet, oldest first
+        """
+        end_index = self.cursor + int(np.searchsorted(self.times[self.cursor:], timestamp, side="right"))
+        recent_trades = [
+            {
+                ECOC.TIMESTAMP.value: trade_time,
+                ECOC.SYMBOL.value: self.symbol,
+                ECOC.ID.value: self.ids[index],
+                ECOC.SIDE.value: self.sides[index],
+                ECOC.PRICE.value: price,
+                ECOC.AMOUNT.value: amount,
+            }
+            for index, trade_time, price, amount in zip(range(self.cursor, end_index),
+                                                        self.times[self.cursor:end_index].tolist(),
+                                                        self.prices[self.cursor:end_index].tolist(),
+                                                        self.amounts[self.cursor:end_index].tolist())
+        ]
+        self.cursor = end_index
+        return recent_trades
+
+    def get_next_trade_time(self):
+        """
+        :return: the time of the next trade to be returned, None if every trade has been returned
+        """
+        return float(self.times[self.cursor]) if self.cursor < len(self.times) else None
+
+    def get_memory_size(self):
+        """
+        :return: the preloaded trades size in bytes, sides and ids lists included
+        """
+        return self.times.nbytes + self.prices.nbytes + self.amounts.nbytes + \
+            _get_list_memory_size(self.sides) + _get_list_memory_size(self.ids)
+
+    def __len__(self):
+        return len(self.times)
+
+
+def _get_list_memory_size(values):
+    # shared items (such as sides strings) are only counted once
+    return sys.getsizeof(values) + sum(
+        sys.getsizeof(value)
+        for value in {id(value): value for value in values}.values()
+    )
+
+
+def _get_unique_trades(recent_trades_records):
+    unique_trades = {}
+    for record_timestamp, recent_trades in recent_trades_records:
+        for trade in recent_trades:
+            try:
+                trade_time = trade.get(ECOC.TIMESTAMP.value) or record_timestamp
+                if trade_time > record_timestamp * MILLISECONDS_TIMESTAMP_RATIO:
+                    trade_time /= 1000
+                price = float(trade[ECOC.PRICE.value])
+                amount = float(trade.get(ECOC.AMOUNT.value) or 0)
+                trade_id = trade.get(ECOC.ID.value)
+                # recorded recent trades lists overlap: identify trades by id or by their content
+                key = trade_id if trade_id is not None else (trade_time, price, amount)
+                unique_trades[key] = (trade_time, price, amount, trade.get(ECOC.SIDE.value), trade_id)
+            except (KeyError, TypeError, ValueError):
+                # trade without price
+                pass
+    return list(unique_trades.values())
@@ -30,8 +30,7 @@ class TickerProducer(exchanges_channel.ExchangeChannelProducer):
                     self.channel.get_filtered_consumers(symbol=symbol):  #
                 if ticker:  # and price_ticker_is_initialized
                     self.channel.exchange_manager.get_symbol_data(symbol).handle_ticker_update(ticker)
-                    await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                    get_pair_cryptocurrency(symbol),
+                    await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                     symbol=symbol,
                                     ticker=ticker)
         except asyncio.CancelledError:
@@ -40,14 +39,13 @@ class TickerProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, ticker):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "ticker": ticker
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "ticker": ticker
+        })
 
 
 class TickerChannel(exchanges_channel.ExchangeChannel):
@@ -65,8 +63,7 @@ class MiniTickerProducer(exchanges_channel.ExchangeChannelProducer):
                     self.channel.get_filtered_consumers(symbol=symbol):
                 if mini_ticker:
                     self.channel.exchange_manager.get_symbol_data(symbol).handle_mini_ticker_update(mini_ticker)
-                    await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                    get_pair_cryptocurrency(symbol),
+                    await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                     symbol=symbol,
                                     mini_ticker=mini_ticker)
         except asyncio.CancelledError:
@@ -75,14 +72,13 @@ class MiniTickerProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, mini_ticker):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "mini_ticker": mini_ticker
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "mini_ticker": mini_ticker
+        })
 
 
 class MiniTickerChannel(exchanges_channel.ExchangeChannel):
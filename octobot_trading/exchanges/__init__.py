@@ -69,6 +69,9 @@ from octobot_trading.exchanges.util import (
     check_web_socket_config,
     search_websocket_class,
     supports_websocket,
+    WebsocketMicroBatcher,
+    Symbol,
+    SymbolsRegistry,
 )
 from octobot_trading.exchanges import exchange_websocket_factory
 from octobot_trading.exchanges.exchange_websocket_factory import (
@@ -174,4 +177,7 @@ __all__ = [
     "check_web_socket_config",
     "search_websocket_class",
     "supports_websocket",
+    "WebsocketMicroBatcher",
+    "Symbol",
+    "SymbolsRegistry",
 ]
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import typing
 
 import octobot_commons.constants
@@ -259,6 +260,28 @@ class AbstractExchange(util.Initializable):
         """
         raise NotImplementedError("cancel_order is not implemented")
 
+    async def cancel_orders(self, order_ids: list, symbol: str = None, cancel_all: bool = False,
+                            **kwargs: dict) -> dict:
+        """
+        Cancel orders on the exchange using up to MAX_CONCURRENT_ORDER_REQUESTS concurrent cancel_order requests
+        :param order_ids: the ids of the orders to cancel
+        :param symbol: the orders symbol
+        :param cancel_all: True when every open order of symbol can be cancelled at once if order_ids are
+        every open order of symbol on exchange
+        :return: the cancellation success of each order id
+        """
+        semaphore = asyncio.Semaphore(octobot_trading.constants.MAX_CONCURRENT_ORDER_REQUESTS)
+
+        async def _cancel_order(order_id):
+            async with semaphore:
+                try:
+                    return await self.cancel_order(order_id, symbol=symbol, **kwargs)
+                except Exception as e:
+                    self.logger.error(f"Failed to cancel order {order_id}: {e}")
+                    return False
+
+        return dict(zip(order_ids, await asyncio.gather(*(_cancel_order(order_id) for order_id in order_ids))))
+
     async def create_order(self, order_type: enums.TraderOrderType, symbol: str, quantity: float,
                            price: float = None, stop_price=None, params: dict = None, **kwargs: dict) -> dict:
         """
@@ -273,6 +296,24 @@ class AbstractExchange(util.Initializable):
         """
         raise NotImplementedError("create_order is not implemented")
 
+    async def create_orders(self, orders_params: list, **kwargs: dict) -> list:
+        """
+        Create orders on the exchange using up to MAX_CONCURRENT_ORDER_REQUESTS concurrent create_order requests
+        :param orders_params: the create_order keyword arguments of each order
+        :return: the created order dict of each order, None when an order creation failed
+        """
+        semaphore = asyncio.Semaphore(octobot_trading.constants.MAX_CONCURRENT_ORDER_REQUESTS)
+
+        async def _create_order(order_params):
+            async with semaphore:
+                try:
+                    return await self.create_order(**order_params, **kwargs)
+                except Exception as e:
+                    self.logger.error(f"Failed to create order {order_params}: {e}")
+                    return None
+
+        return list(await asyncio.gather(*(_create_order(order_params) for order_params in orders_params)))
+
     def is_supported_order_type(self, order_type):
         """
         Check if the order type is supported by the current exchange instance
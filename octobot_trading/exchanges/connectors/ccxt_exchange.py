@@ -14,6 +14,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import contextlib
 import decimal
 import logging
@@ -313,7 +314,14 @@ class CCXTExchange(abstract_exchange.AbstractExchange):
                               limit: int = None, **kwargs: dict) -> list:
         if self.client.has['fetchOpenOrders']:
             with self.error_describer():
-                return await self.client.fetch_open_orders(symbol=symbol, since=since, limit=limit, params=kwargs)
+                try:
+                    return await self.client.fetch_open_orders(symbol=symbol, since=since, limit=limit, params=kwargs)
+                except ccxt.ArgumentsRequired as e:
+                    if symbol is None:
+                        raise octobot_trading.errors.NotSupported(
+                            f"This exchange requires a symbol to fetch open orders: {e}"
+                        ) from e
+                    raise
         else:
             raise octobot_trading.errors.NotSupported("This exchange doesn't support fetchOpenOrders")
 
@@ -356,6 +364,82 @@ class CCXTExchange(abstract_exchange.AbstractExchange):
             self.logger.exception(e, True, f"Order {order_id} failed to cancel | {e} ({e.__class__.__name__})")
         return cancel_resp is not None
 
+    async def cancel_orders(self, order_ids: list, symbol: str = None, cancel_all: bool = False,
+                            **kwargs: dict) -> dict:
+        """
+        Cancel orders using the cancelAllOrders or cancelOrders endpoints when available or concurrent
+        cancelOrder requests otherwise. Cancellations are confirmed by a single open orders fetch.
+        cancelAllOrders is only used when order_ids are every open order of symbol on exchange to avoid
+        cancelling orders that are not known by the caller.
+        """
+        try:
+            with self.error_describer():
+                if cancel_all and symbol is not None and self.client.has.get('cancelAllOrders') \
+                        and await self._are_all_open_orders(order_ids, symbol, **kwargs):
+                    await self.client.cancel_all_orders(symbol=symbol, params=kwargs)
+                elif self.client.has.get('cancelOrders'):
+                    await self.client.cancel_orders(order_ids, symbol=symbol, params=kwargs)
+                else:
+                    await self._cancel_orders_concurrently(order_ids, symbol, **kwargs)
+        except ccxt.NotSupported:
+            raise octobot_trading.errors.NotSupported
+        except Exception as e:
+            # some orders might have been cancelled: check them anyway
+            self.logger.exception(e, True, f"Failed to cancel orders {order_ids} | {e} ({e.__class__.__name__})")
+        return await self._get_cancelled_orders(order_ids, symbol, **kwargs)
+
+    async def _are_all_open_orders(self, order_ids, symbol, **kwargs):
+        if not self.client.has['fetchOpenOrders']:
+            return False
+        try:
+            return {
+                order.get(ecoc.ID.value, None)
+                for order in await self.get_open_orders(symbol=symbol, **kwargs)
+            } == set(order_ids)
+        except Exception as e:
+            self.logger.exception(e, True, f"Failed to fetch open orders to compare them to orders to cancel | {e} "
+                                           f"({e.__class__.__name__})")
+            return False
+
+    async def _cancel_orders_concurrently(self, order_ids, symbol, **kwargs):
+        semaphore = asyncio.Semaphore(constants.MAX_CONCURRENT_ORDER_REQUESTS)
+
+        async def _cancel_order(order_id):
+            async with semaphore:
+                try:
+                    with self.error_describer():
+                        await self.client.cancel_order(order_id, symbol=symbol, params=kwargs)
+                except ccxt.OrderNotFound:
+                    self.logger.error(f"Trying to cancel order with id {order_id} but order was not found")
+                except Exception as e:
+                    self.logger.exception(e, True, f"Order {order_id} failed to cancel | {e} "
+                                                   f"({e.__class__.__name__})")
+
+        await asyncio.gather(*(_cancel_order(order_id) for order_id in order_ids))
+
+    async def _get_cancelled_orders(self, order_ids, symbol, **kwargs):
+        if self.client.has['fetchOpenOrders']:
+            try:
+                open_order_ids = {
+                    order.get(ecoc.ID.value, None)
+                    for order in await self.get_open_orders(symbol=symbol, **kwargs)
+                }
+                return {order_id: order_id not in open_order_ids for order_id in order_ids}
+            except Exception as e:
+                self.logger.exception(e, True, f"Failed to fetch open orders to check cancelled orders | {e} "
+                                               f"({e.__class__.__name__})")
+        # fetch each order when open orders can't be fetched
+        cancelled_orders = {}
+        for order_id in order_ids:
+            try:
+                cancelled_order = await self.get_order(order_id, symbol=symbol, **kwargs)
+                cancelled_orders[order_id] = cancelled_order is None or \
+                    personal_data.parse_is_cancelled(cancelled_order)
+            except Exception as e:
+                self.logger.error(f"Failed to check order {order_id} cancellation: {e}")
+                cancelled_orders[order_id] = False
+        return cancelled_orders
+
     def get_trade_fee(self, symbol, order_type, quantity, price, taker_or_maker):
         fees = self.client.calculate_fee(symbol=symbol,
                                          type=order_type,
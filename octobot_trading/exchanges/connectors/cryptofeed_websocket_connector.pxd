@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 cimport octobot_trading.exchanges.abstract_websocket_exchange as abstract_websocket
+cimport octobot_trading.exchanges.util.websocket_micro_batcher as websocket_micro_batcher
 
 cdef class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange):
     cdef public dict callback_by_feed
@@ -33,6 +34,11 @@ cdef class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExch
     cdef public object local_loop
     cdef public bint is_websocket_restarting
 
+    cdef public websocket_micro_batcher.WebsocketMicroBatcher recent_trades_batcher
+    cdef public websocket_micro_batcher.WebsocketMicroBatcher ticker_batcher
+    cdef public websocket_micro_batcher.WebsocketMicroBatcher kline_batcher
+    cdef public websocket_micro_batcher.WebsocketMicroBatcher candle_ticker_batcher
+
     cpdef void start(self)
     cpdef void _set_async_callbacks(self)
 
@@ -64,6 +70,11 @@ cdef class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExch
     cdef void _remove_feed(self, object feed)
     cdef void _fix_signal_handler(self)
     cdef void _fix_logger(self)
+    cdef tuple _get_micro_batchers(self)
+    cdef websocket_micro_batcher.WebsocketMicroBatcher _create_micro_batcher(self,
+                                                                             object feed,
+                                                                             object flush_callback,
+                                                                             bint keep_last_only)
     cdef list _convert_book_prices_to_orders(self, dict book_prices, str book_side)
     cdef str _parse_order_type(self, str raw_order_type)
     cdef str _parse_order_status(self, str raw_order_status)
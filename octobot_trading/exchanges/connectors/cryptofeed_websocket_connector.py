@@ -28,6 +28,7 @@ import cryptofeed.types as cryptofeed_types
 
 import octobot_commons
 import octobot_commons.asyncio_tools as asyncio_tools
+import octobot_commons.constants as commons_constants
 import octobot_commons.enums as commons_enums
 import octobot_commons.logging as commons_logging
 import octobot_commons.symbol_util as symbol_util
@@ -37,6 +38,7 @@ import octobot_trading.constants as trading_constants
 import octobot_trading.enums as trading_enums
 import octobot_trading.exchanges.abstract_websocket_exchange as abstract_websocket
 import octobot_trading.exchanges.connectors.abstract_websocket_connector as abstract_websocket_connector
+import octobot_trading.exchanges.util.websocket_micro_batcher as websocket_micro_batcher
 from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC, \
     ExchangeConstantsTickersColumns as Ectc
 from octobot_trading.enums import WebsocketFeeds as Feeds
@@ -93,6 +95,15 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
 
     EXCHANGE_CONSTRUCTOR_KWARGS = {}
 
+    # Default micro-batching settings by feed: (window in milliseconds, max batch size)
+    # Can be overridden per feed in the exchange configuration using the
+    # CONFIG_EXCHANGE_WEBSOCKET_MICRO_BATCHING key. (0, 0) pushes each message as soon as it is received.
+    MICRO_BATCHING_FEEDS = {
+        Feeds.TRADES: (0, 0),
+        Feeds.TICKER: (0, 0),
+        Feeds.CANDLE: (0, 0),
+    }
+
     def __init__(self, config: object, exchange_manager: object):
         super().__init__(config, exchange_manager)
         self.channels = []
@@ -108,6 +119,12 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
         self.local_loop = None
         self.is_websocket_restarting = False
 
+        # recent trades are accumulated by symbol, tickers and klines only keep their latest value
+        self.recent_trades_batcher = self._create_micro_batcher(Feeds.TRADES, self._push_recent_trades, False)
+        self.ticker_batcher = self._create_micro_batcher(Feeds.TICKER, self._push_mark_price, True)
+        self.kline_batcher = self._create_micro_batcher(Feeds.CANDLE, self._push_kline, True)
+        self.candle_ticker_batcher = self._create_micro_batcher(Feeds.CANDLE, self._push_candle_ticker, True)
+
         self._fix_signal_handler()
 
         # Manage cryptofeed loggers
@@ -172,6 +189,9 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
         except Exception as e:
             self.logger.exception(e, False)
             self.logger.error(f"Failed to stop websocket feed : {e}")
+        # push waiting messages before close() drops them
+        for batcher in self._get_micro_batchers():
+            await batcher.flush_all()
 
     async def stop(self):
         """
@@ -188,6 +208,8 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
         """
         try:
             self.client = None
+            for batcher in self._get_micro_batchers():
+                batcher.clear()
         except Exception as e:
             self.logger.error(f"Failed to close websocket feed : {e}")
 
@@ -550,6 +572,30 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
             for order_price, order_size in book_prices.to_dict().items()
         ]
 
+    def _get_micro_batchers(self):
+        return self.recent_trades_batcher, self.ticker_batcher, self.kline_batcher, self.candle_ticker_batcher
+
+    def _create_micro_batcher(self, feed, flush_callback, keep_last_only):
+        """
+        Creates the micro-batcher of the given feed from its exchange configuration or default settings
+        :param feed: the feed (instance of octobot_trading.enums.WebsocketFeeds)
+        :param flush_callback: the coroutine function pushing a batch to its channel
+        :param keep_last_only: when True, only the latest message of each batch key is pushed
+        :return: the created WebsocketMicroBatcher
+        """
+        window_ms, max_size = self.MICRO_BATCHING_FEEDS.get(feed, (0, 0))
+        try:
+            feed_config = self.config[commons_constants.CONFIG_EXCHANGES][self.exchange_manager.exchange_name][
+                trading_constants.CONFIG_EXCHANGE_WEBSOCKET_MICRO_BATCHING][feed.value]
+            window_ms = feed_config.get(trading_constants.CONFIG_MICRO_BATCHING_WINDOW, window_ms)
+            max_size = feed_config.get(trading_constants.CONFIG_MICRO_BATCHING_MAX_SIZE, max_size)
+        except (KeyError, TypeError):
+            pass
+        return websocket_micro_batcher.WebsocketMicroBatcher(flush_callback,
+                                                             window=window_ms / 1000,
+                                                             max_size=max_size,
+                                                             keep_last_only=keep_last_only)
+
     def _set_async_callbacks(self):
         """
         Prevent `inspect.iscoroutinefunction` to return False when callback are cythonized
@@ -604,10 +650,7 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
         symbol = self.get_pair_from_exchange(ticker.symbol)
         # Can't create a full ticker from bid, ask, timestamp and symbol data
         # Push (ask + bid) / 2 as close price in MARK_PRICE channel
-        await self.push_to_channel(channel_name=trading_constants.MARK_PRICE_CHANNEL,
-                                   symbol=symbol,
-                                   mark_price=float((ticker.ask + ticker.bid) / 2),
-                                   mark_price_source=trading_enums.MarkPriceSources.TICKER_CLOSE_PRICE.value)
+        await self.ticker_batcher.add(symbol, float((ticker.ask + ticker.bid) / 2))
 
     async def trades(self, trade: cryptofeed_types.Trade, receipt_timestamp: float):
         """
@@ -616,17 +659,15 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
         :param receipt_timestamp: received timestamp
         """
         symbol = self.get_pair_from_exchange(trade.symbol)
-        await self.push_to_channel(trading_constants.RECENT_TRADES_CHANNEL,
-                                   symbol=symbol,
-                                   recent_trades=[{
-                                       trading_enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: trade.timestamp,
-                                       trading_enums.ExchangeConstantsOrderColumns.SYMBOL.value: symbol,
-                                       trading_enums.ExchangeConstantsOrderColumns.ID.value: trade.id,
-                                       trading_enums.ExchangeConstantsOrderColumns.TYPE.value: None,
-                                       trading_enums.ExchangeConstantsOrderColumns.SIDE.value: trade.side,
-                                       trading_enums.ExchangeConstantsOrderColumns.PRICE.value: float(trade.price),
-                                       trading_enums.ExchangeConstantsOrderColumns.AMOUNT.value: float(trade.amount)
-                                   }])
+        await self.recent_trades_batcher.add(symbol, {
+            trading_enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: trade.timestamp,
+            trading_enums.ExchangeConstantsOrderColumns.SYMBOL.value: symbol,
+            trading_enums.ExchangeConstantsOrderColumns.ID.value: trade.id,
+            trading_enums.ExchangeConstantsOrderColumns.TYPE.value: None,
+            trading_enums.ExchangeConstantsOrderColumns.SIDE.value: trade.side,
+            trading_enums.ExchangeConstantsOrderColumns.PRICE.value: float(trade.price),
+            trading_enums.ExchangeConstantsOrderColumns.AMOUNT.value: float(trade.amount)
+        })
 
     async def book(self, order_book: cryptofeed_types.OrderBook, receipt_timestamp: float):
         """
@@ -684,11 +725,10 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
 
         if candle_data.symbol not in self.watched_pairs:
             if not candle_data.closed:
-                await self.push_to_channel(trading_constants.KLINE_CHANNEL,
-                                           time_frame=time_frame,
-                                           symbol=symbol,
-                                           kline=candle)
+                await self.kline_batcher.add((symbol, time_frame), candle)
             else:
+                # push the waiting kline first to keep the kline -> candle order
+                await self.kline_batcher.flush((symbol, time_frame))
                 await self.push_to_channel(trading_constants.OHLCV_CHANNEL,
                                            time_frame=time_frame,
                                            symbol=symbol,
@@ -696,9 +736,30 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
 
         # Push a new ticker if necessary : only push on the min timeframe
         if time_frame is self.min_timeframe:
-            await self.push_to_channel(trading_constants.TICKER_CHANNEL,
-                                       symbol=symbol,
-                                       ticker=ticker)
+            await self.candle_ticker_batcher.add(symbol, ticker)
+
+    async def _push_recent_trades(self, symbol, recent_trades):
+        await self.push_to_channel(trading_constants.RECENT_TRADES_CHANNEL,
+                                   symbol=symbol,
+                                   recent_trades=recent_trades)
+
+    async def _push_mark_price(self, symbol, mark_prices):
+        await self.push_to_channel(channel_name=trading_constants.MARK_PRICE_CHANNEL,
+                                   symbol=symbol,
+                                   mark_price=mark_prices[-1],
+                                   mark_price_source=trading_enums.MarkPriceSources.TICKER_CLOSE_PRICE.value)
+
+    async def _push_kline(self, symbol_and_time_frame, klines):
+        symbol, time_frame = symbol_and_time_frame
+        await self.push_to_channel(trading_constants.KLINE_CHANNEL,
+                                   time_frame=time_frame,
+                                   symbol=symbol,
+                                   kline=klines[-1])
+
+    async def _push_candle_ticker(self, symbol, tickers):
+        await self.push_to_channel(trading_constants.TICKER_CHANNEL,
+                                   symbol=symbol,
+                                   ticker=tickers[-1])
 
     async def liquidations(self, liquidation: cryptofeed_types.Liquidation, receipt_timestamp: float):
         """
@@ -177,10 +177,12 @@ class ExchangeSimulator(abstract_exchange.AbstractExchange):
             taker_or_maker = enums.ExchangeConstantsMarketPropertyColumns.TAKER.value
         symbol_fees = self.get_fees(symbol)
         rate = symbol_fees[taker_or_maker] / 100  # /100 because rate in used in %
-        currency, market = symbol_util.split_symbol(symbol)
+        interned_symbol = self.exchange_manager.symbols_registry.get_symbol(symbol)
+        currency, market = interned_symbol.base, interned_symbol.quote
         fee_currency = currency
 
-        precision = self.get_market_status(symbol)[enums.ExchangeConstantsMarketStatusColumns.PRECISION.value] \
+        precision = self.exchange_manager.symbols_registry.get_market_status(symbol) \
+            [enums.ExchangeConstantsMarketStatusColumns.PRECISION.value] \
             [enums.ExchangeConstantsMarketStatusColumns.PRECISION_PRICE.value]
         cost = float(number_util.round_into_str_with_max_digits(float(quantity) * rate, precision))
 
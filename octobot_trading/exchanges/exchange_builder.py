@@ -122,6 +122,46 @@ class ExchangeBuilder:
         self.exchange_manager.backtesting = backtesting_instance
         return self
 
+    def use_direct_dispatch_channels(self, direct_dispatch=True):
+        """
+        Synchronized (backtesting) channels producers will directly call their consumers instead of using
+        consumers queues, see ExchangeChannelProducer.send_to_consumers for ordering guarantees
+        """
+        self.exchange_manager.use_direct_dispatch_channels = direct_dispatch
+        return self
+
+    def use_preloaded_backtesting_data(self, preload=True):
+        """
+        Backtesting updaters will load their data into memory when starting instead of querying
+        their database on each timestamp
+        """
+        self.exchange_manager.use_preloaded_backtesting_data = preload
+        return self
+
+    def use_candle_fill_engine(self, use_engine=True):
+        """
+        Backtesting limit based orders will be filled by comparing them with each candle high and low prices at once
+        instead of generating recent trades from candles. Ignored when recorded recent trades are available.
+        """
+        self.exchange_manager.use_candle_fill_engine = use_engine
+        return self
+
+    def use_fixed_point_arithmetic(self, use_fixed_point=True):
+        """
+        Order prices and quantities will be adapted to markets precision, mark prices will be converted and orders
+        price events will be compared using integer arithmetic instead of formatting decimal.Decimal values.
+        Mark prices are then rounded to markets price precision.
+        """
+        self.exchange_manager.use_fixed_point_arithmetic = use_fixed_point
+        return self
+
+    def use_shared_backtesting_candles(self, shared_candles):
+        """
+        Backtesting candles will be read from the given SharedCandles instead of the backtesting database
+        """
+        self.exchange_manager.shared_backtesting_candles = shared_candles
+        return self.use_preloaded_backtesting_data()
+
     def is_sandboxed(self, sandboxed: bool):
         self.exchange_manager.is_sandboxed = sandboxed
         return self
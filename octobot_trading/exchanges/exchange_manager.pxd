@@ -17,6 +17,7 @@
 cimport octobot_trading.exchanges.abstract_exchange as abstract_exchange
 cimport octobot_trading.exchanges.exchange_config_data as exchange_config_data
 cimport octobot_trading.exchanges.abstract_websocket_exchange as abstract_websocket
+cimport octobot_trading.exchanges.util.symbols_registry as symbols_registry
 # cimport octobot_trading.exchange_data.exchange_symbols_data as exchange_symbols_data
 # cimport octobot_trading.exchange_data.exchange_symbol_data as exchange_symbol_data
 cimport octobot_trading.util as util
@@ -35,6 +36,7 @@ cdef class ExchangeManager(util.Initializable):
 
     cdef public list client_time_frames
     cdef public list client_symbols
+    cdef public symbols_registry.SymbolsRegistry symbols_registry
     cdef public list trading_modes
 
     cdef public bint rest_only
@@ -52,6 +54,12 @@ cdef class ExchangeManager(util.Initializable):
     cdef public bint has_websocket
     cdef public bint exchange_only
     cdef public bint without_auth
+    cdef public bint use_direct_dispatch_channels
+    cdef public bint use_preloaded_backtesting_data
+    cdef public bint use_candle_fill_engine
+    cdef public bint use_fixed_point_arithmetic
+    cdef public dict market_fixed_points
+    cdef public object shared_backtesting_candles
 
     cdef public abstract_exchange.AbstractExchange exchange
     cdef public abstract_websocket.AbstractWebsocketExchange exchange_web_socket
@@ -71,6 +79,7 @@ cdef class ExchangeManager(util.Initializable):
     cpdef void load_constants(self)
     cpdef str get_exchange_symbol(self, str symbol)
     cpdef tuple get_exchange_quote_and_base(self, str symbol)
+    cpdef str get_pair_cryptocurrency(self, str symbol)
     cpdef object get_rest_pairs_refresh_threshold(self)
     cpdef bint need_user_stream(self)
     cpdef void reset_exchange_symbols_data(self)
@@ -85,3 +94,4 @@ cdef class ExchangeManager(util.Initializable):
     cpdef str get_exchange_sub_account_id(self, str exchange_name)
     cpdef bint should_decrypt_token(self, object logger)
     cpdef object get_symbol_data(self, str symbol)
+    cpdef object get_market_fixed_point(self, str symbol)
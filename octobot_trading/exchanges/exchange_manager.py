@@ -51,6 +51,25 @@ class ExchangeManager(util.Initializable):
         self.is_trading: bool = True
         self.without_auth: bool = False
 
+        # use_direct_dispatch_channels is True when synchronized channels producers directly call their consumers
+        self.use_direct_dispatch_channels: bool = False
+
+        # use_preloaded_backtesting_data is True when backtesting data is loaded into memory before starting
+        self.use_preloaded_backtesting_data: bool = False
+
+        # use_candle_fill_engine is True when simulated limit based orders are filled from candles by a CandleFillEngine
+        self.use_candle_fill_engine: bool = False
+
+        # use_fixed_point_arithmetic is True when order prices and quantities are adapted to markets precision,
+        # mark prices are converted and price events are compared using integer arithmetic,
+        # see get_market_fixed_point
+        self.use_fixed_point_arithmetic: bool = False
+        # MarketFixedPoint by symbol
+        self.market_fixed_points = {}
+
+        # shared_backtesting_candles is the SharedCandles to read backtesting candles from when set
+        self.shared_backtesting_candles = None
+
         # exchange_only is True when exchange channels are not required (therefore not created)
         self.exchange_only: bool = False
 
@@ -70,6 +89,7 @@ class ExchangeManager(util.Initializable):
 
         self.client_symbols = []
         self.client_time_frames = []
+        self.symbols_registry = exchanges.SymbolsRegistry(self)
 
         self.exchange_config = exchanges.ExchangeConfig(self)
         self.exchange_personal_data = personal_data.ExchangePersonalData(self)
@@ -102,6 +122,7 @@ class ExchangeManager(util.Initializable):
             exchanges.Exchanges.instance().del_exchange(self.exchange.name, self.id,
                                                         should_warn=warning_on_missing_elements)
             self.exchange.exchange_manager = None
+        self.symbols_registry.clear()
         if self.exchange_personal_data is not None:
             self.exchange_personal_data.clear()
         self.exchange_config = None
@@ -153,11 +174,28 @@ class ExchangeManager(util.Initializable):
         return self.exchange.get_pair_from_exchange(symbol)
 
     def get_exchange_quote_and_base(self, symbol):
-        return self.exchange.get_split_pair_from_exchange(symbol)
+        return self.symbols_registry.get_base_and_quote(symbol)
+
+    def get_pair_cryptocurrency(self, symbol):
+        return self.symbols_registry.get_symbol(symbol).base
 
     def get_symbol_data(self, symbol):
         return self.exchange_symbols_data.get_exchange_symbol_data(symbol)
 
+    def get_market_fixed_point(self, symbol):
+        """
+        :param symbol: the market symbol
+        :return: the symbol MarketFixedPoint, None when use_fixed_point_arithmetic is False
+        """
+        if not self.use_fixed_point_arithmetic:
+            return None
+        try:
+            return self.market_fixed_points[symbol]
+        except KeyError:
+            market_fixed_point = self.market_fixed_points[symbol] = \
+                util.MarketFixedPoint(self.symbols_registry.get_market_status(symbol))
+            return market_fixed_point
+
     def get_rest_pairs_refresh_threshold(self) -> enums.RestExchangePairsRefreshMaxThresholds:
         traded_pairs_count = len(self.exchange_config.traded_symbol_pairs)
         if traded_pairs_count < enums.RestExchangePairsRefreshMaxThresholds.FAST.value:
@@ -32,6 +32,13 @@ class SpotCCXTExchange(exchanges_types.SpotExchange):
     ORDER_NON_EMPTY_FIELDS = [ecoc.ID.value, ecoc.TIMESTAMP.value, ecoc.SYMBOL.value, ecoc.TYPE.value,
                               ecoc.SIDE.value, ecoc.PRICE.value, ecoc.AMOUNT.value, ecoc.STATUS.value]
     ORDER_REQUIRED_FIELDS = ORDER_NON_EMPTY_FIELDS + [ecoc.REMAINING.value]
+    # orders that can be created using the exchange batch order creation endpoint: (ccxt order type, side)
+    BATCH_ORDER_TYPES = {
+        enums.TraderOrderType.BUY_MARKET: (enums.TradeOrderType.MARKET.value, enums.TradeOrderSide.BUY.value),
+        enums.TraderOrderType.BUY_LIMIT: (enums.TradeOrderType.LIMIT.value, enums.TradeOrderSide.BUY.value),
+        enums.TraderOrderType.SELL_MARKET: (enums.TradeOrderType.MARKET.value, enums.TradeOrderSide.SELL.value),
+        enums.TraderOrderType.SELL_LIMIT: (enums.TradeOrderType.LIMIT.value, enums.TradeOrderSide.SELL.value),
+    }
 
     def __init__(self, config, exchange_manager):
         super().__init__(config, exchange_manager)
@@ -55,18 +62,7 @@ class SpotCCXTExchange(exchanges_types.SpotExchange):
                            params: dict = None, **kwargs: dict) -> typing.Optional[dict]:
         try:
             created_order = await self._create_order_with_retry(order_type, symbol, quantity, price, params)
-            # some exchanges are not returning the full order details on creation: fetch it if necessary
-            if created_order and not self._ensure_order_details_completeness(created_order):
-                if ecoc.ID.value in created_order:
-                    order_symbol = created_order[ecoc.SYMBOL.value] if ecoc.SYMBOL.value in created_order else None
-                    created_order = await self.exchange_manager.exchange.get_order(created_order[ecoc.ID.value],
-                                                                                   order_symbol, **kwargs)
-
-            # on some exchange, market order are not not including price, add it manually to ensure uniformity
-            if created_order[ecoc.PRICE.value] is None and price is not None:
-                created_order[ecoc.PRICE.value] = float(price)
-
-            return self.clean_order(created_order)
+            return await self._get_completed_created_order(created_order, price, **kwargs)
 
         except ccxt.InsufficientFunds as e:
             self.log_order_creation_error(e, order_type, symbol, quantity, price, stop_price)
@@ -79,6 +75,57 @@ class SpotCCXTExchange(exchanges_types.SpotExchange):
             self.logger.error(e)
         return None
 
+    async def create_orders(self, orders_params: list, **kwargs: dict) -> list:
+        """
+        Create orders using the exchange batch order creation endpoint when available
+        """
+        if not self.connector.client.has.get("createOrders") \
+                or any(order_params["order_type"] not in self.BATCH_ORDER_TYPES for order_params in orders_params):
+            return await super().create_orders(orders_params, **kwargs)
+        batch_orders = []
+        for order_params in orders_params:
+            ccxt_order_type, side = self.BATCH_ORDER_TYPES[order_params["order_type"]]
+            price = order_params.get("price")
+            batch_orders.append({
+                "symbol": order_params["symbol"],
+                "type": ccxt_order_type,
+                "side": side,
+                "amount": float(order_params["quantity"]),
+                "price": None if price is None else float(price),
+                "params": self.exchange_manager.exchange_backend.get_orders_parameters(None),
+            })
+        try:
+            created_orders = await self.connector.client.create_orders(batch_orders)
+        except ccxt.NotSupported:
+            return await super().create_orders(orders_params, **kwargs)
+        except Exception as e:
+            self.logger.error(f"Failed to create {len(batch_orders)} orders: {e}")
+            return [None] * len(batch_orders)
+        completed_orders = []
+        for order_params, created_order in zip(orders_params, created_orders):
+            try:
+                completed_orders.append(await self._get_completed_created_order(
+                    created_order, order_params.get("price"), **kwargs
+                ))
+            except Exception as e:
+                self.logger.error(f"Failed to create order {order_params}: {e}")
+                completed_orders.append(None)
+        return completed_orders
+
+    async def _get_completed_created_order(self, created_order, price, **kwargs):
+        # some exchanges are not returning the full order details on creation: fetch it if necessary
+        if created_order and not self._ensure_order_details_completeness(created_order):
+            if ecoc.ID.value in created_order:
+                order_symbol = created_order[ecoc.SYMBOL.value] if ecoc.SYMBOL.value in created_order else None
+                created_order = await self.exchange_manager.exchange.get_order(created_order[ecoc.ID.value],
+                                                                               order_symbol, **kwargs)
+
+        # on some exchange, market order are not not including price, add it manually to ensure uniformity
+        if created_order[ecoc.PRICE.value] is None and price is not None:
+            created_order[ecoc.PRICE.value] = float(price)
+
+        return self.clean_order(created_order)
+
     async def _create_order_with_retry(self, order_type, symbol, quantity: decimal.Decimal,
                                        price: decimal.Decimal, params) -> dict:
         try:
@@ -218,6 +265,10 @@ class SpotCCXTExchange(exchanges_types.SpotExchange):
     async def cancel_order(self, order_id: str, symbol: str = None, **kwargs: dict) -> bool:
         return await self.connector.cancel_order(symbol=symbol, order_id=order_id, **kwargs)
 
+    async def cancel_orders(self, order_ids: list, symbol: str = None, cancel_all: bool = False,
+                            **kwargs: dict) -> dict:
+        return await self.connector.cancel_orders(order_ids, symbol=symbol, cancel_all=cancel_all, **kwargs)
+
     def get_trade_fee(self, symbol, order_type, quantity, price, taker_or_maker):
         return self.connector.get_trade_fee(symbol, order_type, quantity, price, taker_or_maker)
 
@@ -115,6 +115,65 @@ class Trader(util.Initializable):
         await new_order.initialize()
         return new_order
 
+    async def create_orders(self, orders, portfolio: object = None) -> list:
+        """
+        Create new orders from OrderFactory created orders: exchange managed orders are submitted together
+        (using the exchange batch order creation when available), portfolio availability of every order
+        is reserved before submitting and released for orders that failed to be created.
+        :param orders: Orders to create
+        :param portfolio: Portfolio to update (default is this exchange's portfolio)
+        :return: The created order instances, None for orders that failed to be created
+        """
+        if portfolio is None:
+            portfolio = self.exchange_manager.exchange_personal_data.portfolio_manager.portfolio
+        exchange_orders = [
+            order
+            for order in orders
+            if not self.simulate and not order.is_self_managed()
+        ]
+        if not exchange_orders:
+            return [await self.create_order(order, portfolio=portfolio) for order in orders]
+
+        # reserve funds while orders are being created to prevent concurrent orders from using them
+        for order in exchange_orders:
+            portfolio.update_portfolio_available(order, is_new_order=True)
+        created_orders = await self.exchange_manager.exchange.create_orders([
+            {
+                "order_type": order.order_type,
+                "symbol": order.symbol,
+                "quantity": order.origin_quantity,
+                "price": order.origin_price,
+                "stop_price": order.origin_stop_price,
+            }
+            for order in exchange_orders
+        ])
+        raw_orders_by_order = dict(zip(exchange_orders, created_orders))
+        new_orders = []
+        for order in orders:
+            if order not in raw_orders_by_order:
+                new_orders.append(await self.create_order(order, portfolio=portfolio))
+                continue
+            # the created order availability is reserved by its initialization
+            portfolio.update_portfolio_available(order, is_new_order=False)
+            raw_order = raw_orders_by_order[order]
+            if raw_order is None:
+                self.logger.error(f"Fail to create order : {order.to_string()}")
+                new_orders.append(None)
+                continue
+            self.logger.info(f"Created order on {self.exchange_manager.exchange_name}: {raw_order}")
+            new_order = order_factory.create_order_instance_from_raw(self, raw_order, force_open=True)
+            new_order.linked_portfolio = portfolio
+            new_orders.append(await self._initialize_created_order(order, new_order))
+        return new_orders
+
+    async def _initialize_created_order(self, order, new_order):
+        # if this order is linked to another (ex : a sell limit order with a stop loss order)
+        if order.linked_to is not None:
+            order.linked_to.add_linked_order(new_order)
+            new_order.linked_orders.append(order.linked_to)
+        await new_order.initialize()
+        return new_order
+
     async def create_artificial_order(self, order_type, symbol, current_price, quantity, price, linked_portfolio):
         """
         Creates an OctoBot managed order (managed orders example: stop loss that is not published on the exchange and
@@ -166,7 +225,9 @@ class Trader(util.Initializable):
         success = True
         async with order.lock:
             # if real order: cancel on exchange
-            if not self.simulate and not order.is_self_managed():
+            # orders closed by cancel_orders are already cancelled on exchange
+            if not self.simulate and not order.is_self_managed() \
+                    and order.status is not octobot_trading.enums.OrderStatus.CLOSED:
                 success = await self.exchange_manager.exchange.cancel_order(order.order_id, order.symbol)
                 if not success:
                     # retry to cancel order
@@ -177,7 +238,7 @@ class Trader(util.Initializable):
                 else:
                     order.status = octobot_trading.enums.OrderStatus.CLOSED
                     self.logger.debug(f"Successfully cancelled order {order}")
-            else:
+            elif self.simulate or order.is_self_managed():
                 order.status = octobot_trading.enums.OrderStatus.CANCELED
 
         # call CancelState termination
@@ -186,6 +247,41 @@ class Trader(util.Initializable):
                               ignored_order=ignored_order)
         return True
 
+    async def cancel_orders(self, orders, cancel_all_symbol_orders=False) -> bool:
+        """
+        Cancels the given orders and their linked orders: exchange managed orders are cancelled using one bulk
+        exchange request per symbol and their cancellation is confirmed by a single open orders check.
+        :param orders: Orders to cancel
+        :param cancel_all_symbol_orders: When True, the given orders of a symbol can be cancelled on exchange using
+        a single cancel all request when they are every open order of this symbol on exchange
+        :return: True if all orders got cancelled, False if an error occurred
+        """
+        orders = [order for order in orders if order.is_open() and not order.is_cancelled()]
+        exchange_orders_by_symbol = {}
+        if not self.simulate:
+            for order in orders:
+                if not order.is_self_managed():
+                    exchange_orders_by_symbol.setdefault(order.symbol, []).append(order)
+        all_cancelled = True
+        failed_orders = set()
+        for symbol, symbol_orders in exchange_orders_by_symbol.items():
+            cancelled_orders = await self.exchange_manager.exchange.cancel_orders(
+                [order.order_id for order in symbol_orders], symbol=symbol, cancel_all=cancel_all_symbol_orders
+            )
+            for order in symbol_orders:
+                if cancelled_orders.get(order.order_id, False):
+                    order.status = octobot_trading.enums.OrderStatus.CLOSED
+                    self.logger.debug(f"Successfully cancelled order {order}")
+                else:
+                    self.logger.warning(f"Failed to cancel order {order}")
+                    failed_orders.add(order)
+                    all_cancelled = False
+        for order in orders:
+            # orders might already be cancelled as linked orders of previous orders
+            if order not in failed_orders and order.is_open():
+                all_cancelled = await self.cancel_order(order) and all_cancelled
+        return all_cancelled
+
     async def cancel_order_with_id(self, order_id):
         """
         Gets order matching order_id from the OrderManager and calls self.cancel_order() on it
@@ -206,12 +302,14 @@ class Trader(util.Initializable):
         :param cancel_loaded_orders: When True, also cancels loaded orders (order that are not from this bot instance)
         :return: True if all orders got cancelled, False if an error occurred
         """
-        all_cancelled = True
-        for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders():
-            if (order.symbol == symbol and not order.is_cancelled()) and \
-                    (cancel_loaded_orders or order.is_from_this_octobot):
-                all_cancelled = await self.cancel_order(order) and all_cancelled
-        return all_cancelled
+        return await self.cancel_orders(
+            [
+                order
+                for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(symbol=symbol)
+                if cancel_loaded_orders or order.is_from_this_octobot
+            ],
+            cancel_all_symbol_orders=cancel_loaded_orders
+        )
 
     async def cancel_all_open_orders_with_currency(self, currency) -> bool:
         """
@@ -220,23 +318,25 @@ class Trader(util.Initializable):
         :param currency: Currency to find trading pairs to cancel orders on.
         :return: True if all orders got cancelled, False if an error occurred
         """
-        all_cancelled = True
-        symbols = util.get_pairs(self.config, currency, enabled_only=True)
-        if symbols:
-            for symbol in symbols:
-                all_cancelled = await self.cancel_open_orders(symbol) and all_cancelled
-        return all_cancelled
+        symbols = set(util.get_pairs(self.config, currency, enabled_only=True) or [])
+        return await self.cancel_orders(
+            [
+                order
+                for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+                if order.symbol in symbols
+            ],
+            cancel_all_symbol_orders=True
+        )
 
     async def cancel_all_open_orders(self) -> bool:
         """
         Cancel all open orders registered on this bot.
         :return: True if all orders got cancelled, False if an error occurred
         """
-        all_cancelled = True
-        for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders():
-            if not order.is_cancelled():
-                all_cancelled = await self.cancel_order(order) and all_cancelled
-        return all_cancelled
+        return await self.cancel_orders(
+            self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(),
+            cancel_all_symbol_orders=True
+        )
 
     async def _sell_everything(self, symbol, inverted, timeout=None):
         created_orders = []
@@ -252,8 +352,9 @@ class Trader(util.Initializable):
                     quantity = 0
             else:
                 quantity = current_symbol_holding
-            for order_quantity, order_price in decimal_order_adapter.decimal_check_and_adapt_order_details_if_necessary(quantity, price,
-                                                                                                        symbol_market):
+            for order_quantity, order_price in decimal_order_adapter.decimal_check_and_adapt_order_details_if_necessary(
+                    quantity, price, symbol_market,
+                    market_fixed_point=self.exchange_manager.get_market_fixed_point(symbol)):
                 current_order = order_factory.create_order_instance(trader=self,
                                                                     order_type=order_type,
                                                                     symbol=symbol,
@@ -273,7 +374,8 @@ class Trader(util.Initializable):
         :return: The created orders
         """
         orders = []
-        currency_list = self.exchange_manager.exchange_personal_data.portfolio_manager.portfolio.portfolio
+        currency_list = self.exchange_manager.exchange_personal_data.portfolio_manager.portfolio.\
+            get_read_only_portfolio()
 
         if not currencies_to_sell:
             currencies = currency_list
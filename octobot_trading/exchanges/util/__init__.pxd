@@ -32,6 +32,15 @@ from octobot_trading.exchanges.util.websockets_util cimport (
     check_web_socket_config,
     search_websocket_class,
 )
+from octobot_trading.exchanges.util cimport websocket_micro_batcher
+from octobot_trading.exchanges.util.websocket_micro_batcher cimport (
+    WebsocketMicroBatcher,
+)
+from octobot_trading.exchanges.util cimport symbols_registry
+from octobot_trading.exchanges.util.symbols_registry cimport (
+    Symbol,
+    SymbolsRegistry,
+)
 
 __all__ = [
     "ExchangeMarketStatusFixer",
@@ -43,4 +52,7 @@ __all__ = [
     "force_disable_web_socket",
     "check_web_socket_config",
     "search_websocket_class",
+    "WebsocketMicroBatcher",
+    "Symbol",
+    "SymbolsRegistry",
 ]
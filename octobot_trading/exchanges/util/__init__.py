@@ -36,6 +36,15 @@ from octobot_trading.exchanges.util.websockets_util import (
     search_websocket_class,
     supports_websocket,
 )
+from octobot_trading.exchanges.util import websocket_micro_batcher
+from octobot_trading.exchanges.util.websocket_micro_batcher import (
+    WebsocketMicroBatcher,
+)
+from octobot_trading.exchanges.util import symbols_registry
+from octobot_trading.exchanges.util.symbols_registry import (
+    Symbol,
+    SymbolsRegistry,
+)
 
 __all__ = [
     "ExchangeMarketStatusFixer",
@@ -51,4 +60,7 @@ __all__ = [
     "check_web_socket_config",
     "search_websocket_class",
     "supports_websocket",
+    "WebsocketMicroBatcher",
+    "Symbol",
+    "SymbolsRegistry",
 ]
@@ -0,0 +1,36 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class Symbol:
+    cdef public str symbol
+    cdef public str base
+    cdef public str quote
+    cdef public object exchange_symbol
+    cdef public dict market_status
+
+
+cdef class SymbolsRegistry:
+    cdef public object exchange_manager
+    cdef public dict symbols
+
+    cpdef Symbol get_symbol(self, str symbol)
+    cpdef tuple get_base_and_quote(self, str symbol)
+    cpdef object get_exchange_symbol(self, str symbol)
+    cpdef dict get_market_status(self, str symbol)
+    cpdef void clear(self)
+
+    cdef tuple _split_symbol(self, str symbol)
@@ -0,0 +1,106 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.symbol_util as symbol_util
+
+
+class Symbol:
+    """
+    A trading pair of an exchange: there is only one Symbol instance by trading pair in a SymbolsRegistry
+    """
+
+    def __init__(self, symbol, base, quote):
+        self.symbol = symbol
+        self.base = base
+        self.quote = quote
+        # exchange specific trading pair identifier, loaded by SymbolsRegistry.get_exchange_symbol
+        self.exchange_symbol = None
+        # exchange market status (without fixer), loaded by SymbolsRegistry.get_market_status
+        self.market_status = None
+
+    def __str__(self):
+        return self.symbol
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.symbol})"
+
+
+class SymbolsRegistry:
+    """
+    SymbolsRegistry stores the Symbol of each trading pair used with an exchange to avoid splitting symbols
+    and requesting exchange market details each time they are required.
+    """
+
+    def __init__(self, exchange_manager):
+        self.exchange_manager = exchange_manager
+        # Symbol by trading pair
+        self.symbols = {}
+
+    def get_symbol(self, symbol):
+        """
+        :param symbol: the trading pair
+        :return: the trading pair Symbol, created when required
+        """
+        try:
+            return self.symbols[symbol]
+        except KeyError:
+            base, quote = self._split_symbol(symbol)
+            interned_symbol = self.symbols[symbol] = Symbol(symbol, base, quote)
+            return interned_symbol
+
+    def get_base_and_quote(self, symbol):
+        """
+        :param symbol: the trading pair
+        :return: the (base, quote) tuple of symbol
+        """
+        interned_symbol = self.get_symbol(symbol)
+        return interned_symbol.base, interned_symbol.quote
+
+    def get_exchange_symbol(self, symbol):
+        """
+        :param symbol: the trading pair
+        :return: the exchange identifier of symbol, None when the exchange doesn't provide it
+        """
+        interned_symbol = self.get_symbol(symbol)
+        if interned_symbol.exchange_symbol is None:
+            try:
+                interned_symbol.exchange_symbol = self.exchange_manager.exchange.get_exchange_pair(symbol)
+            except (ValueError, NotImplementedError):
+                return None
+        return interned_symbol.exchange_symbol
+
+    def get_market_status(self, symbol):
+        """
+        :param symbol: the trading pair
+        :return: the market status of symbol without fixer, it should not be modified
+        """
+        interned_symbol = self.get_symbol(symbol)
+        if not interned_symbol.market_status:
+            interned_symbol.market_status = self.exchange_manager.exchange.get_market_status(symbol,
+                                                                                             with_fixer=False)
+        return interned_symbol.market_status
+
+    def clear(self):
+        self.symbols = {}
+
+    def _split_symbol(self, symbol):
+        """
+        Use exchange markets details when available
+        """
+        if self.exchange_manager.exchange is not None:
+            base, quote = self.exchange_manager.exchange.get_split_pair_from_exchange(symbol)
+            if base is not None and quote is not None:
+                return base, quote
+        return symbol_util.split_symbol(symbol)
@@ -0,0 +1,31 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class WebsocketMicroBatcher:
+    cdef object logger
+
+    cdef public object flush_callback
+    cdef public double window
+    cdef public int max_size
+    cdef public bint keep_last_only
+
+    cdef public dict batches
+    cdef public dict flush_handles
+    cdef public set flush_tasks
+
+    cpdef bint is_enabled(self)
+    cpdef void clear(self)
@@ -0,0 +1,112 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import octobot_commons.logging as logging
+
+
+class WebsocketMicroBatcher:
+    """
+    Accumulates websocket messages by key (usually a symbol) and flushes them as a single batch
+    when the batching window is elapsed or when the batch reached its maximum size
+    """
+
+    def __init__(self, flush_callback, window=0, max_size=0, keep_last_only=False):
+        """
+        :param flush_callback: the coroutine function called with (key, elements) when a batch is flushed
+        :param window: the maximum time (in seconds) an element can wait before being flushed
+        :param max_size: the batch size triggering an immediate flush, 0 for no size limit
+        :param keep_last_only: when True, only the last received element of each key is kept (useful for
+        snapshot like messages such as tickers and klines)
+        """
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.flush_callback = flush_callback
+        self.window = window
+        self.max_size = max_size
+        self.keep_last_only = keep_last_only
+
+        # waiting elements by key
+        self.batches = {}
+
+        # scheduled flush handles by key
+        self.flush_handles = {}
+
+        # flush tasks created by elapsed flush handles
+        self.flush_tasks = set()
+
+    def is_enabled(self):
+        """
+        :return: True when messages are actually batched
+        """
+        return self.window > 0 or self.max_size > 1
+
+    async def add(self, key, element):
+        """
+        Add an element to the key batch and flush it if necessary
+        :param key: the batch key
+        :param element: the element to add
+        """
+        if not self.is_enabled():
+            await self.flush_callback(key, [element])
+            return
+        if self.keep_last_only:
+            self.batches[key] = [element]
+        else:
+            self.batches.setdefault(key, []).append(element)
+        if 0 < self.max_size <= len(self.batches[key]):
+            await self.flush(key)
+        elif key not in self.flush_handles and self.window > 0:
+            self.flush_handles[key] = asyncio.get_event_loop().call_later(self.window, self._schedule_flush, key)
+
+    async def flush(self, key):
+        """
+        Flush the given key batch
+        :param key: the batch key
+        """
+        handle = self.flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        elements = self.batches.pop(key, None)
+        if elements:
+            try:
+                await self.flush_callback(key, elements)
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when flushing {key} batch: {e}")
+
+    async def flush_all(self):
+        """
+        Flush every waiting batch
+        """
+        for key in list(self.batches):
+            await self.flush(key)
+
+    def clear(self):
+        """
+        Cancel scheduled flushes and drop waiting elements, call flush_all() first to push them
+        """
+        for handle in self.flush_handles.values():
+            handle.cancel()
+        for flush_task in self.flush_tasks:
+            flush_task.cancel()
+        self.flush_handles = {}
+        self.flush_tasks = set()
+        self.batches = {}
+
+    def _schedule_flush(self, key):
+        self.flush_handles.pop(key, None)
+        flush_task = asyncio.create_task(self.flush(key))
+        self.flush_tasks.add(flush_task)
+        flush_task.add_done_callback(self.flush_tasks.discard)
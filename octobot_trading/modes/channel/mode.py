@@ -34,20 +34,20 @@ class ModeChannelProducer(exchanges_channel.ExchangeChannelProducer):
                    symbol=channel_constants.CHANNEL_WILDCARD,
                    time_frame=None,
                    data=None):
-        for consumer in self.channel.get_filtered_consumers(trading_mode_name=trading_mode_name,
-                                                            state=state,
-                                                            cryptocurrency=cryptocurrency,
-                                                            symbol=symbol,
-                                                            time_frame=time_frame):
-            await consumer.queue.put({
-                "final_note": final_note,
-                "state": state,
-                "trading_mode_name": trading_mode_name,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "time_frame": time_frame,
-                "data": data
-            })
+        consumers = self.channel.get_filtered_consumers(trading_mode_name=trading_mode_name,
+                                                        state=state,
+                                                        cryptocurrency=cryptocurrency,
+                                                        symbol=symbol,
+                                                        time_frame=time_frame)
+        await self.send_to_consumers(consumers, {
+            "final_note": final_note,
+            "state": state,
+            "trading_mode_name": trading_mode_name,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "time_frame": time_frame,
+            "data": data
+        })
 
 
 class ModeChannel(exchanges_channel.ExchangeChannel):
@@ -23,6 +23,9 @@ from octobot_trading.personal_data.orders cimport (
     Order,
     OrderState,
     OrdersManager,
+    CandleFillEngine,
+    is_handled_order,
+    get_reached_orders_mask,
     UnknownOrder,
     MarketOrder,
     SellMarketOrder,
@@ -80,6 +83,7 @@ from octobot_trading.personal_data.positions cimport (
 )
 from octobot_trading.personal_data cimport trades
 from octobot_trading.personal_data.trades cimport (
+    CompactTradesHistory,
     TradesManager,
     TradesProducer,
     TradesChannel,
@@ -100,9 +104,15 @@ __all__ = [
     "Order",
     "OrderState",
     "OrdersUpdater",
+    "OrdersSyncStrategy",
+    "ConcurrentOrdersSyncStrategy",
+    "SymbolLessOrdersSyncStrategy",
     "OrdersProducer",
     "OrdersChannel",
     "OrdersManager",
+    "CandleFillEngine",
+    "is_handled_order",
+    "get_reached_orders_mask",
     "OrdersUpdaterSimulator",
     "CloseOrderState",
     "CancelOrderState",
@@ -156,6 +166,7 @@ __all__ = [
     "create_position_from_type",
     "create_symbol_position",
     "parse_position_status",
+    "CompactTradesHistory",
     "TradesManager",
     "TradesProducer",
     "TradesChannel",
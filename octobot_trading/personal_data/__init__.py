@@ -32,9 +32,14 @@ from octobot_trading.personal_data.orders import (
     parse_raw_fees,
     parse_order_status,
     parse_is_cancelled,
+    get_raw_order_fingerprint,
     get_pre_order_data,
     OrderState,
     OrdersUpdater,
+    OrdersSyncStrategy,
+    ConcurrentOrdersSyncStrategy,
+    SymbolLessOrdersSyncStrategy,
+    create_orders_sync_strategy,
     adapt_price,
     decimal_adapt_price,
     adapt_quantity,
@@ -58,6 +63,9 @@ from octobot_trading.personal_data.orders import (
     OrdersProducer,
     OrdersChannel,
     OrdersManager,
+    CandleFillEngine,
+    is_handled_order,
+    get_reached_orders_mask,
     OrdersUpdaterSimulator,
     CloseOrderState,
     CancelOrderState,
@@ -94,6 +102,7 @@ from octobot_trading.personal_data.portfolios import (
     SubPortfolio,
     PortfolioManager,
     PortfolioValueHolder,
+    CurrencyConversionGraph,
     FuturePortfolio,
     MarginPortfolio,
     SpotPortfolio,
@@ -124,6 +133,7 @@ from octobot_trading.personal_data.positions import (
 )
 from octobot_trading.personal_data import trades
 from octobot_trading.personal_data.trades import (
+    CompactTradesHistory,
     TradesManager,
     TradesProducer,
     TradesChannel,
@@ -182,9 +192,14 @@ __all__ = [
     "parse_raw_fees",
     "parse_order_status",
     "parse_is_cancelled",
+    "get_raw_order_fingerprint",
     "get_pre_order_data",
     "OrderState",
     "OrdersUpdater",
+    "OrdersSyncStrategy",
+    "ConcurrentOrdersSyncStrategy",
+    "SymbolLessOrdersSyncStrategy",
+    "create_orders_sync_strategy",
     "adapt_price",
     "decimal_adapt_price",
     "adapt_quantity",
@@ -208,6 +223,9 @@ __all__ = [
     "OrdersProducer",
     "OrdersChannel",
     "OrdersManager",
+    "CandleFillEngine",
+    "is_handled_order",
+    "get_reached_orders_mask",
     "OrdersUpdaterSimulator",
     "CloseOrderState",
     "CancelOrderState",
@@ -243,6 +261,7 @@ __all__ = [
     "SubPortfolio",
     "PortfolioManager",
     "PortfolioValueHolder",
+    "CurrencyConversionGraph",
     "FuturePortfolio",
     "MarginPortfolio",
     "SpotPortfolio",
@@ -265,6 +284,7 @@ __all__ = [
     "create_position_from_type",
     "create_symbol_position",
     "parse_position_status",
+    "CompactTradesHistory",
     "TradesManager",
     "TradesProducer",
     "TradesChannel",
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 cimport octobot_trading.personal_data.orders.orders_manager as orders_manager
+cimport octobot_trading.personal_data.orders.candle_fill_engine as candle_fill_engine
 cimport octobot_trading.personal_data.orders.order as order_class
 cimport octobot_trading.personal_data.portfolios.portfolio_manager as portfolio_manager
 cimport octobot_trading.personal_data.positions.positions_manager as positions_manager
@@ -34,6 +35,7 @@ cdef class ExchangePersonalData(util.Initializable):
     cdef public trades_manager.TradesManager trades_manager
     cdef public orders_manager.OrdersManager orders_manager
     cdef public positions_manager.PositionsManager positions_manager
+    cdef public candle_fill_engine.CandleFillEngine candle_fill_engine
 
     cpdef object get_order_portfolio(self, order_class.Order order)
     cpdef void clear(self)
@@ -20,8 +20,10 @@ import octobot_commons.logging as logging
 import octobot_trading.exchange_channel as exchange_channel
 import octobot_trading.constants
 import octobot_trading.personal_data.portfolios.portfolio_manager as portfolio_manager
+import octobot_trading.personal_data.portfolios.channel.balance_updater as balance_updater
 import octobot_trading.personal_data.positions.positions_manager as positions_manager
 import octobot_trading.personal_data.orders.orders_manager as orders_manager
+import octobot_trading.personal_data.orders.candle_fill_engine as candle_fill_engine
 import octobot_trading.personal_data.trades.trades_manager as trades_manager
 import octobot_trading.util as util
 
@@ -40,6 +42,7 @@ class ExchangePersonalData(util.Initializable):
         self.trades_manager = None
         self.orders_manager = None
         self.positions_manager = None
+        self.candle_fill_engine = None
 
     async def initialize_impl(self):
         self.trader = self.exchange_manager.trader
@@ -51,6 +54,8 @@ class ExchangePersonalData(util.Initializable):
                 self.trades_manager = trades_manager.TradesManager(self.trader)
                 self.orders_manager = orders_manager.OrdersManager(self.trader)
                 self.positions_manager = positions_manager.PositionsManager(self.trader)
+                if self.exchange_manager.use_candle_fill_engine:
+                    self.candle_fill_engine = candle_fill_engine.CandleFillEngine(self.orders_manager)
                 await self.portfolio_manager.initialize()
                 await self.trades_manager.initialize()
                 await self.orders_manager.initialize()
@@ -77,14 +82,27 @@ class ExchangePersonalData(util.Initializable):
         try:
             changed: bool = await self.portfolio_manager.handle_balance_update_from_order(order,
                                                                                           require_exchange_update)
+            if changed:
+                # holdings changed: profitability can't wait for the next coalesced mark prices update
+                await self._update_pending_mark_prices()
             if should_notify:
                 await exchange_channel.get_chan(octobot_trading.constants.BALANCE_CHANNEL, self.exchange_manager.id). \
-                    get_internal_producer().send(self.portfolio_manager.portfolio.portfolio)
+                    get_internal_producer().send(self.portfolio_manager.portfolio.get_read_only_portfolio())
             return changed
         except AttributeError as e:
             self.logger.exception(e, True, f"Failed to update balance : {e}")
             return False
 
+    async def _update_pending_mark_prices(self):
+        try:
+            for producer in exchange_channel.get_chan(octobot_trading.constants.BALANCE_PROFITABILITY_CHANNEL,
+                                                      self.exchange_manager.id).producers:
+                if isinstance(producer, balance_updater.BalanceProfitabilityUpdater):
+                    await producer.update_pending_mark_prices(should_notify=False)
+        except KeyError:
+            # balance profitability channel might not be created or already be stopped
+            pass
+
     async def handle_portfolio_profitability_update(self, balance, mark_price, symbol, should_notify: bool = True):
         try:
             portfolio_profitability = self.portfolio_manager.portfolio_profitability
@@ -160,7 +178,7 @@ class ExchangePersonalData(util.Initializable):
         try:
             await exchange_channel.get_chan(octobot_trading.constants.ORDERS_CHANNEL,
                                      self.exchange_manager.id).get_internal_producer() \
-                .send(cryptocurrency=self.exchange_manager.exchange.get_pair_cryptocurrency(order.symbol),
+                .send(cryptocurrency=self.exchange_manager.get_pair_cryptocurrency(order.symbol),
                       symbol=order.symbol,
                       order=order.to_dict(),
                       is_from_bot=order.is_from_this_octobot,
@@ -188,7 +206,7 @@ class ExchangePersonalData(util.Initializable):
             if should_notify:
                 await exchange_channel.get_chan(octobot_trading.constants.TRADES_CHANNEL,
                                          self.exchange_manager.id).get_internal_producer() \
-                    .send(cryptocurrency=self.exchange_manager.exchange.get_pair_cryptocurrency(symbol),
+                    .send(cryptocurrency=self.exchange_manager.get_pair_cryptocurrency(symbol),
                           symbol=symbol,
                           trade=trade.to_dict(),
                           old_trade=False)
@@ -203,7 +221,7 @@ class ExchangePersonalData(util.Initializable):
             if should_notify:
                 await exchange_channel.get_chan(octobot_trading.constants.TRADES_CHANNEL,
                                self.exchange_manager.id).get_internal_producer() \
-                    .send(cryptocurrency=self.exchange_manager.exchange.get_pair_cryptocurrency(trade.symbol),
+                    .send(cryptocurrency=self.exchange_manager.get_pair_cryptocurrency(trade.symbol),
                           symbol=trade.symbol,
                           trade=trade.to_dict(),
                           old_trade=False)
@@ -219,7 +237,7 @@ class ExchangePersonalData(util.Initializable):
                 position_instance = self.positions_manager[position_id]
                 await exchange_channel.get_chan(octobot_trading.constants.POSITIONS_CHANNEL,
                                          self.exchange_manager.id).get_internal_producer() \
-                    .send(cryptocurrency=self.exchange_manager.exchange.get_pair_cryptocurrency(symbol),
+                    .send(cryptocurrency=self.exchange_manager.get_pair_cryptocurrency(symbol),
                           symbol=symbol,
                           position=position_instance.to_dict(),
                           is_updated=changed,
@@ -235,7 +253,7 @@ class ExchangePersonalData(util.Initializable):
             if should_notify:
                 await exchange_channel.get_chan(octobot_trading.constants.POSITIONS_CHANNEL,
                                          self.exchange_manager.id).get_internal_producer() \
-                    .send(cryptocurrency=self.exchange_manager.exchange.get_pair_cryptocurrency(position.symbol),
+                    .send(cryptocurrency=self.exchange_manager.get_pair_cryptocurrency(position.symbol),
                           symbol=position.symbol,
                           position=position,
                           is_updated=changed,
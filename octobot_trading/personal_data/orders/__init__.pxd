@@ -27,6 +27,12 @@ from octobot_trading.personal_data.orders cimport orders_manager
 from octobot_trading.personal_data.orders.orders_manager cimport (
     OrdersManager,
 )
+from octobot_trading.personal_data.orders cimport candle_fill_engine
+from octobot_trading.personal_data.orders.candle_fill_engine cimport (
+    CandleFillEngine,
+    is_handled_order,
+    get_reached_orders_mask,
+)
 
 from octobot_trading.personal_data.orders cimport order_util
 from octobot_trading.personal_data.orders cimport order_adapter
@@ -61,6 +67,9 @@ from octobot_trading.personal_data.orders.channel cimport (
     OrdersProducer,
     OrdersChannel,
     OrdersUpdater,
+    OrdersSyncStrategy,
+    ConcurrentOrdersSyncStrategy,
+    SymbolLessOrdersSyncStrategy,
     OrdersUpdaterSimulator,
 )
 
@@ -73,6 +82,7 @@ from octobot_trading.personal_data.orders.order_util cimport (
     parse_raw_fees,
     parse_order_status,
     parse_is_cancelled,
+    get_raw_order_fingerprint,
 )
 from octobot_trading.personal_data.orders.order_adapter cimport (
     adapt_price,
@@ -100,8 +110,12 @@ __all__ = [
     "parse_raw_fees",
     "parse_order_status",
     "parse_is_cancelled",
+    "get_raw_order_fingerprint",
     "OrderState",
     "OrdersUpdater",
+    "OrdersSyncStrategy",
+    "ConcurrentOrdersSyncStrategy",
+    "SymbolLessOrdersSyncStrategy",
     "adapt_price",
     "adapt_quantity",
     "adapt_order_quantity_because_quantity",
@@ -116,6 +130,9 @@ __all__ = [
     "OrdersProducer",
     "OrdersChannel",
     "OrdersManager",
+    "CandleFillEngine",
+    "is_handled_order",
+    "get_reached_orders_mask",
     "OrdersUpdaterSimulator",
     "CloseOrderState",
     "CancelOrderState",
@@ -52,12 +52,22 @@ from octobot_trading.personal_data.orders.channel import (
     OrdersProducer,
     OrdersChannel,
     OrdersUpdater,
+    OrdersSyncStrategy,
+    ConcurrentOrdersSyncStrategy,
+    SymbolLessOrdersSyncStrategy,
+    create_orders_sync_strategy,
     OrdersUpdaterSimulator,
 )
 from octobot_trading.personal_data.orders import orders_manager
 from octobot_trading.personal_data.orders.orders_manager import (
     OrdersManager,
 )
+from octobot_trading.personal_data.orders import candle_fill_engine
+from octobot_trading.personal_data.orders.candle_fill_engine import (
+    CandleFillEngine,
+    is_handled_order,
+    get_reached_orders_mask,
+)
 from octobot_trading.personal_data.orders import order_util
 from octobot_trading.personal_data.orders.order_util import (
     is_valid,
@@ -68,6 +78,7 @@ from octobot_trading.personal_data.orders.order_util import (
     parse_raw_fees,
     parse_order_status,
     parse_is_cancelled,
+    get_raw_order_fingerprint,
     get_pre_order_data,
 )
 from octobot_trading.personal_data.orders import order_adapter
@@ -110,9 +121,14 @@ __all__ = [
     "parse_raw_fees",
     "parse_order_status",
     "parse_is_cancelled",
+    "get_raw_order_fingerprint",
     "get_pre_order_data",
     "OrderState",
     "OrdersUpdater",
+    "OrdersSyncStrategy",
+    "ConcurrentOrdersSyncStrategy",
+    "SymbolLessOrdersSyncStrategy",
+    "create_orders_sync_strategy",
     "adapt_price",
     "decimal_adapt_price",
     "adapt_quantity",
@@ -136,6 +152,9 @@ __all__ = [
     "OrdersProducer",
     "OrdersChannel",
     "OrdersManager",
+    "CandleFillEngine",
+    "is_handled_order",
+    "get_reached_orders_mask",
     "OrdersUpdaterSimulator",
     "CloseOrderState",
     "CancelOrderState",
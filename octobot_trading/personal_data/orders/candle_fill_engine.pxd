@@ -0,0 +1,29 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+cimport octobot_trading.personal_data.orders.orders_manager as orders_manager
+cimport octobot_trading.personal_data.orders.order as order_class
+
+cdef class CandleFillEngine:
+    cdef object logger
+
+    cdef public orders_manager.OrdersManager orders_manager
+
+    cpdef tuple get_price_thresholds(self, str symbol)
+    cpdef list get_handled_open_orders(self, str symbol)
+
+cpdef bint is_handled_order(order_class.Order order)
+cpdef object get_reached_orders_mask(object prices, object triggers_above, object creation_times,
+                                     double timestamp, double high_price, double low_price)
@@ -0,0 +1,101 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_commons.logging as logging
+
+import octobot_trading.personal_data.orders.types.limit.limit_order as limit_order
+
+
+class CandleFillEngine:
+    """
+    Fills simulated limit based orders (limit, stop loss and take profit orders) by comparing every open order
+    of a symbol with a candle high and low prices at once.
+    Used in backtesting instead of price events triggered by recent trades generated from candles.
+    """
+
+    def __init__(self, orders_manager):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.orders_manager = orders_manager
+
+    async def fill_orders(self, symbol, timestamp, high_price, low_price):
+        """
+        Fill every handled open order of symbol created before timestamp that is reached by the given price range
+        :param symbol: the candle symbol
+        :param timestamp: the candle time
+        :param high_price: the candle high price
+        :param low_price: the candle low price
+        :return: the filled orders
+        """
+        orders = self.get_handled_open_orders(symbol)
+        if not orders:
+            return []
+        reached_orders_mask = get_reached_orders_mask(
+            np.array([float(order.origin_price) for order in orders], dtype=np.float64),
+            np.array([order.trigger_above for order in orders], dtype=bool),
+            np.array([order.creation_time for order in orders], dtype=np.float64),
+            timestamp,
+            float(high_price),
+            float(low_price)
+        )
+        filled_orders = []
+        for index in np.flatnonzero(reached_orders_mask):
+            order = orders[index]
+            if not order.is_open():
+                # closed by a previous fill of this candle (linked order)
+                continue
+            try:
+                await order.on_fill()
+                filled_orders.append(order)
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when filling {order}: {e}")
+        return filled_orders
+
+    def get_price_thresholds(self, symbol):
+        """
+        :return: the (lowest upper trigger price, highest lower trigger price) tuple of the handled open orders
+        of symbol, None values when there is no order in this direction
+        """
+        upper_threshold = lower_threshold = None
+        for order in self.get_handled_open_orders(symbol):
+            if order.trigger_above:
+                if upper_threshold is None or order.origin_price < upper_threshold:
+                    upper_threshold = order.origin_price
+            elif lower_threshold is None or order.origin_price > lower_threshold:
+                lower_threshold = order.origin_price
+        return upper_threshold, lower_threshold
+
+    def get_handled_open_orders(self, symbol):
+        return [
+            order
+            for order in self.orders_manager.get_open_orders(symbol=symbol)
+            if is_handled_order(order)
+        ]
+
+
+def is_handled_order(order):
+    """
+    :return: True when the order is filled by a CandleFillEngine when available
+    """
+    return isinstance(order, limit_order.LimitOrder)
+
+
+def get_reached_orders_mask(prices, triggers_above, creation_times, timestamp, high_price, low_price):
+    """
+    :return: the boolean mask of orders created before timestamp and which price is reached by the given
+    price range: from below for trigger_above orders, from above otherwise
+    """
+    return (creation_times <= timestamp) & np.where(triggers_above, prices <= high_price, prices >= low_price)
@@ -18,6 +18,11 @@ from octobot_trading.personal_data.orders.channel.orders cimport (
     OrdersProducer,
     OrdersChannel,
 )
+from octobot_trading.personal_data.orders.channel.orders_sync_strategy cimport (
+    OrdersSyncStrategy,
+    ConcurrentOrdersSyncStrategy,
+    SymbolLessOrdersSyncStrategy,
+)
 from octobot_trading.personal_data.orders.channel.orders_updater cimport (
     OrdersUpdater,
 )
@@ -30,4 +35,7 @@ __all__ = [
     "OrdersProducer",
     "OrdersChannel",
     "OrdersUpdaterSimulator",
+    "OrdersSyncStrategy",
+    "ConcurrentOrdersSyncStrategy",
+    "SymbolLessOrdersSyncStrategy",
 ]
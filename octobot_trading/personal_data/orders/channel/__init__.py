@@ -20,6 +20,13 @@ from octobot_trading.personal_data.orders.channel.orders import (
     OrdersChannel,
 )
 
+from octobot_trading.personal_data.orders.channel import orders_sync_strategy
+from octobot_trading.personal_data.orders.channel.orders_sync_strategy import (
+    OrdersSyncStrategy,
+    ConcurrentOrdersSyncStrategy,
+    SymbolLessOrdersSyncStrategy,
+    create_orders_sync_strategy,
+)
 from octobot_trading.personal_data.orders.channel import orders_updater
 from octobot_trading.personal_data.orders.channel.orders_updater import (
     OrdersUpdater,
@@ -34,4 +41,8 @@ __all__ = [
     "OrdersProducer",
     "OrdersChannel",
     "OrdersUpdaterSimulator",
+    "OrdersSyncStrategy",
+    "ConcurrentOrdersSyncStrategy",
+    "SymbolLessOrdersSyncStrategy",
+    "create_orders_sync_strategy",
 ]
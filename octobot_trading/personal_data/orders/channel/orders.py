@@ -23,10 +23,19 @@ import octobot_trading.constants as constants
 
 
 class OrdersProducer(exchanges_channel.ExchangeChannelProducer):
-    async def push(self, orders, is_from_bot=False, are_closed=False):
-        await self.perform(orders, is_from_bot=is_from_bot, are_closed=are_closed)
+    async def push(self, orders, is_from_bot=False, are_closed=False, symbol_open_orders=None):
+        await self.perform(orders, is_from_bot=is_from_bot, are_closed=are_closed,
+                           symbol_open_orders=symbol_open_orders)
 
-    async def perform(self, orders, is_from_bot=False, are_closed=False):
+    async def perform(self, orders, is_from_bot=False, are_closed=False, symbol_open_orders=None):
+        """
+        Handle orders updates from exchange
+        :param orders: the order dicts to update
+        :param is_from_bot: If the orders were created by OctoBot
+        :param are_closed: True when orders are closed orders
+        :param symbol_open_orders: every open order dict of the updated symbol when orders only contain a part of them,
+        used to check missing open orders
+        """
         try:
             self.logger.debug(f"Received order update for {len(orders)} orders.")
             symbol = None
@@ -50,7 +59,9 @@ class OrdersProducer(exchanges_channel.ExchangeChannelProducer):
                         await self._handle_open_order_update(symbol, order, order_id, is_from_bot, is_new_order)
 
             if not are_closed:
-                await self.handle_post_open_order_update(symbol, orders, has_new_order)
+                await self.handle_post_open_order_update(
+                    symbol, orders if symbol_open_orders is None else symbol_open_orders, has_new_order
+                )
 
         except asyncio.CancelledError:
             self.logger.info("Update tasks cancelled.")
@@ -68,8 +79,7 @@ class OrdersProducer(exchanges_channel.ExchangeChannelProducer):
         """
         if (await self.channel.exchange_manager.exchange_personal_data.handle_order_update_from_raw(
                 order_id, order, is_new_order=is_new_order, should_notify=False)):
-            await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                            get_pair_cryptocurrency(symbol),
+            await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                             symbol=symbol, order=order,
                             is_from_bot=is_from_bot,
                             is_new=is_new_order,
@@ -169,16 +179,15 @@ class OrdersProducer(exchanges_channel.ExchangeChannelProducer):
         if is_closed:
             # do not push closed orders
             return
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "order": order,
-                "is_new": is_new,
-                "is_from_bot": is_from_bot
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "order": order,
+            "is_new": is_new,
+            "is_from_bot": is_from_bot
+        })
 
 
 class OrdersChannel(exchanges_channel.ExchangeChannel):
@@ -0,0 +1,118 @@
+# pylint: disable=E0611
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+import asyncio
+
+import octobot_commons.logging as logging
+
+import octobot_trading.constants as constants
+import octobot_trading.errors as errors
+
+
+class OrdersSyncStrategy:
+    """
+    Fetches traded symbols open and closed orders from exchange, grouped by symbol
+    """
+
+    def __init__(self, exchange_manager):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.exchange_manager = exchange_manager
+
+    async def fetch_open_orders(self, symbols, limit):
+        """
+        :param symbols: the symbols to fetch open orders for
+        :param limit: the exchange request orders count limit
+        :return: the list of raw open orders of each symbol
+        """
+        raise NotImplementedError("fetch_open_orders is not implemented")
+
+    async def fetch_closed_orders(self, symbols, limit):
+        """
+        :param symbols: the symbols to fetch closed orders for
+        :param limit: the exchange request orders count limit
+        :return: the list of raw closed orders of each symbol
+        """
+        raise NotImplementedError("fetch_closed_orders is not implemented")
+
+
+class ConcurrentOrdersSyncStrategy(OrdersSyncStrategy):
+    """
+    Fetches orders using concurrent symbol requests. Symbols without any known open order are only fetched
+    every FULL_SYNC_INTERVAL open orders syncs (to find orders created from outside this bot).
+    """
+    FULL_SYNC_INTERVAL = 10
+
+    def __init__(self, exchange_manager):
+        super().__init__(exchange_manager)
+        self.open_orders_syncs_count = 0
+
+    async def fetch_open_orders(self, symbols, limit):
+        orders_manager = self.exchange_manager.exchange_personal_data.orders_manager
+        if orders_manager.are_exchange_orders_initialized \
+                and self.open_orders_syncs_count % self.FULL_SYNC_INTERVAL != 0:
+            # known open orders are removed from orders manager when missing on exchange: skip empty symbols
+            symbols = [symbol for symbol in symbols if orders_manager.get_open_orders(symbol=symbol)]
+        self.open_orders_syncs_count += 1
+        return await self._fetch_by_symbol(self.exchange_manager.exchange.get_open_orders, symbols, limit)
+
+    async def fetch_closed_orders(self, symbols, limit):
+        orders_manager = self.exchange_manager.exchange_personal_data.orders_manager
+        return await self._fetch_by_symbol(
+            self.exchange_manager.exchange.get_closed_orders,
+            [symbol for symbol in symbols if orders_manager.get_all_orders(symbol=symbol)],
+            limit
+        )
+
+    async def _fetch_by_symbol(self, fetch_function, symbols, limit):
+        semaphore = asyncio.Semaphore(constants.MAX_CONCURRENT_ORDER_REQUESTS)
+
+        async def _fetch(symbol):
+            async with semaphore:
+                return await fetch_function(symbol=symbol, limit=limit)
+
+        return dict(zip(symbols, await asyncio.gather(*(_fetch(symbol) for symbol in symbols))))
+
+
+class SymbolLessOrdersSyncStrategy(ConcurrentOrdersSyncStrategy):
+    """
+    Fetches every open order using a single symbol-less request, closed orders are fetched by symbol
+    """
+
+    async def fetch_open_orders(self, symbols, limit):
+        open_orders_by_symbol = {symbol: [] for symbol in symbols}
+        # limit is a by symbol limit: don't truncate every symbol open orders
+        for order in await self.exchange_manager.exchange.get_open_orders(symbol=None):
+            order_symbol = self.exchange_manager.get_exchange_symbol(
+                self.exchange_manager.exchange.parse_order_symbol(order)
+            )
+            if order_symbol in open_orders_by_symbol:
+                open_orders_by_symbol[order_symbol].append(order)
+        return open_orders_by_symbol
+
+
+async def create_orders_sync_strategy(exchange_manager, symbols, limit):
+    """
+    Select the cheapest orders sync strategy supported by the exchange
+    :return: the selected strategy and the symbols open orders fetched to select it
+    :raise: any open orders fetching error that doesn't mean that symbol-less open orders fetching is not supported
+    """
+    strategy = SymbolLessOrdersSyncStrategy(exchange_manager)
+    try:
+        return strategy, await strategy.fetch_open_orders(symbols, limit)
+    except errors.NotSupported as e:
+        strategy.logger.debug(f"{exchange_manager.exchange_name} does not support symbol-less open orders "
+                              f"fetching ({e} ({e.__class__.__name__})), fetching open orders by symbol.")
+    strategy = ConcurrentOrdersSyncStrategy(exchange_manager)
+    return strategy, await strategy.fetch_open_orders(symbols, limit)
@@ -17,9 +17,15 @@
 cimport octobot_commons.async_job as async_job
 
 cimport octobot_trading.personal_data.orders.channel.orders as orders_channel
+cimport octobot_trading.personal_data.orders.channel.orders_sync_strategy as orders_sync_strategy
 
 
 cdef class OrdersUpdater(orders_channel.OrdersProducer):
     cdef async_job.AsyncJob open_orders_job
     cdef async_job.AsyncJob closed_orders_job
     cdef async_job.AsyncJob order_update_job
+
+    cdef public orders_sync_strategy.OrdersSyncStrategy sync_strategy
+    cdef public dict open_orders_fingerprints
+
+    cdef list _get_updated_open_orders(self, str symbol, list open_orders)
@@ -20,6 +20,8 @@ import octobot_commons.async_job as async_job
 
 import octobot_trading.errors as errors
 import octobot_trading.personal_data.orders.channel.orders as orders_channel
+import octobot_trading.personal_data.orders.channel.orders_sync_strategy as orders_sync_strategy
+import octobot_trading.personal_data.orders.order_util as order_util
 import octobot_trading.constants as constants
 
 
@@ -38,6 +40,10 @@ class OrdersUpdater(orders_channel.OrdersProducer):
 
     def __init__(self, channel):
         super().__init__(channel)
+        # selected on first open orders fetch
+        self.sync_strategy = None
+        # fingerprints of the last fetched open orders by order id by symbol
+        self.open_orders_fingerprints = {}
 
         # create async jobs
         self.open_orders_job = async_job.AsyncJob(self._open_orders_fetch_and_push,
@@ -96,23 +102,54 @@ class OrdersUpdater(orders_channel.OrdersProducer):
         :param is_from_bot: True if the order was created by OctoBot
         :param limit: the exchange request orders count limit
         """
-        for symbol in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-            open_orders: list = await self.channel.exchange_manager.exchange.get_open_orders(symbol=symbol, limit=limit)
-            if open_orders:
-                await self.push(orders=list(map(self.channel.exchange_manager.exchange.clean_order, open_orders)),
-                                is_from_bot=is_from_bot)
+        symbols = self.channel.exchange_manager.exchange_config.traded_symbol_pairs
+        if self.sync_strategy is None:
+            self.sync_strategy, open_orders_by_symbol = await orders_sync_strategy.create_orders_sync_strategy(
+                self.channel.exchange_manager, symbols, limit
+            )
+        else:
+            open_orders_by_symbol = await self.sync_strategy.fetch_open_orders(symbols, limit)
+        for symbol, open_orders in open_orders_by_symbol.items():
+            open_orders = list(map(self.channel.exchange_manager.exchange.clean_order, open_orders))
+            updated_orders = self._get_updated_open_orders(symbol, open_orders)
+            if updated_orders:
+                await self.push(orders=updated_orders, is_from_bot=is_from_bot, symbol_open_orders=open_orders)
             else:
+                # nothing changed: only check for missing orders
                 await self.handle_post_open_order_update(symbol, open_orders, False)
 
+    def _get_updated_open_orders(self, symbol, open_orders):
+        """
+        Select new and updated open orders since the previous fetch and store the given orders fingerprints
+        :param symbol: the orders symbol
+        :param open_orders: the fetched open order dicts
+        :return: the open order dicts to update
+        """
+        previous_fingerprints = self.open_orders_fingerprints.get(symbol, {})
+        fingerprints = {}
+        updated_orders = []
+        orders_manager = self.channel.exchange_manager.exchange_personal_data.orders_manager
+        for open_order in open_orders:
+            order_id = self.channel.exchange_manager.exchange.parse_order_id(open_order)
+            fingerprint = order_util.get_raw_order_fingerprint(open_order)
+            fingerprints[order_id] = fingerprint
+            if previous_fingerprints.get(order_id, None) != fingerprint or not orders_manager.has_order(order_id):
+                updated_orders.append(open_order)
+        self.open_orders_fingerprints[symbol] = fingerprints
+        return updated_orders
+
     async def _closed_orders_fetch_and_push(self, limit=ORDERS_UPDATE_LIMIT) -> None:
         """
         Update closed orders from exchange
         :param limit: the exchange request orders count limit
         """
-        for symbol in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-            close_orders: list = await self.channel.exchange_manager.exchange.get_closed_orders(
-                symbol=symbol, limit=limit)
-
+        sync_strategy = self.sync_strategy or orders_sync_strategy.ConcurrentOrdersSyncStrategy(
+            self.channel.exchange_manager
+        )
+        closed_orders_by_symbol = await sync_strategy.fetch_closed_orders(
+            self.channel.exchange_manager.exchange_config.traded_symbol_pairs, limit
+        )
+        for close_orders in closed_orders_by_symbol.values():
             if close_orders:
                 await self.push(orders=list(map(self.channel.exchange_manager.exchange.clean_order, close_orders)),
                                 are_closed=True)
@@ -15,9 +15,11 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
-cpdef object decimal_adapt_price(dict symbol_market, object price)
-cpdef object decimal_adapt_quantity(dict symbol_market, object quantity)
-cpdef list decimal_adapt_order_quantity_because_quantity(object limiting_value, object max_value, object quantity_to_adapt, object price, dict symbol_market)
-cpdef list decimal_adapt_order_quantity_because_price(object limiting_value, object max_value, object price, dict symbol_market)
-cpdef list decimal_split_orders(object total_order_price, object max_cost, object valid_quantity, object max_quantity, object price, object quantity, dict symbol_market)
-cpdef decimal_check_and_adapt_order_details_if_necessary(object quantity, object price, dict symbol_market, object fixed_symbol_data=*)
+cimport octobot_trading.util.fixed_point as fixed_point
+
+cpdef object decimal_adapt_price(dict symbol_market, object price, fixed_point.MarketFixedPoint market_fixed_point=*)
+cpdef object decimal_adapt_quantity(dict symbol_market, object quantity, fixed_point.MarketFixedPoint market_fixed_point=*)
+cpdef list decimal_adapt_order_quantity_because_quantity(object limiting_value, object max_value, object quantity_to_adapt, object price, dict symbol_market, fixed_point.MarketFixedPoint market_fixed_point=*)
+cpdef list decimal_adapt_order_quantity_because_price(object limiting_value, object max_value, object price, dict symbol_market, fixed_point.MarketFixedPoint market_fixed_point=*)
+cpdef list decimal_split_orders(object total_order_price, object max_cost, object valid_quantity, object max_quantity, object price, object quantity, dict symbol_market, fixed_point.MarketFixedPoint market_fixed_point=*)
+cpdef decimal_check_and_adapt_order_details_if_necessary(object quantity, object price, dict symbol_market, object fixed_symbol_data=*, fixed_point.MarketFixedPoint market_fixed_point=*)
@@ -22,14 +22,18 @@ import octobot_trading.personal_data as personal_data
 from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
 
 
-def decimal_adapt_price(symbol_market, price):
+def decimal_adapt_price(symbol_market, price, market_fixed_point=None):
+    if market_fixed_point is not None:
+        return market_fixed_point.adapt_price(price)
     maximal_price_digits = symbol_market[Ecmsc.PRECISION.value].get(
                                                 Ecmsc.PRECISION_PRICE.value,
                                                 constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS)
     return decimal_trunc_with_n_decimal_digits(price, maximal_price_digits)
 
 
-def decimal_adapt_quantity(symbol_market, quantity):
+def decimal_adapt_quantity(symbol_market, quantity, market_fixed_point=None):
+    if market_fixed_point is not None:
+        return market_fixed_point.adapt_quantity(quantity)
     maximal_volume_digits = symbol_market[Ecmsc.PRECISION.value].get(
                                                  Ecmsc.PRECISION_AMOUNT.value, 0)
     return decimal_trunc_with_n_decimal_digits(quantity, maximal_volume_digits)
@@ -48,7 +52,8 @@ def decimal_trunc_with_n_decimal_digits(value, digits):  # TODO migrate to commo
         return value
 
 
-def decimal_adapt_order_quantity_because_quantity(limiting_value, max_value, quantity_to_adapt, price, symbol_market):
+def decimal_adapt_order_quantity_because_quantity(limiting_value, max_value, quantity_to_adapt, price, symbol_market,
+                                                  market_fixed_point=None):
     orders = []
     nb_full_orders = limiting_value // max_value
     rest_order_quantity = limiting_value % max_value
@@ -56,30 +61,32 @@ def decimal_adapt_order_quantity_because_quantity(limiting_value, max_value, qua
 
     if rest_order_quantity > constants.ZERO:
         after_rest_quantity_to_adapt -= rest_order_quantity
-        valid_last_order_quantity = decimal_adapt_quantity(symbol_market, rest_order_quantity)
+        valid_last_order_quantity = decimal_adapt_quantity(symbol_market, rest_order_quantity, market_fixed_point)
         orders.append((valid_last_order_quantity, price))
 
     other_orders_quantity = (after_rest_quantity_to_adapt + max_value) / (nb_full_orders + constants.ONE)
-    valid_other_orders_quantity = decimal_adapt_quantity(symbol_market, other_orders_quantity)
+    valid_other_orders_quantity = decimal_adapt_quantity(symbol_market, other_orders_quantity, market_fixed_point)
     orders += [(valid_other_orders_quantity, price)] * int(nb_full_orders)
     return orders
 
 
-def decimal_adapt_order_quantity_because_price(limiting_value, max_value, price, symbol_market):
+def decimal_adapt_order_quantity_because_price(limiting_value, max_value, price, symbol_market,
+                                               market_fixed_point=None):
     orders = []
     nb_full_orders = limiting_value // max_value
     rest_order_cost = limiting_value % max_value
     if rest_order_cost > constants.ZERO:
-        valid_last_order_quantity = decimal_adapt_quantity(symbol_market, rest_order_cost / price)
+        valid_last_order_quantity = decimal_adapt_quantity(symbol_market, rest_order_cost / price, market_fixed_point)
         orders.append((valid_last_order_quantity, price))
 
     other_orders_quantity = max_value / price
-    valid_other_orders_quantity = decimal_adapt_quantity(symbol_market, other_orders_quantity)
+    valid_other_orders_quantity = decimal_adapt_quantity(symbol_market, other_orders_quantity, market_fixed_point)
     orders += [(valid_other_orders_quantity, price)] * int(nb_full_orders)
     return orders
 
 
-def decimal_split_orders(total_order_price, max_cost, valid_quantity, max_quantity, price, quantity, symbol_market):
+def decimal_split_orders(total_order_price, max_cost, valid_quantity, max_quantity, price, quantity, symbol_market,
+                         market_fixed_point=None):
     """
     Splits too big orders into multiple ones according to the max_cost and max_quantity
     :param total_order_price:
@@ -89,6 +96,7 @@ def decimal_split_orders(total_order_price, max_cost, valid_quantity, max_quanti
     :param price:
     :param quantity:
     :param symbol_market:
+    :param market_fixed_point: the symbol MarketFixedPoint to adapt quantities with, ignored when None
     :return:
     """
     if max_cost is None and max_quantity is None:
@@ -104,24 +112,29 @@ def decimal_split_orders(total_order_price, max_cost, valid_quantity, max_quanti
     if nb_orders_according_to_cost is None:
         # can only split using quantity
         return decimal_adapt_order_quantity_because_quantity(valid_quantity, max_quantity,
-                                                             quantity, price, symbol_market)
+                                                             quantity, price, symbol_market, market_fixed_point)
     elif nb_orders_according_to_quantity is None:
         # can only split using price
-        return decimal_adapt_order_quantity_because_price(total_order_price, max_cost, price, symbol_market)
+        return decimal_adapt_order_quantity_because_price(total_order_price, max_cost, price, symbol_market,
+                                                          market_fixed_point)
     else:
         if nb_orders_according_to_cost > nb_orders_according_to_quantity:
-            return decimal_adapt_order_quantity_because_price(total_order_price, max_cost, price, symbol_market)
+            return decimal_adapt_order_quantity_because_price(total_order_price, max_cost, price, symbol_market,
+                                                              market_fixed_point)
         return decimal_adapt_order_quantity_because_quantity(valid_quantity, max_quantity,
-                                                             quantity, price, symbol_market)
+                                                             quantity, price, symbol_market, market_fixed_point)
 
 
-def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_market, fixed_symbol_data=False):
+def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_market, fixed_symbol_data=False,
+                                                       market_fixed_point=None):
     """
     Checks if order attributes are valid and try to fix it if not
     :param quantity:
     :param price:
     :param symbol_market:
     :param fixed_symbol_data:
+    :param market_fixed_point: the symbol_market MarketFixedPoint to adapt quantities and prices with,
+    ignored when None
     :return:
     """
     if quantity.is_nan() or price.is_nan() or price == constants.ZERO:
@@ -142,8 +155,8 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
             max_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MAX.value, math.nan)))
 
         # adapt digits if necessary
-        valid_quantity = decimal_adapt_quantity(symbol_market, quantity)
-        valid_price = decimal_adapt_price(symbol_market, price)
+        valid_quantity = decimal_adapt_quantity(symbol_market, quantity, market_fixed_point)
+        valid_price = decimal_adapt_price(symbol_market, price, market_fixed_point)
 
         total_order_price = valid_quantity * valid_price
 
@@ -168,7 +181,7 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
                     (max_quantity is not None and valid_quantity > max_quantity):
                 # split quantity into smaller orders
                 return decimal_split_orders(total_order_price, max_cost, valid_quantity,
-                                            max_quantity, valid_price, quantity, symbol_market)
+                                            max_quantity, valid_price, quantity, symbol_market, market_fixed_point)
 
             else:
                 # valid order that can be handled by the exchange
@@ -190,7 +203,8 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
             elif max_quantity is not None and valid_quantity > max_quantity:
                 # split quantity into smaller orders
                 return decimal_adapt_order_quantity_because_quantity(valid_quantity, max_quantity,
-                                                                     quantity, valid_price, symbol_market)
+                                                                     quantity, valid_price, symbol_market,
+                                                                     market_fixed_point)
             else:
                 # valid order that can be handled wy the exchange
                 return [(valid_quantity, valid_price)]
@@ -198,6 +212,7 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
     if not fixed_symbol_data:
         # case 2: try fixing data from exchanges
         fixed_data = exchanges.ExchangeMarketStatusFixer(symbol_market, float(price)).market_status
+        # fixed_data precision can differ from market_fixed_point one: don't use market_fixed_point
         return decimal_check_and_adapt_order_details_if_necessary(quantity, price, fixed_data,
                                                                   fixed_symbol_data=True)
     else:
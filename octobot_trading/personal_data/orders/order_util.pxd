@@ -23,3 +23,4 @@ cpdef object get_fees_for_currency(object fee, str currency)
 cpdef dict parse_raw_fees(object raw_fees)
 cpdef object parse_order_status(dict raw_order)
 cpdef bint parse_is_cancelled(dict raw_order)
+cpdef tuple get_raw_order_fingerprint(dict raw_order)
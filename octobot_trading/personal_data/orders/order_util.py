@@ -16,7 +16,6 @@
 import asyncio
 import decimal
 
-import octobot_commons.symbol_util as symbol_util
 import octobot_commons.logging as logging
 import octobot_trading.constants as constants
 import octobot_trading.enums as enums
@@ -101,9 +100,11 @@ async def get_pre_order_data(exchange_manager, symbol: str, timeout: int = None)
             .prices_manager.get_mark_price(timeout=timeout)
     except asyncio.TimeoutError:
         raise asyncio.TimeoutError("Mark price is not available")
-    decimal_mark_price = decimal.Decimal(str(mark_price))
+    market_fixed_point = exchange_manager.get_market_fixed_point(symbol)
+    decimal_mark_price = decimal.Decimal(str(mark_price)) if market_fixed_point is None \
+        else market_fixed_point.price.float_to_decimal(mark_price)
 
-    currency, market = symbol_util.split_symbol(symbol)
+    currency, market = exchange_manager.get_exchange_quote_and_base(symbol)
 
     current_symbol_holding = exchange_manager.exchange_personal_data.portfolio_manager.portfolio\
         .get_currency_portfolio(currency)
@@ -144,3 +145,23 @@ def parse_order_status(raw_order):
 
 def parse_is_cancelled(raw_order):
     return parse_order_status(raw_order) in {enums.OrderStatus.CANCELED, enums.OrderStatus.CLOSED}
+
+
+def get_raw_order_fingerprint(raw_order):
+    """
+    :return: a tuple identifying the raw order values that can change while the order is open: two raw orders
+    with the same fingerprint lead to the same order update
+    """
+    fee = raw_order.get(enums.ExchangeConstantsOrderColumns.FEE.value, None)
+    if fee:
+        fee = (fee.get(enums.FeePropertyColumns.COST.value, None),
+               fee.get(enums.FeePropertyColumns.CURRENCY.value, None)) if isinstance(fee, dict) else str(fee)
+    return (
+        raw_order.get(enums.ExchangeConstantsOrderColumns.STATUS.value, None),
+        raw_order.get(enums.ExchangeConstantsOrderColumns.FILLED.value, None),
+        raw_order.get(enums.ExchangeConstantsOrderColumns.AMOUNT.value, None),
+        raw_order.get(enums.ExchangeConstantsOrderColumns.PRICE.value, None),
+        raw_order.get(enums.ExchangeConstantsOrderColumns.AVERAGE.value, None),
+        raw_order.get(enums.ExchangeConstantsOrderColumns.COST.value, None),
+        fee,
+    )
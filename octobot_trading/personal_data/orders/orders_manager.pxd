@@ -27,10 +27,17 @@ cdef class OrdersManager(util.Initializable):
     cdef exchanges.Trader trader
 
     cdef public object orders
+    cdef public dict orders_by_symbol
+    cdef public object open_orders
+    cdef public dict open_orders_by_symbol
     cdef public bint are_exchange_orders_initialized
 
     cdef void _reset_orders(self)
     cdef void _check_orders_size(self)
+    cdef void _add_order(self, str order_id, order_class.Order order)
+    cdef void _remove_order(self, order_class.Order order)
+    cdef void _index_open_order(self, order_class.Order order)
+    cdef void _unindex_open_order(self, order_class.Order order)
     cdef void _remove_oldest_orders(self, int nb_to_remove)
     cdef list _select_orders(self, object state=*, str symbol=*, int since=*, int limit=*)
 
@@ -42,4 +49,7 @@ cdef class OrdersManager(util.Initializable):
     cpdef list get_all_orders(self, str symbol=*, int since=*, int limit=*)
     cpdef list get_open_orders(self, str symbol=*, int since=*, int limit=*)
     cpdef list get_closed_orders(self, str symbol=*, int since=*, int limit=*)
+    cpdef int get_open_orders_count(self, str symbol=*)
     cpdef void clear(self)
+
+cdef list _limit_orders(list orders, int limit)
@@ -34,6 +34,10 @@ class OrdersManager(util.Initializable):
         self.trader = trader
         self.orders_initialized = False  # TODO
         self.orders = collections.OrderedDict()
+        # secondary indexes: orders by symbol and open orders, in self.orders order
+        self.orders_by_symbol = {}
+        self.open_orders = collections.OrderedDict()
+        self.open_orders_by_symbol = {}
         # if this the orders manager completed the initial exchange orders sync phase (only on real trader)
         self.are_exchange_orders_initialized = self.trader.simulate
 
@@ -47,7 +51,7 @@ class OrdersManager(util.Initializable):
         return self._select_orders(None, symbol=symbol, since=since, limit=limit)
 
     def get_open_orders(self, symbol=None, since=-1, limit=-1):
-        return self._select_orders(enums.OrderStatus.OPEN, symbol, since, limit)
+        return _limit_orders(list(self.iter_open_orders(symbol, since)), limit)
 
     def get_closed_orders(self, symbol=None, since=-1, limit=-1):
         return self._select_orders(enums.OrderStatus.CLOSED, symbol, since, limit)
@@ -55,37 +59,67 @@ class OrdersManager(util.Initializable):
     def get_order(self, order_id):
         return self.orders[order_id]
 
+    def iter_orders(self, symbol=None):
+        """
+        Iterate over orders without copying them, orders should not be added or removed while iterating
+        :param symbol: the orders symbol, every symbol when None
+        """
+        return iter((self.orders if symbol is None else self.orders_by_symbol.get(symbol, {})).values())
+
+    def iter_open_orders(self, symbol=None, since=-1):
+        """
+        Iterate over open orders without copying them, orders should not be added or removed while iterating
+        :param symbol: the orders symbol, every symbol when None
+        :param since: the orders maximum timestamp, ignored when -1
+        """
+        no_longer_open_orders = []
+        for order in (self.open_orders if symbol is None else self.open_orders_by_symbol.get(symbol, {})).values():
+            if order.status is not enums.OrderStatus.OPEN:
+                # status changed since this order was indexed
+                no_longer_open_orders.append(order)
+            elif since == -1 or (since and order.timestamp < since):
+                yield order
+        for order in no_longer_open_orders:
+            self._unindex_open_order(order)
+
+    def get_open_orders_count(self, symbol=None):
+        return sum(1 for _ in self.iter_open_orders(symbol))
+
     async def upsert_order_from_raw(self, order_id, raw_order) -> bool:
         if not self.has_order(order_id):
             self.logger.debug(f"Creating new order from exchange data: {raw_order}")
             new_order = order_factory.create_order_instance_from_raw(self.trader, raw_order)
-            self.orders[order_id] = new_order
+            self._add_order(order_id, new_order)
             await new_order.initialize(is_from_exchange_data=True)
             self._check_orders_size()
             return True
-        return await _update_order_from_raw(self.orders[order_id], raw_order)
+        order = self.orders[order_id]
+        updated = await _update_order_from_raw(order, raw_order)
+        self._index_open_order(order)
+        return updated
 
     async def upsert_order_close_from_raw(self, order_id, raw_order) -> typing.Optional[order_class.Order]:
         if self.has_order(order_id):
             order = self.orders[order_id]
             await _update_order_from_raw(self.orders[order_id], raw_order)
+            self._index_open_order(order)
             return order
         return None
 
     def upsert_order_instance(self, order) -> bool:
         if not self.has_order(order.order_id):
-            self.orders[order.order_id] = order
+            self._add_order(order.order_id, order)
             self._check_orders_size()
             return True
         # TODO
         return False
 
     def has_order(self, order_id) -> bool:
-        return order_id in set(self.orders.keys())
+        return order_id in self.orders
 
     def remove_order_instance(self, order):
         if self.has_order(order.order_id):
-            self.orders.pop(order.order_id, None)
+            self._remove_order(self.orders[order.order_id])
             order.clear()
         else:
             self.logger.warning(f"Attempt to remove an order that is not in orders_manager: "
@@ -97,6 +131,37 @@ class OrdersManager(util.Initializable):
     def _reset_orders(self):
         self.orders_initialized = False
         self.orders = collections.OrderedDict()
+        self.orders_by_symbol = {}
+        self.open_orders = collections.OrderedDict()
+        self.open_orders_by_symbol = {}
+
+    def _add_order(self, order_id, order):
+        self.orders[order_id] = order
+        self.orders_by_symbol.setdefault(order.symbol, collections.OrderedDict())[order_id] = order
+        self._index_open_order(order)
+
+    def _remove_order(self, order):
+        order_id = order.order_id
+        self.orders.pop(order_id, None)
+        self._unindex_open_order(order)
+        symbol_orders = self.orders_by_symbol.get(order.symbol, None)
+        if symbol_orders is not None:
+            symbol_orders.pop(order_id, None)
+            if not symbol_orders:
+                self.orders_by_symbol.pop(order.symbol, None)
+
+    def _index_open_order(self, order):
+        if order.status is enums.OrderStatus.OPEN and order.order_id not in self.open_orders:
+            self.open_orders[order.order_id] = order
+            self.open_orders_by_symbol.setdefault(order.symbol, collections.OrderedDict())[order.order_id] = order
+
+    def _unindex_open_order(self, order):
+        if self.open_orders.pop(order.order_id, None) is not None:
+            symbol_open_orders = self.open_orders_by_symbol.get(order.symbol, None)
+            if symbol_open_orders is not None:
+                symbol_open_orders.pop(order.order_id, None)
+                if not symbol_open_orders:
+                    self.open_orders_by_symbol.pop(order.symbol, None)
 
     def _check_orders_size(self):
         if self.MAX_ORDERS_COUNT and len(self.orders) > self.MAX_ORDERS_COUNT:
@@ -105,18 +170,17 @@ class OrdersManager(util.Initializable):
     def _select_orders(self, state=None, symbol=None, since=-1, limit=-1):
         orders = [
             order
-            for order in self.orders.values()
+            for order in self.iter_orders(symbol)
             if (
                     (state is None or order.status == state) and
-                    (symbol is None or (symbol and order.symbol == symbol)) and
                     (since == -1 or (since and order.timestamp < since))
             )
         ]
-        return orders if limit == -1 else orders[0:limit]
+        return _limit_orders(orders, limit)
 
     def _remove_oldest_orders(self, nb_to_remove):
         for _ in range(nb_to_remove):
-            self.orders.popitem(last=False)
+            self._remove_order(next(iter(self.orders.values())))
 
     def clear(self):
         for order in self.orders.values():
@@ -124,6 +188,10 @@ class OrdersManager(util.Initializable):
         self._reset_orders()
 
 
+def _limit_orders(orders, limit):
+    return orders if limit == -1 else orders[0:limit]
+
+
 async def _update_order_from_raw(order, raw_order):
     """
     Calling order update from raw method
@@ -27,6 +27,9 @@ class LimitOrder(order_class.Order):
         self.trigger_above = self.side is enums.TradeOrderSide.SELL
 
     async def update_order_status(self, force_refresh=False):
+        if self.exchange_manager.exchange_personal_data.candle_fill_engine is not None:
+            # filled by the candle fill engine
+            return
         if self.limit_price_hit_event is None:
             self.limit_price_hit_event = self.exchange_manager.exchange_symbols_data.\
                 get_exchange_symbol_data(self.symbol).price_events_manager.\
@@ -35,6 +35,7 @@ from octobot_trading.personal_data.portfolios import portfolio_profitability
 from octobot_trading.personal_data.portfolios import sub_portfolio
 from octobot_trading.personal_data.portfolios import portfolio_manager
 from octobot_trading.personal_data.portfolios import portfolio_value_holder
+from octobot_trading.personal_data.portfolios import currency_conversion_graph
 from octobot_trading.personal_data.portfolios import types
 from octobot_trading.personal_data.portfolios import portfolio_util
 
@@ -54,6 +55,9 @@ from octobot_trading.personal_data.portfolios.portfolio_manager import (
 from octobot_trading.personal_data.portfolios.portfolio_value_holder import (
     PortfolioValueHolder,
 )
+from octobot_trading.personal_data.portfolios.currency_conversion_graph import (
+    CurrencyConversionGraph,
+)
 from octobot_trading.personal_data.portfolios.types import (
     FuturePortfolio,
     MarginPortfolio,
@@ -80,6 +84,7 @@ __all__ = [
     "SubPortfolio",
     "PortfolioManager",
     "PortfolioValueHolder",
+    "CurrencyConversionGraph",
     "FuturePortfolio",
     "MarginPortfolio",
     "SpotPortfolio",
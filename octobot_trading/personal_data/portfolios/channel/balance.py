@@ -40,12 +40,11 @@ class BalanceProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, balance):
-        for consumer in self.channel.get_filtered_consumers():
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "balance": balance
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "balance": balance
+        })
 
     async def refresh_real_trader_portfolio(self, force_manual_refresh=False) -> bool:
         if self.channel.exchange_manager.is_simulated:
@@ -92,15 +91,14 @@ class BalanceProfitabilityProducer(exchanges_channel.ExchangeChannelProducer):
     async def send(self, profitability, profitability_percent,
                    market_profitability_percent,
                    initial_portfolio_current_profitability):
-        for consumer in self.channel.get_filtered_consumers():
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "profitability": profitability,
-                "profitability_percent": profitability_percent,
-                "market_profitability_percent": market_profitability_percent,
-                "initial_portfolio_current_profitability": initial_portfolio_current_profitability
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "profitability": profitability,
+            "profitability_percent": profitability_percent,
+            "market_profitability_percent": market_profitability_percent,
+            "initial_portfolio_current_profitability": initial_portfolio_current_profitability
+        })
 
 
 class BalanceProfitabilityChannel(exchanges_channel.ExchangeChannel):
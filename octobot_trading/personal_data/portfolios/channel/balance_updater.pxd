@@ -23,3 +23,6 @@ cdef class BalanceProfitabilityUpdater(portfolios_channel.BalanceProfitabilityPr
     cdef object exchange_personal_data
     cdef object balance_consumer
     cdef object mark_price_consumer
+    cdef public object update_delay
+    cdef public dict pending_mark_prices
+    cdef public object update_task
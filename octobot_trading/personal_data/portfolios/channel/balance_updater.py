@@ -93,6 +93,13 @@ class BalanceProfitabilityUpdater(portfolios_channel.BalanceProfitabilityProduce
         self.balance_consumer = None
         self.mark_price_consumer = None
 
+        # mark price updates are coalesced: latest mark price by symbol waiting for the next profitability update
+        # (disabled in backtesting to keep simulations deterministic)
+        self.update_delay = None if self.channel.exchange_manager.is_backtesting \
+            else constants.BALANCE_PROFITABILITY_UPDATE_DELAY
+        self.pending_mark_prices = {}
+        self.update_task = None
+
     async def start(self) -> None:
         """
         Starts the balance profitability subscribing process
@@ -109,6 +116,10 @@ class BalanceProfitabilityUpdater(portfolios_channel.BalanceProfitabilityProduce
         Stop and remove the balance profitability consumers
         """
         await super().stop()
+        if self.update_task is not None and not self.update_task.done():
+            self.update_task.cancel()
+        self.update_task = None
+        self.pending_mark_prices = {}
         try:
             await exchange_channel.get_chan(
                 constants.BALANCE_CHANNEL, self.channel.exchange_manager.id
@@ -136,6 +147,8 @@ class BalanceProfitabilityUpdater(portfolios_channel.BalanceProfitabilityProduce
         :param balance: the balance dict
         """
         try:
+            # balance updates require up-to-date prices
+            await self.update_pending_mark_prices(should_notify=False)
             await self.exchange_personal_data.handle_portfolio_profitability_update(
                 balance=balance, mark_price=None, symbol=None
             )
@@ -159,8 +172,35 @@ class BalanceProfitabilityUpdater(portfolios_channel.BalanceProfitabilityProduce
         :param mark_price: the mark price
         """
         try:
+            if self.update_delay is None:
+                await self.exchange_personal_data.handle_portfolio_profitability_update(
+                    symbol=symbol, mark_price=mark_price, balance=None
+                )
+            else:
+                self.pending_mark_prices[symbol] = mark_price
+                if self.update_task is None or self.update_task.done():
+                    self.update_task = asyncio.create_task(self._delayed_mark_prices_update())
+        except Exception as e:
+            self.logger.exception(e, True, f"Fail to handle mark price update : {e}")
+
+    async def update_pending_mark_prices(self, should_notify=True) -> None:
+        """
+        Update profitability using every pending mark price
+        :param should_notify: when True, notify profitability once if a mark price has been processed
+        """
+        pending_mark_prices, self.pending_mark_prices = self.pending_mark_prices, {}
+        for symbol, mark_price in pending_mark_prices.items():
+            await self.exchange_personal_data.handle_portfolio_profitability_update(
+                symbol=symbol, mark_price=mark_price, balance=None, should_notify=False
+            )
+        if should_notify and pending_mark_prices:
             await self.exchange_personal_data.handle_portfolio_profitability_update(
-                symbol=symbol, mark_price=mark_price, balance=None
+                symbol=None, mark_price=None, balance=None, should_notify=True
             )
+
+    async def _delayed_mark_prices_update(self) -> None:
+        await asyncio.sleep(self.update_delay)
+        try:
+            await self.update_pending_mark_prices()
         except Exception as e:
-            self.logger.exception(e, True, f"Fail to handle mark price update : {e}")
+            self.logger.exception(e, True, f"Fail to handle mark price updates : {e}")
@@ -0,0 +1,39 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class CurrencyConversionGraph:
+    cdef public str reference_market
+    cdef public object symbols_registry
+    cdef public int symbols_count
+    cdef public int max_conversion_hops
+    cdef public list bridge_currencies
+
+    cdef public dict edges_by_currency
+    cdef public dict conversion_paths
+    cdef public dict currencies_by_symbol
+    cdef public dict cached_values
+
+    cpdef object get_conversion_path(self, str currency)
+    cpdef set get_dependent_currencies(self, str symbol)
+    cpdef object get_currency_value(self, str currency, dict last_prices_by_trading_pair)
+    cpdef void on_price_update(self, str symbol)
+    cpdef void clear_cached_values(self)
+
+    cdef void _build(self, list symbols)
+    cdef void _compute_conversion_paths(self)
+    cdef str _get_base(self, str symbol)
+    cdef int _get_bridge_rank(self, str currency)
@@ -0,0 +1,152 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_trading.constants as constants
+
+
+class CurrencyConversionGraph:
+    """
+    CurrencyConversionGraph stores the shortest conversion path from each currency to the reference market using
+    the exchange trading pairs. Paths are computed once and going through bridge currencies is preferred when
+    several paths have the same length.
+    Currencies values are cached and only recomputed when the price of one of their path trading pairs is updated.
+    """
+
+    def __init__(self, symbols, reference_market, symbols_registry,
+                 max_conversion_hops=constants.MAX_CURRENCY_CONVERSION_HOPS,
+                 bridge_currencies=constants.CURRENCY_CONVERSION_BRIDGE_CURRENCIES):
+        """
+        :param symbols: the exchange trading pairs
+        :param reference_market: the currency to convert currencies into
+        :param symbols_registry: the exchange SymbolsRegistry used to split trading pairs
+        :param max_conversion_hops: the maximum count of trading pairs in a conversion path
+        :param bridge_currencies: the intermediate currencies to use first, by order of preference
+        """
+        self.reference_market = reference_market
+        self.symbols_registry = symbols_registry
+        self.symbols_count = len(symbols)
+        self.max_conversion_hops = max_conversion_hops
+        self.bridge_currencies = list(bridge_currencies)
+
+        # (other currency, trading pair) tuples by currency
+        self.edges_by_currency = {}
+        # tuple of (trading pair, is_reversed) conversion legs from each currency to the reference market
+        self.conversion_paths = {}
+        # currencies using each trading pair in their conversion path
+        self.currencies_by_symbol = {}
+        # values in decimal.Decimal
+        self.cached_values = {}
+
+        self._build(symbols)
+
+    def get_conversion_path(self, currency):
+        """
+        :param currency: the currency to convert
+        :return: the (trading pair, is_reversed) conversion legs, None when the currency can't be converted
+        """
+        return self.conversion_paths.get(currency, None)
+
+    def get_dependent_currencies(self, symbol):
+        """
+        :param symbol: the trading pair
+        :return: the currencies using symbol in their conversion path
+        """
+        return self.currencies_by_symbol.get(symbol, set())
+
+    def get_currency_value(self, currency, last_prices_by_trading_pair):
+        """
+        :param currency: the currency to evaluate
+        :param last_prices_by_trading_pair: the last price of trading pairs in decimal.Decimal
+        :return: the value of one currency unit in reference market, None when the currency can't be converted
+        :raise KeyError: when the price of a conversion path trading pair is missing or zero while being required
+        """
+        try:
+            return self.cached_values[currency]
+        except KeyError:
+            pass
+        conversion_path = self.conversion_paths.get(currency, None)
+        if conversion_path is None:
+            return None
+        value = constants.ONE
+        for symbol, is_reversed in conversion_path:
+            price = last_prices_by_trading_pair[symbol]
+            if is_reversed:
+                if price == constants.ZERO:
+                    raise KeyError(symbol)
+                value /= price
+            else:
+                value *= price
+        self.cached_values[currency] = value
+        return value
+
+    def on_price_update(self, symbol):
+        """
+        Invalidate the cached values of the currencies using symbol in their conversion path
+        :param symbol: the updated trading pair
+        """
+        for currency in self.get_dependent_currencies(symbol):
+            self.cached_values.pop(currency, None)
+
+    def clear_cached_values(self):
+        self.cached_values.clear()
+
+    def _build(self, symbols):
+        for symbol in symbols:
+            base, quote = self.symbols_registry.get_base_and_quote(symbol)
+            self.edges_by_currency.setdefault(base, []).append((quote, symbol))
+            self.edges_by_currency.setdefault(quote, []).append((base, symbol))
+        for currency, edges in self.edges_by_currency.items():
+            # prefer trading pairs quoted in the currency to convert into
+            self.edges_by_currency[currency] = [
+                (other_currency, symbol)
+                for _, symbol, other_currency in sorted([
+                    (self._get_base(symbol) != other_currency, symbol, other_currency)
+                    for other_currency, symbol in edges
+                ])
+            ]
+        self._compute_conversion_paths()
+
+    def _compute_conversion_paths(self):
+        """
+        Breadth first search from the reference market: each currency path is a shortest path
+        """
+        self.conversion_paths[self.reference_market] = ()
+        reached_currencies = [self.reference_market]
+        for _ in range(self.max_conversion_hops):
+            newly_reached_currencies = []
+            for _, _, currency in sorted([
+                (self._get_bridge_rank(currency), index, currency)
+                for index, currency in enumerate(reached_currencies)
+            ]):
+                for other_currency, symbol in self.edges_by_currency.get(currency, []):
+                    if other_currency in self.conversion_paths:
+                        continue
+                    # leg converting other_currency into currency
+                    is_reversed = self._get_base(symbol) != other_currency
+                    self.conversion_paths[other_currency] = ((symbol, is_reversed), ) + self.conversion_paths[currency]
+                    newly_reached_currencies.append(other_currency)
+            reached_currencies = newly_reached_currencies
+        for currency, conversion_path in self.conversion_paths.items():
+            for symbol, _ in conversion_path:
+                self.currencies_by_symbol.setdefault(symbol, set()).add(currency)
+
+    def _get_base(self, symbol):
+        return self.symbols_registry.get_symbol(symbol).base
+
+    def _get_bridge_rank(self, currency):
+        try:
+            return self.bridge_currencies.index(currency)
+        except ValueError:
+            return len(self.bridge_currencies)
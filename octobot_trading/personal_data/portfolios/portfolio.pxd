@@ -26,13 +26,16 @@ cdef class Portfolio(util.Initializable):
     cdef object logger # Logger
     cdef public object lock # asyncio.Lock
 
-    cdef public dict portfolio
+    cdef dict _portfolio
 
     cdef str _exchange_name
 
     cdef bint _is_simulated
+    cdef bint _is_portfolio_shared
+    cdef set _owned_currencies
 
     # public methods
+    cpdef dict get_read_only_portfolio(self)
     cpdef object get_currency_portfolio(self, str currency, str portfolio_type=*)
     cpdef object get_currency_from_given_portfolio(self, str currency, str portfolio_type=*)
     cpdef void reset_portfolio_available(self, str reset_currency=*, object reset_quantity=*)
@@ -50,6 +53,9 @@ cdef class Portfolio(util.Initializable):
     cpdef object update_portfolio_available_from_order(self, order_class.Order order, bint increase_quantity=*)
 
     # private methods
+    cdef void _share_portfolio(self)
+    cdef dict _get_updatable_portfolio(self)
+    cdef dict _get_updatable_currency_portfolio(self, str currency)
     cdef void _reset_currency_portfolio(self, str currency)
     cdef dict _parse_currency_balance(self, dict currency_balance)
     cdef dict _create_currency_portfolio(self, object available, object total)
@@ -13,7 +13,6 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import copy
 import decimal
 
 import octobot_commons.constants as common_constants
@@ -33,6 +32,9 @@ class Portfolio(util.Initializable):
     This class also manage the availability of each currency in the portfolio:
     - When an order is created it will subtract the quantity of the total
     - When an order is filled or canceled restore the availability with the real quantity
+    Copies are copy-on-write snapshots: the portfolio dict and its currencies dicts are shared with the copy until
+    updated through this class methods or accessed through the portfolio attribute. Use get_read_only_portfolio()
+    to read the portfolio dict without copying it.
     """
 
     def __init__(self, exchange_name, is_simulated=False):
@@ -43,7 +45,35 @@ class Portfolio(util.Initializable):
         self.logger = logging.get_logger(
             f"{self.__class__.__name__}{'Simulator' if is_simulated else ''}[{exchange_name}]")
         self.lock = asyncio_tools.RLock()
-        self.portfolio = None
+        # the portfolio dict, might be shared with a copy: use self.portfolio to get an updatable portfolio dict
+        self._portfolio = None
+
+        # when True, self._portfolio dict is shared with a copy and has to be copied before being updated
+        self._is_portfolio_shared = False
+        # currencies which dict is not shared with a copy
+        self._owned_currencies = set()
+
+    @property
+    def portfolio(self):
+        """
+        :return: the portfolio dict, copied first when shared with a copy as it can be updated by the caller
+        """
+        if self._portfolio is not None and len(self._owned_currencies) < len(self._portfolio):
+            for currency in self._portfolio:
+                self._get_updatable_currency_portfolio(currency)
+        return self._get_updatable_portfolio() if self._portfolio is not None else None
+
+    def get_read_only_portfolio(self):
+        """
+        :return: the portfolio dict without copying it: it might be shared with a copy and must not be updated
+        """
+        return self._portfolio
+
+    @portfolio.setter
+    def portfolio(self, portfolio):
+        self._portfolio = portfolio
+        self._is_portfolio_shared = False
+        self._owned_currencies = set(portfolio) if portfolio is not None else set()
 
     async def initialize_impl(self):
         """
@@ -59,12 +89,14 @@ class Portfolio(util.Initializable):
 
     async def copy(self):
         """
-        Copy the portfolio object
+        Copy the portfolio object without copying its content: both portfolios copy their content when updating it
         :return: the copied portfolio object
         """
         new_portfolio: Portfolio = Portfolio(self._exchange_name, self._is_simulated)
         await new_portfolio.initialize()
-        new_portfolio.portfolio = copy.deepcopy(self.portfolio)
+        new_portfolio._portfolio = self._portfolio
+        new_portfolio._share_portfolio()
+        self._share_portfolio()
         return new_portfolio
 
     def update_portfolio_from_balance(self, balance, force_replace=True):
@@ -74,14 +106,15 @@ class Portfolio(util.Initializable):
         :param force_replace: force to update portfolio. Should be False when using deltas
         :return: True if the portfolio has been updated
         """
-        if balance == self.portfolio:
+        if balance == self._portfolio:
             # when the portfolio shouldn't be updated
             return False
         new_balance = {currency: self._parse_currency_balance(balance[currency]) for currency in balance}
         if force_replace:
             self.portfolio = new_balance
         else:
-            self.portfolio.update(new_balance)
+            self._get_updatable_portfolio().update(new_balance)
+            self._owned_currencies.update(new_balance)
         self.logger.debug(f"Portfolio updated | {constants.CURRENT_PORTFOLIO_STRING} {self}")
         return True
 
@@ -93,10 +126,10 @@ class Portfolio(util.Initializable):
         :return: the currency quantity for the portfolio type
         """
         try:
-            return self.portfolio[currency][portfolio_type]
+            return self._portfolio[currency][portfolio_type]
         except KeyError:
             self._reset_currency_portfolio(currency)
-            return self.portfolio[currency][portfolio_type]
+            return self._portfolio[currency][portfolio_type]
 
     def get_currency_portfolio(self, currency, portfolio_type=common_constants.PORTFOLIO_AVAILABLE):
         """
@@ -173,7 +206,34 @@ class Portfolio(util.Initializable):
                 for currency, total in amount_dict.items()}
 
     def __str__(self):
-        return f"{personal_data.portfolio_to_float(self.portfolio)}"
+        return f"{personal_data.portfolio_to_float(self._portfolio)}"
+
+    def _share_portfolio(self):
+        """
+        Mark self._portfolio and its currencies dicts as shared with a copy
+        """
+        self._is_portfolio_shared = True
+        self._owned_currencies = set()
+
+    def _get_updatable_portfolio(self):
+        """
+        :return: self._portfolio, copied first if it is shared with a copy
+        """
+        if self._is_portfolio_shared:
+            self._portfolio = dict(self._portfolio)
+            self._is_portfolio_shared = False
+        return self._portfolio
+
+    def _get_updatable_currency_portfolio(self, currency):
+        """
+        :param currency: the currency to update
+        :return: the currency dict, copied first if it is shared with a copy
+        """
+        portfolio = self._get_updatable_portfolio()
+        if currency not in self._owned_currencies:
+            portfolio[currency] = dict(portfolio[currency])
+            self._owned_currencies.add(currency)
+        return portfolio[currency]
 
     def _update_portfolio_data(self, currency, value, total=True, available=False):
         """
@@ -183,7 +243,7 @@ class Portfolio(util.Initializable):
         :param total: True if total part should be updated
         :param available: True if available part should be updated
         """
-        if currency in self.portfolio:
+        if currency in self._portfolio:
             self._update_currency_portfolio(currency,
                                             available=value if available else constants.ZERO,
                                             total=value if total else constants.ZERO)
@@ -231,7 +291,8 @@ class Portfolio(util.Initializable):
         :param available: the available value
         :param total: the total value
         """
-        self.portfolio[currency] = self._create_currency_portfolio(available=available, total=total)
+        self._get_updatable_portfolio()[currency] = self._create_currency_portfolio(available=available, total=total)
+        self._owned_currencies.add(currency)
 
     def _update_currency_portfolio(self, currency, available=constants.ZERO, total=constants.ZERO):
         """
@@ -240,11 +301,12 @@ class Portfolio(util.Initializable):
         :param available: the available delta
         :param total: the total delta
         """
-        self.portfolio[currency][common_constants.PORTFOLIO_AVAILABLE] += ensure_portfolio_update_validness(
-            currency, self.portfolio[currency][common_constants.PORTFOLIO_AVAILABLE], available
+        currency_portfolio = self._get_updatable_currency_portfolio(currency)
+        currency_portfolio[common_constants.PORTFOLIO_AVAILABLE] += ensure_portfolio_update_validness(
+            currency, currency_portfolio[common_constants.PORTFOLIO_AVAILABLE], available
         )
-        self.portfolio[currency][common_constants.PORTFOLIO_TOTAL] += ensure_portfolio_update_validness(
-            currency, self.portfolio[currency][common_constants.PORTFOLIO_TOTAL], total
+        currency_portfolio[common_constants.PORTFOLIO_TOTAL] += ensure_portfolio_update_validness(
+            currency, currency_portfolio[common_constants.PORTFOLIO_TOTAL], total
         )
 
     def reset_portfolio_available(self, reset_currency=None, reset_quantity=None):
@@ -257,7 +319,7 @@ class Portfolio(util.Initializable):
         if not reset_currency:
             self._reset_all_portfolio_available()
         else:
-            if reset_currency in self.portfolio:
+            if reset_currency in self._portfolio:
                 self._reset_currency_portfolio_available(currency_to_reset=reset_currency,
                                                          reset_quantity=reset_quantity)
 
@@ -265,13 +327,14 @@ class Portfolio(util.Initializable):
         """
         Reset all portfolio currencies to available
         """
-        self.portfolio.update(
+        self._get_updatable_portfolio().update(
             {
                 currency: self._create_currency_portfolio(
-                    available=self.portfolio[currency][common_constants.PORTFOLIO_TOTAL],
-                    total=self.portfolio[currency][common_constants.PORTFOLIO_TOTAL])
-                for currency in self.portfolio
+                    available=self._portfolio[currency][common_constants.PORTFOLIO_TOTAL],
+                    total=self._portfolio[currency][common_constants.PORTFOLIO_TOTAL])
+                for currency in self._portfolio
             })
+        self._owned_currencies = set(self._portfolio)
 
     def _reset_currency_portfolio_available(self, currency_to_reset, reset_quantity):
         """
@@ -281,8 +344,8 @@ class Portfolio(util.Initializable):
         """
         if reset_quantity is None:
             self._set_currency_portfolio(currency=currency_to_reset,
-                                         available=self.portfolio[currency_to_reset][common_constants.PORTFOLIO_TOTAL],
-                                         total=self.portfolio[currency_to_reset][common_constants.PORTFOLIO_TOTAL])
+                                         available=self._portfolio[currency_to_reset][common_constants.PORTFOLIO_TOTAL],
+                                         total=self._portfolio[currency_to_reset][common_constants.PORTFOLIO_TOTAL])
         else:
             self._update_currency_portfolio(currency=currency_to_reset, available=reset_quantity)
 
@@ -54,6 +54,7 @@ class PortfolioManager(util.Initializable):
         :return: True if the portfolio was updated
         """
         if self.trader.is_enabled and balance is not None:
+            self.portfolio_value_holder.invalidate_current_holdings_values()
             return self.portfolio.update_portfolio_from_balance(balance, force_replace=not is_diff_update)
         return False
 
@@ -66,6 +67,7 @@ class PortfolioManager(util.Initializable):
         :return: True if the portfolio was updated
         """
         if self.trader.is_enabled:
+            self.portfolio_value_holder.invalidate_current_holdings_values()
             if self.trader.simulate or not require_exchange_update:
                 return self._refresh_simulated_trader_portfolio_from_order(order)
             # on real trading: reload portfolio to ensure portfolio sync
@@ -77,6 +79,7 @@ class PortfolioManager(util.Initializable):
         Handle balance update notification
         :return: True if profitability changed
         """
+        self.portfolio_value_holder.invalidate_current_holdings_values()
         return await self.portfolio_profitability.update_profitability()
 
     async def handle_profitability_recalculation(self, force_recompute_origin_portfolio):
@@ -94,9 +97,17 @@ class PortfolioManager(util.Initializable):
         :param mark_price: the updated mark price in float
         :return: True if profitability changed
         """
+        market_fixed_point = self.exchange_manager.get_market_fixed_point(symbol)
+        mark_price = decimal.Decimal(str(mark_price)) if market_fixed_point is None \
+            else market_fixed_point.price.float_to_decimal(mark_price)
+        force_recompute_origin_portfolio = \
+            self.portfolio_value_holder.update_origin_crypto_currencies_values(symbol, mark_price)
+        if not force_recompute_origin_portfolio and \
+                self.portfolio_value_holder.update_current_values_from_mark_price(symbol, mark_price):
+            # only the values of this symbol currencies changed
+            return self.portfolio_profitability.update_profitability_from_current_values()
         return await self.portfolio_profitability. \
-            update_profitability(force_recompute_origin_portfolio=self.portfolio_value_holder.
-                                 update_origin_crypto_currencies_values(symbol, decimal.Decimal(str(mark_price))))
+            update_profitability(force_recompute_origin_portfolio=force_recompute_origin_portfolio)
 
     async def _refresh_real_trader_portfolio(self) -> bool:
         """
@@ -113,12 +124,14 @@ class PortfolioManager(util.Initializable):
         """
         self.portfolio = personal_data.create_portfolio_from_exchange_manager(self.exchange_manager)
         await self.portfolio.initialize()
-        self._load_portfolio()
 
+        # create value holder before loading the portfolio: balance updates are invalidating its cached values
         self.reference_market = util.get_reference_market(self.config)
         self.portfolio_value_holder = personal_data.PortfolioValueHolder(self)
         self.portfolio_profitability = personal_data.PortfolioProfitability(self)
 
+        self._load_portfolio()
+
     def _refresh_simulated_trader_portfolio_from_order(self, order):
         """
         Handle a balance update from an order request when simulating
@@ -143,7 +156,7 @@ class PortfolioManager(util.Initializable):
         if self.trader.is_enabled:
             if self.trader.simulate:
                 self._set_starting_simulated_portfolio()
-            self.logger.info(f"{constants.CURRENT_PORTFOLIO_STRING} {self.portfolio.portfolio}")
+            self.logger.info(f"{constants.CURRENT_PORTFOLIO_STRING} {self.portfolio.get_read_only_portfolio()}")
 
     def _set_starting_simulated_portfolio(self):
         """
@@ -37,9 +37,11 @@ cdef class PortfolioProfitability:
     cdef set traded_currencies_without_market_specific
     cdef public set valuated_currencies
 
+    cpdef bint update_profitability_from_current_values(self)
+
     cdef object _calculate_average_market_profitability(self)
     cdef void _reset_before_profitability_calculation(self)
-    cdef void _update_profitability_calculation(self)
+    cdef void _update_profitability_calculation(self, object initial_portfolio_current_value)
     cdef void _update_portfolio_delta(self)
     cdef dict _only_symbol_currency_filter(self, dict currency_dict)
     # cdef void _init_traded_currencies_without_market_specific(self) can't be cythonized for now
@@ -64,7 +64,7 @@ class PortfolioProfitability:
         self._reset_before_profitability_calculation()
         try:
             await self.portfolio_manager.handle_profitability_recalculation(force_recompute_origin_portfolio)
-            self._update_profitability_calculation()
+            self._update_profitability_calculation(self.value_manager.get_origin_portfolio_current_value())
             return self.profitability_diff != constants.ZERO
         except KeyError as missing_data_exception:
             self.logger.warning(f"Missing ticker data to calculate profitability")
@@ -72,6 +72,16 @@ class PortfolioProfitability:
         except Exception as missing_data_exception:
             self.logger.exception(missing_data_exception, True, str(missing_data_exception))
 
+    def update_profitability_from_current_values(self) -> bool:
+        """
+        Update profitability using the portfolio values incrementally updated by
+        PortfolioValueHolder.update_current_values_from_mark_price
+        :return: True if changed else False
+        """
+        self._reset_before_profitability_calculation()
+        self._update_profitability_calculation(self.value_manager.origin_portfolio_current_value)
+        return self.profitability_diff != constants.ZERO
+
     def _reset_before_profitability_calculation(self):
         """
         Prepare profitability calculation
@@ -82,11 +92,11 @@ class PortfolioProfitability:
         self.market_profitability_percent = constants.ZERO
         self.initial_portfolio_current_profitability = constants.ZERO
 
-    def _update_profitability_calculation(self):
+    def _update_profitability_calculation(self, initial_portfolio_current_value):
         """
         Calculates the new portfolio profitability
+        :param initial_portfolio_current_value: the origin portfolio value using current prices
         """
-        initial_portfolio_current_value = self.value_manager.get_origin_portfolio_current_value()
         self.profitability = self.value_manager.portfolio_current_value - self.value_manager.portfolio_origin_value
 
         if self.value_manager.portfolio_origin_value > constants.ZERO:
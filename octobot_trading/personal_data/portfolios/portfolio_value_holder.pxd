@@ -21,6 +21,7 @@ In simulation it will also define rules to be filled / canceled
 It is also use to store creation & fill values of the order """
 cimport octobot_trading.personal_data.portfolios.portfolio as portfolio
 cimport octobot_trading.personal_data.portfolios.portfolio_manager as portfolio_manager
+cimport octobot_trading.personal_data.portfolios.currency_conversion_graph as currency_conversion_graph
 
 cdef class PortfolioValueHolder:
     cdef object logger
@@ -33,6 +34,10 @@ cdef class PortfolioValueHolder:
     cdef public dict origin_crypto_currencies_values
     cdef public dict current_crypto_currencies_values
     cdef public set initializing_symbol_prices
+    cdef public dict current_holdings_values
+    cdef public dict origin_portfolio_current_holdings_values
+    cdef public object origin_portfolio_current_value
+    cdef public currency_conversion_graph.CurrencyConversionGraph conversion_graph
 
     cdef public portfolio.Portfolio origin_portfolio
 
@@ -41,17 +46,22 @@ cdef class PortfolioValueHolder:
     cdef portfolio_manager.PortfolioManager portfolio_manager
 
     cpdef bint update_origin_crypto_currencies_values(self, str symbol, object mark_price)
+    cpdef bint update_current_values_from_mark_price(self, str symbol, object mark_price)
+    cpdef void invalidate_current_holdings_values(self)
     cpdef dict get_current_crypto_currencies_values(self)
     cpdef dict get_current_holdings_values(self)
     cpdef object get_origin_portfolio_current_value(self, bint refresh_values=*)
     # cpdef object get_currency_holding_ratio(self, str currency)
 
-    cdef object _update_portfolio_current_value(self, dict portfolio, dict currencies_values=*, bint fill_currencies_values=*)
+    cdef object _update_portfolio_current_value(self, dict portfolio, dict currencies_values=*, bint fill_currencies_values=*,
+                                                dict holdings_values=*)
+    cdef currency_conversion_graph.CurrencyConversionGraph _get_conversion_graph(self)
+    cdef object _update_holdings_value(self, dict portfolio, str currency, object currency_value, dict holdings_values)
     cdef void _fill_currencies_values(self, dict currencies_values)
     cdef dict _update_portfolio_and_currencies_current_value(self)
     cdef object _check_currency_initialization(self, str currency, object currency_value)
     cdef void _recompute_origin_portfolio_initial_value(self)
-    cdef void _try_to_ask_ticker_missing_symbol_data(self, str currency, str symbol, str reversed_symbol)
+    cdef void _try_to_ask_ticker_missing_symbol_data(self, str currency, list conversion_symbols)
     cdef void _ask_ticker_data_for_currency(self, list symbols_to_add)
     cdef void _inform_no_matching_symbol(self, str currency)
     cdef _evaluate_config_crypto_currencies_and_portfolio_values(self,
@@ -67,7 +77,7 @@ cdef class PortfolioValueHolder:
                                                     set valuated_currencies,
                                                     set missing_tickers,
                                                     bint ignore_missing_currency_data)
-    cdef object _evaluate_portfolio_value(self, dict portfolio, dict currencies_values=*)
+    cdef object _evaluate_portfolio_value(self, dict portfolio, dict currencies_values=*, dict holdings_values=*)
     cdef bint _should_currency_be_considered(self, str currency, dict portfolio, bint ignore_missing_currency_data)
     # cdef object _evaluate_value(self, str currency, object quantity, bint raise_error=*)
     # cdef object _try_get_value_of_currency(self, str currency, object quantity, bint raise_error)
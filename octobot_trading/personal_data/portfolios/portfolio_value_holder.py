@@ -17,9 +17,9 @@ import asyncio
 
 import octobot_commons.constants as common_constants
 import octobot_commons.logging as logging
-import octobot_commons.symbol_util as symbol_util
 
 import octobot_trading.constants as constants
+import octobot_trading.personal_data.portfolios.currency_conversion_graph as currency_conversion_graph
 
 
 class PortfolioValueHolder:
@@ -45,6 +45,14 @@ class PortfolioValueHolder:
         self.origin_crypto_currencies_values = {}
         self.current_crypto_currencies_values = {}
 
+        # cached reference market values of each currency holdings, None when the portfolio changed since evaluation
+        self.current_holdings_values = None
+        # cached reference market values of each origin portfolio currency holdings using current prices
+        self.origin_portfolio_current_holdings_values = {}
+        self.origin_portfolio_current_value = constants.ZERO
+        # conversion paths to the reference market, built from the exchange symbols when required
+        self.conversion_graph = None
+
         # set of currencies for which the current exchange is not providing any suitable price data
         self.missing_currency_data_in_exchange = set()
 
@@ -55,7 +63,7 @@ class PortfolioValueHolder:
         :param mark_price: the symbol mark price value in decimal.Decimal
         :return: True if the origin portfolio should be recomputed
         """
-        currency, market = symbol_util.split_symbol(symbol)
+        currency, market = self.portfolio_manager.exchange_manager.get_exchange_quote_and_base(symbol)
         # update origin values if this price has relevant data regarding the origin portfolio (using both quote and base)
         origin_currencies_should_be_updated = (
             (
@@ -76,8 +84,78 @@ class PortfolioValueHolder:
             else:
                 self.origin_crypto_currencies_values[market] = constants.ONE / mark_price
         self.last_prices_by_trading_pair[symbol] = mark_price
+        self._get_conversion_graph().on_price_update(symbol)
         return origin_currencies_should_be_updated
 
+    def update_current_values_from_mark_price(self, symbol, mark_price):
+        """
+        Update currencies and portfolios values from the given mark price without evaluating the whole portfolio
+        :param symbol: the updated symbol
+        :param mark_price: the symbol mark price value in decimal.Decimal
+        :return: False if the portfolio has to be evaluated from scratch
+        """
+        conversion_graph = self._get_conversion_graph()
+        evaluated_currencies = conversion_graph.get_dependent_currencies(symbol)
+        if not evaluated_currencies:
+            # this price is not used to evaluate currencies
+            return True
+        if self.current_holdings_values is None or self.portfolio_origin_value == constants.ZERO \
+                or mark_price == constants.ZERO:
+            return False
+        currencies_values = {}
+        for currency in evaluated_currencies:
+            if currency not in self.current_crypto_currencies_values \
+                    or currency in self.missing_currency_data_in_exchange:
+                # currency not evaluated yet
+                return False
+            try:
+                currencies_values[currency] = conversion_graph.get_currency_value(
+                    currency, self.last_prices_by_trading_pair)
+            except KeyError:
+                return False
+        for currency, currency_value in currencies_values.items():
+            self.current_crypto_currencies_values[currency] = currency_value
+            self.portfolio_current_value += self._update_holdings_value(
+                self.portfolio_manager.portfolio.get_read_only_portfolio(), currency, currency_value,
+                self.current_holdings_values
+            )
+            self.origin_portfolio_current_value += self._update_holdings_value(
+                self.origin_portfolio.portfolio, currency, currency_value,
+                self.origin_portfolio_current_holdings_values
+            )
+        return True
+
+    def invalidate_current_holdings_values(self):
+        """
+        To be called when the portfolio content changed: the next update will evaluate the whole portfolio
+        """
+        self.current_holdings_values = None
+
+    def _get_conversion_graph(self):
+        """
+        :return: the conversion graph of the current exchange symbols and reference market
+        """
+        symbols = self.portfolio_manager.exchange_manager.client_symbols or []
+        if self.conversion_graph is None \
+                or self.conversion_graph.reference_market != self.portfolio_manager.reference_market \
+                or self.conversion_graph.symbols_count != len(symbols):
+            self.conversion_graph = currency_conversion_graph.CurrencyConversionGraph(
+                symbols, self.portfolio_manager.reference_market,
+                self.portfolio_manager.exchange_manager.symbols_registry
+            )
+        return self.conversion_graph
+
+    def _update_holdings_value(self, portfolio, currency, currency_value, holdings_values):
+        """
+        :return: the difference between the new and the previous value of the currency holdings
+        """
+        if currency in self.missing_currency_data_in_exchange or currency not in portfolio:
+            return constants.ZERO
+        holdings_value = currency_value * portfolio[currency][constants.CONFIG_PORTFOLIO_TOTAL]
+        delta = holdings_value - holdings_values.get(currency, constants.ZERO)
+        holdings_values[currency] = holdings_value
+        return delta
+
     def get_current_crypto_currencies_values(self):
         """
         Return the current crypto-currencies values
@@ -93,7 +171,8 @@ class PortfolioValueHolder:
         :return: the holdings ratio dictionary
         """
         holdings = self.get_current_crypto_currencies_values()
-        return {currency: self._get_currency_value(self.portfolio_manager.portfolio.portfolio, currency, holdings)
+        portfolio = self.portfolio_manager.portfolio.get_read_only_portfolio()
+        return {currency: self._get_currency_value(portfolio, currency, holdings)
                 for currency in holdings.keys()}
 
     def get_currency_holding_ratio(self, currency):
@@ -123,8 +202,12 @@ class PortfolioValueHolder:
         if refresh_values:
             self.current_crypto_currencies_values.update(
                 self._evaluate_config_crypto_currencies_and_portfolio_values(self.origin_portfolio.portfolio))
-        return self._update_portfolio_current_value(self.origin_portfolio.portfolio,
-                                                    currencies_values=self.current_crypto_currencies_values)
+        self.origin_portfolio_current_value = self._update_portfolio_current_value(
+            self.origin_portfolio.portfolio,
+            currencies_values=self.current_crypto_currencies_values,
+            holdings_values=self.origin_portfolio_current_holdings_values
+        )
+        return self.origin_portfolio_current_value
 
     async def _init_portfolio_values_if_necessary(self, force_recompute_origin_portfolio) -> None:
         """
@@ -147,12 +230,14 @@ class PortfolioValueHolder:
                                                                          ignore_missing_currency_data=True))
         self._recompute_origin_portfolio_initial_value()
 
-    def _update_portfolio_current_value(self, portfolio, currencies_values=None, fill_currencies_values=False):
+    def _update_portfolio_current_value(self, portfolio, currencies_values=None, fill_currencies_values=False,
+                                        holdings_values=None):
         """
         Update the portfolio with current prices
         :param portfolio: the portfolio to update
         :param currencies_values: the currencies values
         :param fill_currencies_values: the currencies values to calculate
+        :param holdings_values: the dict to store each currency holdings value in
         :return: the updated portfolio
         """
         values = currencies_values
@@ -162,7 +247,7 @@ class PortfolioValueHolder:
             if fill_currencies_values:
                 self._fill_currencies_values(currencies_values)
             values = self.current_crypto_currencies_values
-        return self._evaluate_portfolio_value(portfolio, values)
+        return self._evaluate_portfolio_value(portfolio, values, holdings_values=holdings_values)
 
     def _fill_currencies_values(self, currencies_values):
         """
@@ -179,8 +264,10 @@ class PortfolioValueHolder:
         """
         Update the portfolio current value with the current portfolio instance
         """
+        current_holdings_values = {}
         self.portfolio_current_value = self._update_portfolio_current_value(
-            self.portfolio_manager.portfolio.portfolio)
+            self.portfolio_manager.portfolio.get_read_only_portfolio(), holdings_values=current_holdings_values)
+        self.current_holdings_values = current_holdings_values
 
     def _evaluate_value(self, currency, quantity, raise_error=True):
         """
@@ -219,43 +306,39 @@ class PortfolioValueHolder:
     def _try_get_value_of_currency(self, currency, quantity, raise_error):
         """
         try_get_value_of_currency will try to obtain the current value of the currency quantity in reference currency.
-        It will try to create the symbol that fit with the exchange logic.
+        It will use the shortest conversion path to the reference market using the exchange symbols.
         :return: the value found of this currency quantity, if not found returns 0.
         """
-        symbol = symbol_util.merge_currencies(currency, self.portfolio_manager.reference_market)
-        reversed_symbol = symbol_util.merge_currencies(self.portfolio_manager.reference_market, currency)
-
+        conversion_graph = self._get_conversion_graph()
         try:
-            if self.portfolio_manager.exchange_manager.symbol_exists(symbol):
-                return self.last_prices_by_trading_pair[symbol] * quantity
-
-            if self.portfolio_manager.exchange_manager.symbol_exists(reversed_symbol) and \
-                    self.last_prices_by_trading_pair[reversed_symbol] != constants.ZERO:
-                return quantity / self.last_prices_by_trading_pair[reversed_symbol]
+            currency_value = conversion_graph.get_currency_value(currency, self.last_prices_by_trading_pair)
+            if currency_value is not None:
+                return currency_value * quantity
 
             if currency not in self.missing_currency_data_in_exchange:
                 self._inform_no_matching_symbol(currency)
                 self.missing_currency_data_in_exchange.add(currency)
         except KeyError as missing_data_exception:
             if not self.portfolio_manager.exchange_manager.is_backtesting:
-                self._try_to_ask_ticker_missing_symbol_data(currency, symbol, reversed_symbol)
+                self._try_to_ask_ticker_missing_symbol_data(
+                    currency, [symbol for symbol, _ in conversion_graph.get_conversion_path(currency)]
+                )
                 if raise_error:
                     raise missing_data_exception
         return constants.ZERO
 
-    def _try_to_ask_ticker_missing_symbol_data(self, currency, symbol, reversed_symbol):
+    def _try_to_ask_ticker_missing_symbol_data(self, currency, conversion_symbols):
         """
         Try to ask the ticker producer to watch additional symbols
         to collect missing data required for profitability calculation
         :param currency: the concerned currency
-        :param symbol: the symbol to add
-        :param reversed_symbol: the reversed symbol to add
+        :param conversion_symbols: the symbols required to evaluate currency
         """
-        symbols_to_add = []
-        if self.portfolio_manager.exchange_manager.symbol_exists(symbol):
-            symbols_to_add = [symbol]
-        elif self.portfolio_manager.exchange_manager.symbol_exists(reversed_symbol):
-            symbols_to_add = [reversed_symbol]
+        symbols_to_add = [
+            symbol
+            for symbol in conversion_symbols
+            if self.last_prices_by_trading_pair.get(symbol, constants.ZERO) == constants.ZERO
+        ]
 
         if symbols_to_add:
             self._ask_ticker_data_for_currency(symbols_to_add)
@@ -277,7 +360,7 @@ class PortfolioValueHolder:
         """
         # do not log warning in backtesting or tests
         if not self.portfolio_manager.exchange_manager.is_backtesting:
-            self.logger.warning(f"No trading pair including {currency} and {self.portfolio_manager.reference_market} on"
+            self.logger.warning(f"No trading pair path from {currency} to {self.portfolio_manager.reference_market} on"
                                 f" {self.portfolio_manager.exchange_manager.exchange_name}. {currency} "
                                 f"can't be valued for portfolio and profitability.")
 
@@ -312,7 +395,7 @@ class PortfolioValueHolder:
         :param missing_tickers: the list of missing currencies
         """
         if self.portfolio_manager.exchange_manager.exchange_config.all_config_symbol_pairs:
-            currency, market = symbol_util.split_symbol(
+            currency, market = self.portfolio_manager.exchange_manager.get_exchange_quote_and_base(
                 self.portfolio_manager.exchange_manager.exchange_config.all_config_symbol_pairs[0]
             )
             currency_to_evaluate = currency
@@ -350,18 +433,23 @@ class PortfolioValueHolder:
             except KeyError:
                 missing_tickers.add(currency)
 
-    def _evaluate_portfolio_value(self, portfolio, currencies_values=None):
+    def _evaluate_portfolio_value(self, portfolio, currencies_values=None, holdings_values=None):
         """
         Perform evaluate_value with a portfolio configuration
         :param portfolio: the portfolio to explore
         :param currencies_values: currencies to evaluate
+        :param holdings_values: the dict to store each currency holdings value in
         :return: the calculated quantity value in reference (attribute) currency
         """
-        return sum([
-            self._get_currency_value(portfolio, currency, currencies_values)
+        values = {
+            currency: self._get_currency_value(portfolio, currency, currencies_values)
             for currency in portfolio
             if currency not in self.missing_currency_data_in_exchange
-        ])
+        }
+        if holdings_values is not None:
+            holdings_values.clear()
+            holdings_values.update(values)
+        return sum(values.values())
 
     def _get_currency_value(self, portfolio, currency, currencies_values=None, raise_error=False):
         """
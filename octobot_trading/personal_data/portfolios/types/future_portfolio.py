@@ -97,4 +97,4 @@ class FuturePortfolio(portfolio_class.Portfolio):
         self.logger.debug(f"Portfolio updated from order "
                           f"| {currency} TODO "
                           f"| {market} TODO "
-                          f"| {constants.CURRENT_PORTFOLIO_STRING} {self.portfolio}")
+                          f"| {constants.CURRENT_PORTFOLIO_STRING} {self._portfolio}")
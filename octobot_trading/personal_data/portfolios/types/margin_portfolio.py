@@ -45,17 +45,20 @@ class MarginPortfolio(portfolio_class.Portfolio):
         self._set_currency_portfolio(currency=currency, available=0, total=0, margin=0)
 
     def _set_currency_portfolio(self, currency, available, total, margin=0):
-        self.portfolio[currency] = self._create_currency_portfolio(available=available, total=total, margin=margin)
+        self._get_updatable_portfolio()[currency] = \
+            self._create_currency_portfolio(available=available, total=total, margin=margin)
+        self._owned_currencies.add(currency)
 
     def _update_currency_portfolio(self, currency, available=0, total=0, margin=0):
-        self.portfolio[currency][common_constants.PORTFOLIO_AVAILABLE] += \
+        currency_portfolio = self._get_updatable_currency_portfolio(currency)
+        currency_portfolio[common_constants.PORTFOLIO_AVAILABLE] += \
             portfolio_class.ensure_portfolio_update_validness(
-            currency, self.portfolio[currency][common_constants.PORTFOLIO_AVAILABLE], available
+            currency, currency_portfolio[common_constants.PORTFOLIO_AVAILABLE], available
         )
-        self.portfolio[currency][common_constants.MARGIN_PORTFOLIO] += \
+        currency_portfolio[common_constants.MARGIN_PORTFOLIO] += \
             portfolio_class.ensure_portfolio_update_validness(
-                currency, self.portfolio[currency][common_constants.MARGIN_PORTFOLIO], margin
+                currency, currency_portfolio[common_constants.MARGIN_PORTFOLIO], margin
             )
-        self.portfolio[currency][common_constants.PORTFOLIO_TOTAL] += portfolio_class.ensure_portfolio_update_validness(
-            currency, self.portfolio[currency][common_constants.PORTFOLIO_TOTAL], total
+        currency_portfolio[common_constants.PORTFOLIO_TOTAL] += portfolio_class.ensure_portfolio_update_validness(
+            currency, currency_portfolio[common_constants.PORTFOLIO_TOTAL], total
         )
@@ -75,4 +75,4 @@ class SpotPortfolio(portfolio_class.Portfolio):
             market_portfolio_num = order.filled_quantity * order.filled_price - order.get_total_fees(market)
 
         self.logger.debug(f"Portfolio updated from order | {currency} {currency_portfolio_num} | {market} "
-                          f"{market_portfolio_num} | {constants.CURRENT_PORTFOLIO_STRING} {self.portfolio}")
+                          f"{market_portfolio_num} | {constants.CURRENT_PORTFOLIO_STRING} {self._portfolio}")
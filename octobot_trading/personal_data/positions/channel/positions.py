@@ -42,8 +42,7 @@ class PositionsProducer(exchanges_channel.ExchangeChannelProducer):
                                                should_notify=False)
 
                     if changed:
-                        await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                        get_pair_cryptocurrency(symbol),
+                        await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                         symbol=symbol,
                                         position=position,
                                         is_updated=changed,
@@ -54,16 +53,15 @@ class PositionsProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, position, is_updated=False, is_liquidated=False):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "position": position,
-                "is_updated": is_updated,
-                "is_liquidated": is_liquidated
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "position": position,
+            "is_updated": is_updated,
+            "is_liquidated": is_liquidated
+        })
 
 
 class PositionsChannel(exchanges_channel.ExchangeChannel):
@@ -24,6 +24,10 @@ from octobot_trading.personal_data.trades cimport trade
 from octobot_trading.personal_data.trades.trade cimport (
     Trade,
 )
+from octobot_trading.personal_data.trades cimport trades_history
+from octobot_trading.personal_data.trades.trades_history cimport (
+    CompactTradesHistory,
+)
 from octobot_trading.personal_data.trades cimport trades_manager
 from octobot_trading.personal_data.trades.trades_manager cimport (
     TradesManager,
@@ -36,6 +40,7 @@ from octobot_trading.personal_data.trades.trade_factory cimport (
 )
 
 __all__ = [
+    "CompactTradesHistory",
     "TradesManager",
     "TradesProducer",
     "TradesChannel",
@@ -14,6 +14,10 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+from octobot_trading.personal_data.trades import trades_history
+from octobot_trading.personal_data.trades.trades_history import (
+    CompactTradesHistory,
+)
 from octobot_trading.personal_data.trades import trades_manager
 from octobot_trading.personal_data.trades import trade_factory
 from octobot_trading.personal_data.trades import channel
@@ -37,6 +41,7 @@ from octobot_trading.personal_data.trades.trade import (
 )
 
 __all__ = [
+    "CompactTradesHistory",
     "TradesManager",
     "TradesProducer",
     "TradesChannel",
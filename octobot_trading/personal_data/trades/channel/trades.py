@@ -43,8 +43,7 @@ class TradesProducer(exchanges_channel.ExchangeChannelProducer):
                         should_notify=False)
 
                     if added:
-                        await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                        get_pair_cryptocurrency(symbol),
+                        await self.send(cryptocurrency=self.channel.exchange_manager.get_pair_cryptocurrency(symbol),
                                         symbol=symbol,
                                         trade=trade,
                                         old_trade=old_trade)
@@ -54,15 +53,14 @@ class TradesProducer(exchanges_channel.ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, trade, old_trade=False):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "trade": trade,
-                "old_trade": old_trade
-            })
+        await self.send_to_consumers(self.channel.get_filtered_consumers(symbol=symbol), {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "trade": trade,
+            "old_trade": old_trade
+        })
 
 
 class TradesChannel(exchanges_channel.ExchangeChannel):
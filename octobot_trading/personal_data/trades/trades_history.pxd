@@ -0,0 +1,47 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class CompactTradesHistory:
+    cdef public int memory_size
+    cdef public str database_path
+    cdef public object database
+    cdef public bint is_temporary_database
+    cdef public long long database_trades_count
+
+    cdef public long long size
+    cdef public list trade_ids
+    cdef public dict columns
+    cdef public dict interned_values
+    cdef public dict interned_ids
+
+    cpdef void add_trade(self, object trade)
+    cpdef list get_trades(self, str symbol=*, object since=*, bint include_cancelled=*)
+    cpdef void clear(self)
+
+    cdef void _reset_columns(self)
+    cdef void _grow_columns(self)
+    cdef int _get_value_id(self, str column, object value)
+    cdef object _get_database(self)
+    cdef void _move_to_database(self, long long count)
+    cdef list _get_database_row(self, long long index)
+    cdef list _get_database_trades(self, str symbol, object since, bint include_cancelled)
+    cdef list _get_memory_trades(self, str symbol, object since, bint include_cancelled)
+
+cdef tuple _get_trade_fee(object trade)
+cdef object _to_string(object value)
+cdef object _to_decimal(object value)
+cdef dict _get_trade_dict(dict trade)
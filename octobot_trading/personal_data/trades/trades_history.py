@@ -0,0 +1,285 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import os
+import sqlite3
+import tempfile
+
+import numpy as np
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+
+# interned columns: values are stored as ids of their column values list, 0 being None
+SYMBOL = "symbol"
+SIDE = "side"
+STATUS = "status"
+TRADE_TYPE = "trade_type"
+TAKER_OR_MAKER = "taker_or_maker"
+FEE_CURRENCY = "fee_currency"
+INTERNED_COLUMNS = {
+    SYMBOL: np.int32,
+    SIDE: np.int8,
+    STATUS: np.int8,
+    TRADE_TYPE: np.int8,
+    TAKER_OR_MAKER: np.int8,
+    FEE_CURRENCY: np.int32,
+}
+# enum columns are stored as their value in the history database
+ENUM_COLUMNS = {
+    SIDE: enums.TradeOrderSide,
+    STATUS: enums.OrderStatus,
+    TRADE_TYPE: enums.TradeOrderType,
+}
+# decimal columns are stored as their exact string representation, None when missing
+PRICE = "price"
+QUANTITY = "quantity"
+COST = "cost"
+FEE_COST = "fee_cost"
+DECIMAL_COLUMNS = (PRICE, QUANTITY, COST, FEE_COST)
+TIME = "time"
+NUMBER_COLUMNS = (TIME, )
+
+TRADE_ID = "trade_id"
+DATABASE_COLUMNS = (TRADE_ID, ) + tuple(INTERNED_COLUMNS) + DECIMAL_COLUMNS + NUMBER_COLUMNS
+TRADES_TABLE = "trades"
+
+
+class CompactTradesHistory:
+    """
+    Stores trades removed from TradesManager as typed column arrays instead of Trade instances.
+    When more than memory_size trades are stored, the oldest half of them is moved to a SQLite history database.
+    Trades are returned as Trade.to_dict() dicts, oldest first.
+    """
+
+    def __init__(self, memory_size=constants.COMPACT_TRADES_HISTORY_MEMORY_SIZE, database_path=None):
+        """
+        :param memory_size: the maximum count of trades to keep in memory
+        :param database_path: the history database file path, a temporary file removed on clear() when None.
+        Trades previously stored in this database are removed.
+        """
+        self.memory_size = memory_size
+        self.database_path = database_path
+        self.database = None
+        self.is_temporary_database = False
+        self.database_trades_count = 0
+
+        self.size = 0
+        self.trade_ids = []
+        self.columns = {}
+        self.interned_values = {}
+        self.interned_ids = {}
+        self._reset_columns()
+        if self.database_path is not None and os.path.isfile(self.database_path):
+            # remove trades from a previous run
+            self._get_database()
+
+    def add_trade(self, trade):
+        """
+        Compact and store the given Trade
+        """
+        if self.size == len(self.columns[TIME]):
+            self._grow_columns()
+        index = self.size
+        fee_cost, fee_currency = _get_trade_fee(trade)
+        self.trade_ids.append(trade.trade_id)
+        self.columns[SYMBOL][index] = self._get_value_id(SYMBOL, trade.symbol)
+        self.columns[SIDE][index] = self._get_value_id(SIDE, trade.side)
+        self.columns[STATUS][index] = self._get_value_id(STATUS, trade.status)
+        self.columns[TRADE_TYPE][index] = self._get_value_id(TRADE_TYPE, trade.exchange_trade_type)
+        self.columns[TAKER_OR_MAKER][index] = self._get_value_id(TAKER_OR_MAKER, trade.taker_or_maker)
+        self.columns[FEE_CURRENCY][index] = self._get_value_id(FEE_CURRENCY, fee_currency)
+        self.columns[PRICE][index] = _to_string(trade.executed_price)
+        self.columns[QUANTITY][index] = _to_string(trade.get_quantity())
+        self.columns[COST][index] = _to_string(trade.total_cost)
+        self.columns[FEE_COST][index] = _to_string(fee_cost)
+        self.columns[TIME][index] = float(trade.get_time())
+        self.size += 1
+        if self.size > self.memory_size:
+            self._move_to_database(self.size - self.memory_size // 2)
+
+    def get_trades(self, symbol=None, since=None, include_cancelled=False):
+        """
+        :param symbol: the trades symbol, every symbol when None
+        :param since: the minimum trades time (excluded), ignored when None
+        :param include_cancelled: when False, cancelled trades are not returned
+        :return: the selected trades dicts, oldest first
+        """
+        return self._get_database_trades(symbol, since, include_cancelled) + \
+            self._get_memory_trades(symbol, since, include_cancelled)
+
+    def clear(self):
+        if self.database is not None:
+            self.database.close()
+            self.database = None
+            if self.is_temporary_database:
+                os.remove(self.database_path)
+                self.database_path = None
+                self.is_temporary_database = False
+        self.database_trades_count = 0
+        self._reset_columns()
+
+    def __len__(self):
+        return self.database_trades_count + self.size
+
+    def _reset_columns(self):
+        self.size = 0
+        self.trade_ids = []
+        capacity = constants.COMPACT_TRADES_HISTORY_INITIAL_CAPACITY
+        self.columns = {column: np.zeros(capacity, dtype=dtype) for column, dtype in INTERNED_COLUMNS.items()}
+        self.columns.update({column: np.full(capacity, None, dtype=object) for column in DECIMAL_COLUMNS})
+        self.columns.update({column: np.zeros(capacity, dtype=np.float64) for column in NUMBER_COLUMNS})
+        self.interned_values = {column: [None] for column in INTERNED_COLUMNS}
+        self.interned_ids = {column: {None: 0} for column in INTERNED_COLUMNS}
+
+    def _grow_columns(self):
+        for column, values in self.columns.items():
+            grown_values = np.full(len(values) * 2, None, dtype=object) if column in DECIMAL_COLUMNS \
+                else np.zeros(len(values) * 2, dtype=values.dtype)
+            grown_values[:self.size] = values[:self.size]
+            self.columns[column] = grown_values
+
+    def _get_value_id(self, column, value):
+        try:
+            return self.interned_ids[column][value]
+        except KeyError:
+            value_id = len(self.interned_values[column])
+            self.interned_values[column].append(value)
+            self.interned_ids[column][value] = value_id
+            return value_id
+
+    def _get_database(self):
+        if self.database is None:
+            if self.database_path is None:
+                file_descriptor, self.database_path = tempfile.mkstemp(suffix=".sqlite")
+                os.close(file_descriptor)
+                self.is_temporary_database = True
+            self.database = sqlite3.connect(self.database_path)
+            # only store trades of this history
+            self.database.execute(f"DROP TABLE IF EXISTS {TRADES_TABLE}")
+            self.database.execute(f"CREATE TABLE {TRADES_TABLE} ({', '.join(DATABASE_COLUMNS)})")
+            self.database.commit()
+            self.database_trades_count = 0
+        return self.database
+
+    def _move_to_database(self, count):
+        database = self._get_database()
+        database.executemany(
+            f"INSERT INTO {TRADES_TABLE} VALUES ({', '.join('?' * len(DATABASE_COLUMNS))})",
+            [self._get_database_row(index) for index in range(count)]
+        )
+        database.commit()
+        self.database_trades_count += count
+        remaining = self.size - count
+        for values in self.columns.values():
+            values[:remaining] = values[count:self.size]
+        for column in DECIMAL_COLUMNS:
+            self.columns[column][remaining:self.size] = None
+        del self.trade_ids[:count]
+        self.size = remaining
+
+    def _get_database_row(self, index):
+        row = [self.trade_ids[index]]
+        for column in INTERNED_COLUMNS:
+            value = self.interned_values[column][self.columns[column][index]]
+            row.append(value.value if column in ENUM_COLUMNS and value is not None else value)
+        for column in DECIMAL_COLUMNS:
+            row.append(self.columns[column][index])
+        for column in NUMBER_COLUMNS:
+            row.append(float(self.columns[column][index]))
+        return row
+
+    def _get_database_trades(self, symbol, since, include_cancelled):
+        if self.database is None:
+            return []
+        conditions = []
+        parameters = []
+        if symbol is not None:
+            conditions.append(f"{SYMBOL} = ?")
+            parameters.append(symbol)
+        if since is not None:
+            conditions.append(f"{TIME} > ?")
+            parameters.append(since)
+        if not include_cancelled:
+            conditions.append(f"({STATUS} IS NULL OR {STATUS} != ?)")
+            parameters.append(enums.OrderStatus.CANCELED.value)
+        query = f"SELECT {', '.join(DATABASE_COLUMNS)} FROM {TRADES_TABLE}"
+        if conditions:
+            query = f"{query} WHERE {' AND '.join(conditions)}"
+        return [
+            _get_trade_dict(dict(zip(DATABASE_COLUMNS, row)))
+            for row in self._get_database().execute(f"{query} ORDER BY rowid", parameters)
+        ]
+
+    def _get_memory_trades(self, symbol, since, include_cancelled):
+        selected = np.ones(self.size, dtype=bool)
+        if symbol is not None:
+            selected &= self.columns[SYMBOL][:self.size] == self.interned_ids[SYMBOL].get(symbol, -1)
+        if since is not None:
+            selected &= self.columns[TIME][:self.size] > since
+        if not include_cancelled:
+            selected &= self.columns[STATUS][:self.size] != \
+                self.interned_ids[STATUS].get(enums.OrderStatus.CANCELED, -1)
+        trades = []
+        for index in np.flatnonzero(selected):
+            trade = {TRADE_ID: self.trade_ids[index]}
+            for column in INTERNED_COLUMNS:
+                value = self.interned_values[column][self.columns[column][index]]
+                trade[column] = value.value if column in ENUM_COLUMNS and value is not None else value
+            for column in DECIMAL_COLUMNS:
+                trade[column] = self.columns[column][index]
+            for column in NUMBER_COLUMNS:
+                trade[column] = float(self.columns[column][index])
+            trades.append(_get_trade_dict(trade))
+        return trades
+
+
+def _get_trade_fee(trade):
+    if trade.fee is None:
+        return None, None
+    return trade.fee.get(enums.FeePropertyColumns.COST.value, None), \
+        trade.fee.get(enums.FeePropertyColumns.CURRENCY.value, None)
+
+
+def _to_string(value):
+    return None if value is None else str(value)
+
+
+def _to_decimal(value):
+    return None if value is None else decimal.Decimal(value)
+
+
+def _get_trade_dict(trade):
+    """
+    :param trade: a stored trade values by column
+    :return: the trade as a Trade.to_dict() dict
+    """
+    return {
+        enums.ExchangeConstantsOrderColumns.ID.value: trade[TRADE_ID],
+        enums.ExchangeConstantsOrderColumns.SYMBOL.value: trade[SYMBOL],
+        enums.ExchangeConstantsOrderColumns.PRICE.value: _to_decimal(trade[PRICE]),
+        enums.ExchangeConstantsOrderColumns.STATUS.value: trade[STATUS],
+        enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: trade[TIME],
+        enums.ExchangeConstantsOrderColumns.TYPE.value: trade[TRADE_TYPE],
+        enums.ExchangeConstantsOrderColumns.SIDE.value: trade[SIDE],
+        enums.ExchangeConstantsOrderColumns.AMOUNT.value: _to_decimal(trade[QUANTITY]),
+        enums.ExchangeConstantsOrderColumns.COST.value: _to_decimal(trade[COST]),
+        enums.ExchangeConstantsOrderColumns.TAKERORMAKER.value: trade[TAKER_OR_MAKER],
+        enums.ExchangeConstantsOrderColumns.FEE.value: None if trade[FEE_CURRENCY] is None else {
+            enums.FeePropertyColumns.COST.value: _to_decimal(trade[FEE_COST]),
+            enums.FeePropertyColumns.CURRENCY.value: trade[FEE_CURRENCY],
+        },
+    }
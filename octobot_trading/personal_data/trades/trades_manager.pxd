@@ -14,6 +14,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+cimport octobot_trading.personal_data.trades.trades_history as trades_history
 cimport octobot_trading.util as util
 
 
@@ -22,9 +23,19 @@ cdef class TradesManager(util.Initializable):
     cdef object trader
 
     cdef public object trades
+    cdef public dict trades_by_origin_order_id
+    cdef public dict trades_time_indexes
+    cdef public trades_history.CompactTradesHistory compacted_trades
+    cdef public dict paid_fees
+    cdef public dict traded_volumes
+    cdef public dict trades_counts
 
     cdef public bint trades_initialized
 
+    cdef void _add_trade(self, str trade_id, object trade)
+    cdef void _index_trade_time(self, str symbol, object trade)
+    cdef void _remove_from_trades_time_indexes(self, set removed_trades)
+    cdef void _update_aggregates(self, object trade)
     cdef void _check_trades_size(self)
     cdef void _reset_trades(self)
     cdef void _remove_oldest_trades(self, int nb_to_remove)
@@ -33,5 +44,8 @@ cdef class TradesManager(util.Initializable):
     cpdef bint upsert_trade(self, str trade_id, dict raw_trade)
     cpdef void upsert_trade_instance(self, object trade)
     cpdef bint has_closing_trade_with_order_id(self, str order_id)
+    cpdef list get_trades_history(self, str symbol=*, object since=*, bint include_cancelled=*)
     cpdef dict get_total_paid_fees(self)
+    cpdef object get_traded_volume(self, str symbol, object side)
+    cpdef int get_trades_count(self, str symbol=*)
     cpdef void clear(self)
@@ -13,17 +13,21 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import bisect
 import collections
 
 import octobot_commons.logging as logging
 
+import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.trades.trades_history as trades_history
 import octobot_trading.util as util
 
 
 class TradesManager(util.Initializable):
     # memory usage for 100000 trades: approx 180 Mo
+    # older trades are compacted into compacted_trades
     MAX_TRADES_COUNT = 100000
 
     def __init__(self, trader):
@@ -32,6 +36,20 @@ class TradesManager(util.Initializable):
         self.trader = trader
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
+        # trades by trade id by origin order id
+        self.trades_by_origin_order_id = {}
+        # (times, trades) lists sorted by trade time by symbol, None being every symbol
+        self.trades_time_indexes = {}
+        # compacted trades removed from self.trades
+        self.compacted_trades = trades_history.CompactTradesHistory()
+
+        # aggregates of every trade, including compacted trades
+        # paid fees by currency
+        self.paid_fees = {}
+        # executed quantity by side by symbol, cancelled trades excluded
+        self.traded_volumes = {}
+        # trades count by symbol, cancelled trades excluded
+        self.trades_counts = {}
 
     async def initialize_impl(self):
         self._reset_trades()
@@ -44,40 +62,107 @@ class TradesManager(util.Initializable):
                 if trade_id in self.trades:
                     self.logger.debug(f"Replacement of an existing trade: {self.trades[trade_id].to_dict()} "
                                       f"by {created_trade.to_dict()} on id: {trade_id}")
-                self.trades[trade_id] = created_trade
+                self._add_trade(trade_id, created_trade)
                 self._check_trades_size()
                 return True
         return False
 
     def upsert_trade_instance(self, trade):
         if trade.trade_id not in self.trades:
-            self.trades[trade.trade_id] = trade
+            self._add_trade(trade.trade_id, trade)
             self._check_trades_size()
 
     def has_closing_trade_with_order_id(self, order_id) -> bool:
-        for trade in self.trades.values():
-            if trade.origin_order_id == order_id and trade.is_closing_order:
+        for trade in self.trades_by_origin_order_id.get(order_id, {}).values():
+            if trade.is_closing_order:
                 return True
         return False
 
+    def iter_trades(self, symbol=None, since=None, include_cancelled=False):
+        """
+        Iterate over trades by time without copying them, trades should not be added while iterating
+        :param symbol: the trades symbol, every symbol when None
+        :param since: the minimum trades time (excluded), ignored when None
+        :param include_cancelled: when False, cancelled trades are not returned
+        """
+        try:
+            times, trades = self.trades_time_indexes[symbol]
+        except KeyError:
+            return
+        for index in range(0 if since is None else bisect.bisect_right(times, since), len(trades)):
+            trade = trades[index]
+            if include_cancelled or trade.status is not enums.OrderStatus.CANCELED:
+                yield trade
+
+    def get_trades_history(self, symbol=None, since=None, include_cancelled=False):
+        """
+        :param symbol: the trades symbol, every symbol when None
+        :param since: the minimum trades time (excluded), ignored when None
+        :param include_cancelled: when False, cancelled trades are not returned
+        :return: the dict of every selected trade, including compacted trades, oldest first
+        """
+        return self.compacted_trades.get_trades(symbol=symbol, since=since, include_cancelled=include_cancelled) + [
+            trade.to_dict()
+            for trade in self.iter_trades(symbol=symbol, since=since, include_cancelled=include_cancelled)
+        ]
+
     def get_total_paid_fees(self):
-        total_fees = {}
-        for trade in self.trades.values():
-            if trade.fee is not None:
-                fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
-                fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
-                if fee_currency in total_fees:
-                    total_fees[fee_currency] += fee_cost
-                else:
-                    total_fees[fee_currency] = fee_cost
-            elif trade.status is not enums.OrderStatus.CANCELED:
-                self.logger.warning(f"Trade without any registered fee: {trade.to_dict()}")
-        return total_fees
+        """
+        :return: a copy of the paid fees by currency
+        """
+        return dict(self.paid_fees)
+
+    def get_traded_volume(self, symbol, side):
+        """
+        :return: the executed quantity of symbol trades on the given TradeOrderSide
+        """
+        return self.traded_volumes.get(symbol, {}).get(side, constants.ZERO)
+
+    def get_trades_count(self, symbol=None):
+        """
+        :return: the symbol trades count, every symbol trades count when symbol is None
+        """
+        if symbol is None:
+            return sum(self.trades_counts.values())
+        return self.trades_counts.get(symbol, 0)
 
     def get_trade(self, trade_id):
         return self.trades[trade_id]
 
     # private
+    def _add_trade(self, trade_id, trade):
+        self.trades[trade_id] = trade
+        self.trades_by_origin_order_id.setdefault(trade.origin_order_id, {})[trade_id] = trade
+        self._index_trade_time(None, trade)
+        self._index_trade_time(trade.symbol, trade)
+        self._update_aggregates(trade)
+
+    def _index_trade_time(self, symbol, trade):
+        times, trades = self.trades_time_indexes.setdefault(symbol, ([], []))
+        trade_time = trade.get_time()
+        if not times or trade_time >= times[-1]:
+            times.append(trade_time)
+            trades.append(trade)
+        else:
+            index = bisect.bisect_right(times, trade_time)
+            times.insert(index, trade_time)
+            trades.insert(index, trade)
+
+    def _update_aggregates(self, trade):
+        if trade.fee is not None:
+            fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
+            fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
+            if fee_currency in self.paid_fees:
+                self.paid_fees[fee_currency] += fee_cost
+            else:
+                self.paid_fees[fee_currency] = fee_cost
+        elif trade.status is not enums.OrderStatus.CANCELED:
+            self.logger.warning(f"Trade without any registered fee: {trade.symbol} trade with id: {trade.trade_id}")
+        if trade.status is not enums.OrderStatus.CANCELED:
+            symbol_volumes = self.traded_volumes.setdefault(trade.symbol, {})
+            symbol_volumes[trade.side] = symbol_volumes.get(trade.side, constants.ZERO) + trade.executed_quantity
+            self.trades_counts[trade.symbol] = self.trades_counts.get(trade.symbol, 0) + 1
+
     def _check_trades_size(self):
         if len(self.trades) > self.MAX_TRADES_COUNT:
             self._remove_oldest_trades(int(self.MAX_TRADES_COUNT / 10))
@@ -85,13 +170,43 @@ class TradesManager(util.Initializable):
     def _reset_trades(self):
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
+        self.trades_by_origin_order_id = {}
+        self.trades_time_indexes = {}
+        self.paid_fees = {}
+        self.traded_volumes = {}
+        self.trades_counts = {}
 
     def _remove_oldest_trades(self, nb_to_remove):
+        removed_trades = set()
         for _ in range(nb_to_remove):
-            self.trades.popitem(last=False)
+            trade_id, trade = self.trades.popitem(last=False)
+            removed_trades.add(trade)
+            # compacted trades remain in aggregates
+            self.compacted_trades.add_trade(trade)
+            order_trades = self.trades_by_origin_order_id.get(trade.origin_order_id, None)
+            if order_trades is not None:
+                order_trades.pop(trade_id, None)
+                if not order_trades:
+                    self.trades_by_origin_order_id.pop(trade.origin_order_id, None)
+        self._remove_from_trades_time_indexes(removed_trades)
+
+    def _remove_from_trades_time_indexes(self, removed_trades):
+        # filter indexes at once instead of removing trades one by one from sorted lists
+        for symbol, (times, trades) in list(self.trades_time_indexes.items()):
+            kept_indexes = [
+                index
+                for index, trade in enumerate(trades)
+                if trade not in removed_trades
+            ]
+            if kept_indexes:
+                self.trades_time_indexes[symbol] = ([times[index] for index in kept_indexes],
+                                                    [trades[index] for index in kept_indexes])
+            else:
+                self.trades_time_indexes.pop(symbol)
 
     def clear(self):
         for trade in self.trades.values():
             trade.trader = None
             trade.exchange_manager = None
         self._reset_trades()
+        self.compacted_trades.clear()
@@ -19,6 +19,12 @@ from octobot_trading.util.initializable cimport (
     Initializable,
 )
 
+from octobot_trading.util cimport fixed_point
+from octobot_trading.util.fixed_point cimport (
+    FixedPointConverter,
+    MarketFixedPoint,
+)
+
 from octobot_trading.util cimport config_util
 from octobot_trading.util.config_util cimport (
     is_trader_enabled,
@@ -35,6 +41,8 @@ from octobot_trading.util.config_util cimport (
 
 __all__ = [
     "Initializable",
+    "FixedPointConverter",
+    "MarketFixedPoint",
     "is_trader_enabled",
     "is_trader_simulator_enabled",
     "is_trade_history_loading_enabled",
@@ -19,6 +19,12 @@ from octobot_trading.util.initializable import (
     Initializable,
 )
 
+from octobot_trading.util import fixed_point
+from octobot_trading.util.fixed_point import (
+    FixedPointConverter,
+    MarketFixedPoint,
+)
+
 from octobot_trading.util import simulator_updater_utils
 from octobot_trading.util import config_util
 
@@ -45,6 +51,8 @@ __all__ = [
     "pause_time_consumer",
     "resume_time_consumer",
     "Initializable",
+    "FixedPointConverter",
+    "MarketFixedPoint",
     "is_trader_enabled",
     "is_trader_simulator_enabled",
     "is_trade_history_loading_enabled",
@@ -0,0 +1,34 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class FixedPointConverter:
+    cdef public int digits
+    cdef public object scale
+
+    cpdef object to_fixed(self, object value, bint round_up=*)
+    cpdef object from_float(self, object value, object round_up=*)
+    cpdef object float_to_decimal(self, object value)
+    cpdef object to_decimal(self, object fixed_value)
+    cpdef object trunc(self, object value)
+
+
+cdef class MarketFixedPoint:
+    cdef public FixedPointConverter price
+    cdef public FixedPointConverter amount
+
+    cpdef object adapt_price(self, object price)
+    cpdef object adapt_quantity(self, object quantity)
@@ -0,0 +1,114 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import sys
+
+import octobot_trading.constants as constants
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+
+# relative float representation error tolerated when converting floats
+FLOAT_PRECISION = 4 * sys.float_info.epsilon
+
+
+class FixedPointConverter:
+    """
+    Converts decimal.Decimal values into integers counting 10 ** -digits units and back.
+    Values having more than digits decimals are truncated (rounded toward zero).
+    """
+
+    def __init__(self, digits):
+        self.digits = max(int(digits), 0)
+        self.scale = 10 ** self.digits
+
+    def to_fixed(self, value, round_up=False):
+        """
+        :param value: the decimal.Decimal value to convert
+        :param round_up: when True, the value is rounded toward positive infinity instead of truncated
+        :return: the value as an integer count of 10 ** -digits units
+        """
+        scaled_value = value.scaleb(self.digits)
+        fixed_value = int(scaled_value)
+        if round_up and fixed_value < scaled_value:
+            return fixed_value + 1
+        return fixed_value
+
+    def from_float(self, value, round_up=None):
+        """
+        Convert a float value without formatting it as a string. Only use for values lower than
+        2 ** 53 * 10 ** -digits to avoid float precision issues.
+        :param value: the float value to convert
+        :param round_up: None to round to the closest integer count of 10 ** -digits units, True to round toward
+        positive infinity and False toward negative infinity. Values within float precision of a unit are
+        considered as exact in each case.
+        :return: the value as an integer count of 10 ** -digits units
+        """
+        scaled_value = value * self.scale
+        fixed_value = round(scaled_value)
+        if round_up is None or abs(scaled_value - fixed_value) <= abs(scaled_value) * FLOAT_PRECISION:
+            return fixed_value
+        if round_up:
+            return fixed_value if fixed_value > scaled_value else fixed_value + 1
+        return fixed_value if fixed_value < scaled_value else fixed_value - 1
+
+    def float_to_decimal(self, value):
+        """
+        :param value: the float value to convert
+        :return: the value rounded to digits decimals as a decimal.Decimal
+        """
+        return self.to_decimal(self.from_float(value))
+
+    def to_decimal(self, fixed_value):
+        """
+        :param fixed_value: an integer count of 10 ** -digits units
+        :return: the value as a decimal.Decimal
+        """
+        if fixed_value == 0:
+            return constants.ZERO
+        return decimal.Decimal(fixed_value).scaleb(-self.digits)
+
+    def trunc(self, value):
+        """
+        Same result as decimal_trunc_with_n_decimal_digits without formatting value as a string, values in
+        scientific notation are also truncated
+        :param value: the decimal.Decimal value to truncate
+        :return: value truncated to digits decimals, value itself when it already fits or is not a finite number
+        """
+        if not value.is_finite():
+            return value
+        scaled_value = value.scaleb(self.digits)
+        fixed_value = int(scaled_value)
+        if fixed_value == scaled_value:
+            return value
+        return self.to_decimal(fixed_value)
+
+
+class MarketFixedPoint:
+    """
+    Price and amount FixedPointConverter of a market, using its market status precision
+    """
+
+    def __init__(self, symbol_market):
+        precision = symbol_market.get(Ecmsc.PRECISION.value, {})
+        self.price = FixedPointConverter(
+            precision.get(Ecmsc.PRECISION_PRICE.value, constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS)
+        )
+        self.amount = FixedPointConverter(precision.get(Ecmsc.PRECISION_AMOUNT.value, 0))
+
+    def adapt_price(self, price):
+        return self.price.trunc(price)
+
+    def adapt_quantity(self, quantity):
+        return self.amount.trunc(quantity)
@@ -0,0 +1,295 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import concurrent.futures
+import concurrent.futures.process as futures_process
+import gc
+import multiprocessing
+import multiprocessing.shared_memory as shared_memory
+import weakref
+
+import numpy as np
+
+import octobot_backtesting.data as backtesting_data
+
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as logging
+
+import octobot_trading.api.portfolio as portfolio_api
+import octobot_trading.api.profitability as profitability_api
+import octobot_trading.api.trades as trades_api
+import octobot_trading.constants as constants
+import octobot_trading.exchange_data.ohlcv.preloaded_candles as preloaded_candles
+
+# layout indexes: each shared candles array is described by a (offset, rows count) tuple
+LAYOUT_OFFSET_INDEX = 0
+LAYOUT_ROWS_INDEX = 1
+
+
+class SharedCandles:
+    """
+    Stores the candles of (exchange name, symbol, time frame) keys in a single shared memory block.
+    Instances are pickled as the block name and layout: backtesting processes read candles from the block without
+    copying nor reloading them from databases.
+    Processes attaching to the block should be started by its owner process (as in MultiBacktestingRunner) to share
+    its resource tracker, which would otherwise destroy the block when they exit.
+    """
+
+    def __init__(self, shared_memory_name, layout):
+        """
+        :param shared_memory_name: the shared memory block name
+        :param layout: the (offset, rows count) tuple of each (exchange name, symbol, time frame value) key
+        """
+        self.shared_memory_name = shared_memory_name
+        self.layout = layout
+        self._shared_memory = None
+        # weak references to the candles arrays viewing the block: it can't be detached while they are alive
+        self._candles_references = []
+
+    @classmethod
+    def create(cls, candles_by_key):
+        """
+        :param candles_by_key: the candles (in any order) of each (exchange name, symbol, time frame value) key
+        :return: a SharedCandles owning its shared memory block: call unlink() when every backtesting is over
+        """
+        arrays = {
+            key: preloaded_candles.PreloadedCandles(candles).candles
+            for key, candles in candles_by_key.items()
+        }
+        block = shared_memory.SharedMemory(create=True, size=max(sum(array.nbytes for array in arrays.values()), 1))
+        layout = {}
+        offset = 0
+        for key, array in arrays.items():
+            np.ndarray(array.shape, dtype=np.float64, buffer=block.buf, offset=offset)[:] = array
+            layout[key] = (offset, len(array))
+            offset += array.nbytes
+        shared_candles = cls(block.name, layout)
+        shared_candles._shared_memory = block
+        return shared_candles
+
+    @classmethod
+    async def create_from_importers(cls, exchange_importers):
+        """
+        :param exchange_importers: the ExchangeDataImporter instances to read candles from
+        :return: a SharedCandles owning its shared memory block: call unlink() when every backtesting is over
+        """
+        candles_by_key = {}
+        for importer in exchange_importers:
+            for symbol in importer.symbols:
+                for time_frame in importer.time_frames:
+                    ohlcv_data = await importer.get_ohlcv_from_timestamps(
+                        exchange_name=importer.exchange_name,
+                        symbol=symbol,
+                        time_frame=time_frame,
+                        limit=backtesting_data.DataBase.DEFAULT_SIZE
+                    )
+                    candles_by_key[(importer.exchange_name, symbol, time_frame.value)] = \
+                        [ohlcv[-1] for ohlcv in ohlcv_data]
+        return cls.create(candles_by_key)
+
+    def get_candles(self, exchange_name, symbol, time_frame):
+        """
+        :return: the time sorted read-only candles array of the given key, None if missing
+        """
+        try:
+            offset, rows = self.layout[(exchange_name, symbol, time_frame)]
+        except KeyError:
+            return None
+        candles = np.ndarray((rows, len(commons_enums.PriceIndexes)), dtype=np.float64,
+                             buffer=self._get_shared_memory().buf, offset=offset)
+        candles.flags.writeable = False
+        self._candles_references.append(weakref.ref(candles))
+        return candles
+
+    def get_preloaded_candles(self, exchange_name, symbol, time_frame):
+        """
+        :return: a PreloadedCandles reading the shared candles of the given key, None if missing
+        """
+        candles = self.get_candles(exchange_name, symbol, time_frame)
+        return None if candles is None else preloaded_candles.PreloadedCandles(candles)
+
+    def close(self):
+        """
+        Detach from the shared memory block. The block stays attached while candles arrays (or views of them) are
+        still referenced: unmapping it would invalidate their memory.
+        :return: True if the block is detached
+        """
+        self._candles_references = [
+            reference
+            for reference in self._candles_references
+            if reference() is not None
+        ]
+        if self._candles_references:
+            logging.get_logger(self.__class__.__name__).debug(
+                f"{len(self._candles_references)} shared candles arrays are still in use: keeping "
+                f"{self.shared_memory_name} shared memory block attached")
+            return False
+        if self._shared_memory is not None:
+            self._shared_memory.close()
+            self._shared_memory = None
+        return True
+
+    def unlink(self):
+        """
+        Destroy the shared memory block, to be called by its owner only. The block memory is released when every
+        process detached from it.
+        """
+        self._get_shared_memory().unlink()
+        self.close()
+
+    def _get_shared_memory(self):
+        if self._shared_memory is None:
+            self._shared_memory = shared_memory.SharedMemory(name=self.shared_memory_name)
+        return self._shared_memory
+
+    def __getstate__(self):
+        return {"shared_memory_name": self.shared_memory_name, "layout": self.layout}
+
+    def __setstate__(self, state):
+        self.__init__(state["shared_memory_name"], state["layout"])
+
+
+class BacktestingResultsTable:
+    """
+    Compact backtesting results table: one row tuple per run
+    """
+    COLUMNS = (
+        "run_id",
+        "profitability",
+        "profitability_percent",
+        "market_profitability_percent",
+        "trades_count",
+        "paid_fees",
+        "end_portfolio",
+        "error",
+    )
+
+    def __init__(self):
+        self.rows = []
+
+    def add_result(self, run_id, result, error=None):
+        """
+        :param run_id: the backtesting run identifier
+        :param result: the run result dict, see get_backtesting_run_result
+        :param error: the run error description if any
+        """
+        result = result or {}
+        self.rows.append((run_id, ) + tuple(result.get(column) for column in self.COLUMNS[1:-1]) + (error, ))
+
+    def get_column(self, column):
+        """
+        :return: the values of the given column in rows order
+        """
+        index = self.COLUMNS.index(column)
+        return [row[index] for row in self.rows]
+
+    def get_best_row(self, column="profitability_percent"):
+        """
+        :return: the successful row with the highest value in the given column, None if there is no such row
+        """
+        index = self.COLUMNS.index(column)
+        rows = [row for row in self.rows if row[-1] is None and row[index] is not None]
+        return max(rows, key=lambda row: row[index]) if rows else None
+
+    def to_dicts(self):
+        return [dict(zip(self.COLUMNS, row)) for row in self.rows]
+
+    def __len__(self):
+        return len(self.rows)
+
+
+class MultiBacktestingRunner:
+    """
+    Runs backtestings in a process pool. Each run is performed by backtesting_function, an async function defined at
+    module level to be picklable: backtesting_function(run_config, shared_candles) should create its own
+    ExchangeManager (using ExchangeBuilder.use_shared_backtesting_candles(shared_candles)), trader and trading mode
+    from run_config, run the backtesting and return its result (see get_backtesting_run_result).
+    """
+
+    def __init__(self, backtesting_function, shared_candles, max_workers=None, mp_context=None):
+        """
+        :param backtesting_function: the async backtesting function
+        :param shared_candles: the SharedCandles to give to each run
+        :param max_workers: the maximum processes count, defaults to the CPU count
+        :param mp_context: the multiprocessing context, defaults to spawn to avoid forking running event loops
+        """
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.backtesting_function = backtesting_function
+        self.shared_candles = shared_candles
+        self.max_workers = max_workers
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    def run(self, run_configs):
+        """
+        :param run_configs: a dict of run configurations by run identifier
+        :return: the BacktestingResultsTable of every run, in run_configs order
+        """
+        results = {}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers,
+                                                    mp_context=self.mp_context) as executor:
+            futures = {
+                executor.submit(_run_backtesting, self.backtesting_function, run_id, run_config,
+                                self.shared_candles): run_id
+                for run_id, run_config in run_configs.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    run_id, result, error = future.result()
+                except futures_process.BrokenProcessPool as e:
+                    # a backtesting process died: every remaining run fails
+                    run_id, result, error = futures[future], None, f"{e.__class__.__name__}: {e}"
+                if error is not None:
+                    self.logger.error(f"Backtesting run {run_id} failed: {error}")
+                results[run_id] = (result, error)
+        results_table = BacktestingResultsTable()
+        for run_id in run_configs:
+            results_table.add_result(run_id, *results[run_id])
+        return results_table
+
+
+def get_backtesting_run_result(exchange_manager):
+    """
+    :return: the result dict of a finished backtesting exchange manager, to be returned by backtesting functions
+    """
+    profitability, profitability_percent, _, market_profitability_percent, _ = \
+        profitability_api.get_profitability_stats(exchange_manager)
+    return {
+        "profitability": float(profitability),
+        "profitability_percent": float(profitability_percent),
+        "market_profitability_percent": float(market_profitability_percent)
+        if market_profitability_percent is not None else None,
+        "trades_count": len(exchange_manager.exchange_personal_data.trades_manager.trades),
+        "paid_fees": {
+            currency: float(fees)
+            for currency, fees in trades_api.get_total_paid_trading_fees(exchange_manager).items()
+        },
+        "end_portfolio": {
+            currency: float(amounts[constants.CONFIG_PORTFOLIO_TOTAL])
+            for currency, amounts in portfolio_api.get_portfolio(exchange_manager, as_decimal=False).items()
+        },
+    }
+
+
+def _run_backtesting(backtesting_function, run_id, run_config, shared_candles):
+    try:
+        return run_id, asyncio.run(backtesting_function(run_config, shared_candles)), None
+    except Exception as e:
+        return run_id, None, f"{e.__class__.__name__}: {e}"
+    finally:
+        # release candles arrays still referenced by the finished backtesting before detaching from their block,
+        # the block stays attached until the process exits if some of them are still alive
+        gc.collect()
+        shared_candles.close()
@@ -0,0 +1,364 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import os
+import pickle
+import zlib
+
+import numpy as np
+
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as logging
+
+import octobot_trading.enums as enums
+import octobot_trading.exchange_channel as exchange_channel
+import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
+import octobot_trading.personal_data.orders.order_factory as order_factory
+import octobot_trading.personal_data.trades.trade as trade_class
+
+CHECKPOINT_FORMAT_VERSION = 2
+CHECKPOINT_COMPRESSION_LEVEL = 6
+
+# candles managers buffers, stored as raw float64 bytes
+CANDLES_BUFFERS = ("close", "open", "high", "low", "time", "volume")
+
+# orders and trades attributes restored as is, enums are stored as their values
+ORDER_ATTRIBUTES = (
+    "order_id", "status", "symbol", "currency", "market", "taker_or_maker", "timestamp", "side",
+    "creation_time", "origin_price", "created_last_price", "origin_quantity", "origin_stop_price", "order_type",
+    "exchange_order_type", "filled_quantity", "filled_price", "fee", "total_cost", "order_profitability",
+    "executed_time", "canceled_time", "reduce_only", "is_from_this_octobot",
+)
+TRADE_ATTRIBUTES = (
+    "status", "creation_time", "trade_id", "origin_order_id", "simulated", "is_closing_order", "symbol",
+    "currency", "market", "taker_or_maker", "origin_price", "origin_quantity", "trade_type", "side",
+    "executed_quantity", "canceled_time", "executed_time", "fee", "executed_price", "trade_profitability",
+    "total_cost", "exchange_trade_type",
+)
+ENUM_ATTRIBUTES = {
+    "status": enums.OrderStatus,
+    "side": enums.TradeOrderSide,
+    "order_type": enums.TraderOrderType,
+    "trade_type": enums.TraderOrderType,
+    "exchange_order_type": enums.TradeOrderType,
+    "exchange_trade_type": enums.TradeOrderType,
+}
+
+# simulated updaters attributes keeping track of the already pushed data
+UPDATER_CURSOR_ATTRIBUTES = (
+    "last_timestamp_pushed",
+    "last_timestamp_pushed_by_symbol",
+    "last_candles_by_pair_by_time_frame",
+    "require_last_init_candles_pairs_push",
+)
+
+
+class SimulationCheckpointer:
+    """
+    Saves the simulated state of an exchange manager into a checkpoint file every checkpoint_interval simulated
+    seconds: call on_timestamp(timestamp) from the backtesting time updates.
+    """
+
+    def __init__(self, exchange_manager, file_path, checkpoint_interval):
+        """
+        :param exchange_manager: the simulated exchange manager to checkpoint
+        :param file_path: the checkpoint file, replaced on each checkpoint
+        :param checkpoint_interval: the simulated seconds between two checkpoints
+        """
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.exchange_manager = exchange_manager
+        self.file_path = file_path
+        self.checkpoint_interval = checkpoint_interval
+        self.last_checkpoint_timestamp = None
+        self.checkpoints_count = 0
+
+    def on_timestamp(self, timestamp):
+        """
+        :param timestamp: the current simulated timestamp
+        :return: True when a checkpoint has been saved
+        """
+        if self.last_checkpoint_timestamp is None:
+            self.last_checkpoint_timestamp = timestamp
+        elif timestamp - self.last_checkpoint_timestamp >= self.checkpoint_interval:
+            size = save_checkpoint(self.exchange_manager, self.file_path)
+            self.last_checkpoint_timestamp = timestamp
+            self.checkpoints_count += 1
+            self.logger.debug(f"Saved checkpoint at {timestamp} into {self.file_path} ({size} bytes)")
+            return True
+        return False
+
+
+def save_checkpoint(exchange_manager, file_path):
+    """
+    Atomically write the simulated state of exchange_manager into file_path
+    :return: the checkpoint size in bytes
+    """
+    content = dumps_simulation_state(get_simulation_state(exchange_manager))
+    temp_file_path = f"{file_path}.tmp"
+    with open(temp_file_path, "wb") as checkpoint_file:
+        checkpoint_file.write(content)
+    # never leave a partially written checkpoint when interrupted
+    os.replace(temp_file_path, file_path)
+    return len(content)
+
+
+def load_checkpoint(file_path):
+    """
+    :param file_path: a file written by save_checkpoint, to be trusted as any pickle content
+    :return: the simulation state to give to restore_simulation_state
+    """
+    with open(file_path, "rb") as checkpoint_file:
+        return loads_simulation_state(checkpoint_file.read())
+
+
+def dumps_simulation_state(state):
+    return zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), CHECKPOINT_COMPRESSION_LEVEL)
+
+
+def loads_simulation_state(content):
+    state = pickle.loads(zlib.decompress(content))
+    if state.get("version") != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {state.get('version')}")
+    return state
+
+
+def get_simulation_state(exchange_manager):
+    """
+    :return: the simulated state of exchange_manager as plain data: exchange symbols data, simulated updaters
+    cursors and, when a trader is registered, its orders, trades, positions and portfolio
+    """
+    state = {
+        "version": CHECKPOINT_FORMAT_VERSION,
+        "current_time": exchange_manager.exchange.get_exchange_current_time(),
+        "symbols_data": {
+            symbol: _get_symbol_data_state(symbol_data)
+            for symbol, symbol_data in exchange_manager.exchange_symbols_data.exchange_symbol_data.items()
+        },
+        "updaters": _get_updaters_state(exchange_manager),
+        "personal_data": None,
+    }
+    if exchange_manager.trader is not None and exchange_manager.exchange_personal_data.portfolio_manager is not None:
+        state["personal_data"] = _get_personal_data_state(exchange_manager.exchange_personal_data)
+    return state
+
+
+async def restore_simulation_state(exchange_manager, state):
+    """
+    Restore a get_simulation_state state into an initialized exchange manager without any open order.
+    Open orders are recreated using the trader to register their price events.
+    """
+    time_manager = exchange_manager.exchange.backtesting.time_manager
+    time_manager.set_current_timestamp(state["current_time"])
+    for symbol, symbol_data_state in state["symbols_data"].items():
+        _restore_symbol_data(
+            exchange_manager.exchange_symbols_data.get_exchange_symbol_data(symbol), symbol_data_state
+        )
+    _restore_updaters(exchange_manager, state["updaters"])
+    if state["personal_data"] is not None:
+        await _restore_personal_data(exchange_manager.exchange_personal_data, state["personal_data"])
+
+
+def _get_symbol_data_state(symbol_data):
+    return {
+        "candles": {
+            time_frame.value: _get_candles_manager_state(symbol_candles)
+            for time_frame, symbol_candles in symbol_data.symbol_candles.items()
+        },
+        "order_book": _get_order_book_state(symbol_data.order_book_manager),
+        "mark_price": (symbol_data.prices_manager.mark_price, symbol_data.prices_manager.mark_price_set_time),
+    }
+
+
+def _restore_symbol_data(symbol_data, symbol_data_state):
+    for time_frame, candles_manager_state in symbol_data_state["candles"].items():
+        time_frame = commons_enums.TimeFrames(time_frame)
+        if time_frame not in symbol_data.symbol_candles:
+            symbol_data.symbol_candles[time_frame] = candles_manager.CandlesManager()
+        _restore_candles_manager(symbol_data.symbol_candles[time_frame], candles_manager_state)
+    _restore_order_book(symbol_data.order_book_manager, symbol_data_state["order_book"])
+    symbol_data.prices_manager.mark_price, symbol_data.prices_manager.mark_price_set_time = \
+        symbol_data_state["mark_price"]
+
+
+def _get_candles_manager_state(candles_manager):
+    return {
+        "buffers": {
+            name: (
+                np.asarray(getattr(candles_manager, f"{name}_candles")).tobytes(),
+                getattr(candles_manager, f"{name}_candles_index")
+            )
+            for name in CANDLES_BUFFERS
+        },
+        "reached_max": candles_manager.reached_max,
+        "candles_initialized": candles_manager.candles_initialized,
+    }
+
+
+def _restore_candles_manager(candles_manager, candles_manager_state):
+    for name, (buffer, index) in candles_manager_state["buffers"].items():
+        # copy to get a writable buffer
+        setattr(candles_manager, f"{name}_candles", np.frombuffer(buffer, dtype=np.float64).copy())
+        setattr(candles_manager, f"{name}_candles_index", index)
+    candles_manager.reached_max = candles_manager_state["reached_max"]
+    candles_manager.candles_initialized = candles_manager_state["candles_initialized"]
+
+
+def _get_order_book_state(order_book_manager):
+    return {
+        "asks": list(order_book_manager.asks.items()),
+        "bids": list(order_book_manager.bids.items()),
+        "timestamp": order_book_manager.timestamp,
+        "ticker": (order_book_manager.ask_quantity, order_book_manager.ask_price,
+                   order_book_manager.bid_quantity, order_book_manager.bid_price),
+        "order_book_initialized": order_book_manager.order_book_initialized,
+    }
+
+
+def _restore_order_book(order_book_manager, order_book_state):
+    order_book_manager.reset_order_book()
+    order_book_manager.asks.update(order_book_state["asks"])
+    order_book_manager.bids.update(order_book_state["bids"])
+    order_book_manager.timestamp = order_book_state["timestamp"]
+    order_book_manager.order_book_ticker_update(*order_book_state["ticker"])
+    order_book_manager.order_book_initialized = order_book_state["order_book_initialized"]
+
+
+def _get_updaters(exchange_manager):
+    for channel_name, channel in exchange_channel.get_exchange_channels(exchange_manager.id).items():
+        for producer in channel.producers:
+            yield channel_name, producer
+
+
+def _get_updaters_state(exchange_manager):
+    updaters_state = {}
+    for channel_name, producer in _get_updaters(exchange_manager):
+        updater_state = {
+            attribute: copy.deepcopy(getattr(producer, attribute))
+            for attribute in UPDATER_CURSOR_ATTRIBUTES
+            if hasattr(producer, attribute)
+        }
+        # preloaded data are reloaded on start: only keep their cursors
+        for attribute in ("preloaded_candles", "preloaded_recent_trades"):
+            preloaded_data = getattr(producer, attribute, None)
+            if preloaded_data:
+                updater_state[attribute] = {key: data.cursor for key, data in preloaded_data.items()}
+        if updater_state:
+            updaters_state[(channel_name, producer.__class__.__name__)] = updater_state
+    return updaters_state
+
+
+def _restore_updaters(exchange_manager, updaters_state):
+    for channel_name, producer in _get_updaters(exchange_manager):
+        updater_state = updaters_state.get((channel_name, producer.__class__.__name__))
+        if updater_state is None:
+            continue
+        for attribute, value in updater_state.items():
+            if attribute in ("preloaded_candles", "preloaded_recent_trades"):
+                preloaded_data = getattr(producer, attribute)
+                for key, cursor in value.items():
+                    if key in preloaded_data:
+                        preloaded_data[key].cursor = cursor
+            else:
+                setattr(producer, attribute, copy.deepcopy(value))
+
+
+def _get_personal_data_state(exchange_personal_data):
+    portfolio_manager = exchange_personal_data.portfolio_manager
+    value_holder = portfolio_manager.portfolio_value_holder
+    return {
+        "orders": [
+            _get_attributes_state(order, ORDER_ATTRIBUTES,
+                                  linked_to=order.linked_to.order_id if order.linked_to is not None else None,
+                                  linked_orders=[linked_order.order_id for linked_order in order.linked_orders])
+            for order in exchange_personal_data.orders_manager.get_open_orders()
+        ],
+        "trades": [
+            _get_attributes_state(trade, TRADE_ATTRIBUTES)
+            for trade in exchange_personal_data.trades_manager.trades.values()
+        ],
+        "positions": [
+            position.to_dict()
+            for position in exchange_personal_data.positions_manager.positions.values()
+        ],
+        "portfolio": copy.deepcopy(portfolio_manager.portfolio.get_read_only_portfolio()),
+        "origin_portfolio": copy.deepcopy(value_holder.origin_portfolio.portfolio)
+        if value_holder.origin_portfolio is not None else None,
+        "portfolio_origin_value": value_holder.portfolio_origin_value,
+        "origin_crypto_currencies_values": dict(value_holder.origin_crypto_currencies_values),
+        "last_prices_by_trading_pair": dict(value_holder.last_prices_by_trading_pair),
+    }
+
+
+async def _restore_personal_data(exchange_personal_data, personal_data_state):
+    trader = exchange_personal_data.trader
+    restored_orders = {}
+    for order_state in personal_data_state["orders"]:
+        order = order_factory.create_order_from_type(
+            trader,
+            enums.TraderOrderType(order_state["order_type"]),
+            side=None if order_state["side"] is None else enums.TradeOrderSide(order_state["side"])
+        )
+        _restore_attributes(order, order_state, ORDER_ATTRIBUTES)
+        order.linked_portfolio = exchange_personal_data.portfolio_manager.portfolio
+        # registers order price events (based on its creation time) and updates the portfolio available funds,
+        # available funds are then overwritten by the checkpoint portfolio
+        restored_orders[order.order_id] = await trader.create_order(order)
+    # link orders once every order is restored: linked orders can be restored in any order
+    for order_state in personal_data_state["orders"]:
+        order = restored_orders[order_state["order_id"]]
+        order.linked_to = restored_orders.get(order_state["linked_to"])
+        order.linked_orders = [
+            restored_orders[order_id]
+            for order_id in order_state["linked_orders"]
+            if order_id in restored_orders
+        ]
+    for trade_state in personal_data_state["trades"]:
+        trade = trade_class.Trade(trader)
+        _restore_attributes(trade, trade_state, TRADE_ATTRIBUTES)
+        exchange_personal_data.trades_manager.upsert_trade_instance(trade)
+    for raw_position in personal_data_state["positions"]:
+        await exchange_personal_data.positions_manager.upsert_position(
+            raw_position[enums.ExchangeConstantsPositionColumns.ID.value], raw_position
+        )
+
+    portfolio_manager = exchange_personal_data.portfolio_manager
+    portfolio_manager.portfolio.portfolio = copy.deepcopy(personal_data_state["portfolio"])
+    value_holder = portfolio_manager.portfolio_value_holder
+    if personal_data_state["origin_portfolio"] is not None:
+        value_holder.origin_portfolio = await portfolio_manager.portfolio.copy()
+        value_holder.origin_portfolio.portfolio = copy.deepcopy(personal_data_state["origin_portfolio"])
+    value_holder.portfolio_origin_value = personal_data_state["portfolio_origin_value"]
+    value_holder.origin_crypto_currencies_values = dict(personal_data_state["origin_crypto_currencies_values"])
+    value_holder.last_prices_by_trading_pair = dict(personal_data_state["last_prices_by_trading_pair"])
+    value_holder.conversion_graph = None
+    value_holder.invalidate_current_holdings_values()
+
+
+def _get_attributes_state(element, attributes, **kwargs):
+    state = {
+        attribute: value.value if attribute in ENUM_ATTRIBUTES and value is not None else value
+        for attribute, value in ((attribute, getattr(element, attribute)) for attribute in attributes)
+    }
+    state.update(kwargs)
+    return state
+
+
+def _restore_attributes(element, state, attributes):
+    for attribute in attributes:
+        value = state[attribute]
+        if attribute in ENUM_ATTRIBUTES and value is not None:
+            value = ENUM_ATTRIBUTES[attribute](value)
+        setattr(element, attribute, value)
@@ -0,0 +1,258 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import collections
+import decimal
+import gzip
+import json
+import time
+
+import async_channel.enums as channel_enums
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as logging
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.exchange_channel as exchange_channel
+
+DEFAULT_RECORDED_CHANNELS = [
+    constants.OHLCV_CHANNEL,
+    constants.RECENT_TRADES_CHANNEL,
+    constants.ORDER_BOOK_CHANNEL,
+    constants.TICKER_CHANNEL,
+    constants.MARK_PRICE_CHANNEL,
+]
+
+# channel consumers data keys that are not required to replay a message
+_IGNORED_DATA_KEYS = {"exchange", "exchange_id", "cryptocurrency"}
+
+# record indexes: each record is a [timestamp, channel_name, data] list
+RECORD_TIMESTAMP_INDEX = 0
+RECORD_CHANNEL_INDEX = 1
+RECORD_DATA_INDEX = 2
+
+
+class ChannelsRecorder:
+    """
+    Records exchange channels messages into an append-only file (one json record per line, gzip compressed when
+    the file name ends with .gz) to be replayed later using ChannelsReplayer
+    """
+
+    def __init__(self, exchange_manager, file_path, channels=None):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.exchange_manager = exchange_manager
+        self.file_path = file_path
+        self.channels = DEFAULT_RECORDED_CHANNELS if channels is None else channels
+        self.recorded_messages_count = 0
+        self._file = None
+        self._consumers = {}
+
+    async def start(self):
+        """
+        Open the record file and subscribe to recorded channels
+        """
+        self._file = _open_record_file(self.file_path, "a")
+        for channel_name in self.channels:
+            self._consumers[channel_name] = await exchange_channel.get_chan(
+                channel_name, self.exchange_manager.id
+            ).new_consumer(
+                self._get_channel_callback(channel_name),
+                priority_level=channel_enums.ChannelConsumerPriorityLevels.OPTIONAL.value
+            )
+
+    async def stop(self):
+        """
+        Unsubscribe from recorded channels and close the record file
+        """
+        for channel_name, consumer in self._consumers.items():
+            await exchange_channel.get_chan(channel_name, self.exchange_manager.id).remove_consumer(consumer)
+        self._consumers = {}
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.logger.debug(f"Recorded {self.recorded_messages_count} messages into {self.file_path}")
+
+    def record(self, channel_name, data):
+        """
+        Append a channel message to the record file
+        :param channel_name: the message channel
+        :param data: the message data as received by the channel consumers
+        """
+        self._file.write(json.dumps([
+            time.time(),
+            channel_name,
+            {key: value for key, value in data.items() if key not in _IGNORED_DATA_KEYS}
+        ], separators=(",", ":"), default=_json_default))
+        self._file.write("\n")
+        self.recorded_messages_count += 1
+
+    def _get_channel_callback(self, channel_name):
+        async def _channel_callback(**kwargs):
+            if channel_name == constants.MARK_PRICE_CHANNEL:
+                # mark price sources are not sent to consumers: record it to replay mark prices from the same source
+                kwargs["mark_price_source"] = self.exchange_manager.get_symbol_data(kwargs["symbol"]) \
+                    .prices_manager.mark_price_source
+            self.record(channel_name, kwargs)
+        return _channel_callback
+
+
+class ChannelsReplayer:
+    """
+    Replays a ChannelsRecorder file into the exchange channels producers of the given (simulated) exchange manager
+    and reports replay throughput and end-to-end latency (time between a message push and its reception by
+    a consumer of the same channel)
+    """
+
+    def __init__(self, exchange_manager, file_path, speed=1):
+        """
+        :param exchange_manager: the exchange manager to push messages into
+        :param file_path: the ChannelsRecorder file to replay
+        :param speed: the replay speed factor: 1 to replay at the recorded speed, 10 to replay 10 times faster,
+        0 to replay as fast as possible
+        """
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.exchange_manager = exchange_manager
+        self.file_path = file_path
+        self.speed = speed
+
+        self.pushed_messages_count = collections.Counter()
+        self.latencies = collections.defaultdict(list)
+        self._last_push_times = {}
+        self._consumers = {}
+
+    async def replay(self):
+        """
+        Replay every record of the file
+        :return: the replay report
+        """
+        records = read_records(self.file_path)
+        await self._add_probe_consumers({record[RECORD_CHANNEL_INDEX] for record in records})
+        try:
+            start_time = time.perf_counter()
+            first_timestamp = records[0][RECORD_TIMESTAMP_INDEX] if records else 0
+            for timestamp, channel_name, data in records:
+                delay = 0
+                if self.speed > 0:
+                    delay = (timestamp - first_timestamp) / self.speed - (time.perf_counter() - start_time)
+                # always give consumers a chance to process the previous messages
+                await asyncio.sleep(max(delay, 0))
+                await self._push(channel_name, data)
+            await asyncio.sleep(0)
+            return self.get_report(time.perf_counter() - start_time)
+        finally:
+            await self._remove_probe_consumers()
+
+    def get_report(self, duration):
+        """
+        :param duration: the replay duration in seconds
+        :return: a dict with the replay throughput and latencies (in milliseconds) by channel
+        """
+        total_count = sum(self.pushed_messages_count.values())
+        return {
+            "duration": duration,
+            "messages": total_count,
+            "throughput": total_count / duration if duration else 0,
+            "channels": {
+                channel_name: {
+                    "messages": count,
+                    "received": len(self.latencies[channel_name]),
+                    **_latency_stats(self.latencies[channel_name])
+                }
+                for channel_name, count in self.pushed_messages_count.items()
+            }
+        }
+
+    async def _push(self, channel_name, data):
+        producer = exchange_channel.get_chan(channel_name, self.exchange_manager.id).get_internal_producer()
+        symbol = data["symbol"]
+        self._last_push_times[(channel_name, symbol)] = time.perf_counter()
+        self.pushed_messages_count[channel_name] += 1
+        if channel_name == constants.OHLCV_CHANNEL:
+            await producer.push(commons_enums.TimeFrames(data["time_frame"]), symbol, data["candle"])
+        elif channel_name == constants.RECENT_TRADES_CHANNEL:
+            await producer.push(symbol, data["recent_trades"])
+        elif channel_name == constants.ORDER_BOOK_CHANNEL:
+            await producer.push(symbol, data["asks"], data["bids"])
+        elif channel_name == constants.TICKER_CHANNEL:
+            await producer.push(symbol, data["ticker"])
+        elif channel_name == constants.MARK_PRICE_CHANNEL:
+            await producer.push(symbol, data["mark_price"],
+                                mark_price_source=data.get("mark_price_source", None)
+                                or enums.MarkPriceSources.EXCHANGE_MARK_PRICE.value)
+        else:
+            self.logger.error(f"Replaying {channel_name} messages is not supported")
+
+    async def _add_probe_consumers(self, channel_names):
+        for channel_name in channel_names:
+            self._consumers[channel_name] = await exchange_channel.get_chan(
+                channel_name, self.exchange_manager.id
+            ).new_consumer(
+                self._get_probe_callback(channel_name),
+                priority_level=channel_enums.ChannelConsumerPriorityLevels.OPTIONAL.value
+            )
+
+    async def _remove_probe_consumers(self):
+        for channel_name, consumer in self._consumers.items():
+            await exchange_channel.get_chan(channel_name, self.exchange_manager.id).remove_consumer(consumer)
+        self._consumers = {}
+
+    def _get_probe_callback(self, channel_name):
+        async def _probe_callback(**kwargs):
+            try:
+                self.latencies[channel_name].append(
+                    time.perf_counter() - self._last_push_times[(channel_name, kwargs["symbol"])]
+                )
+            except KeyError:
+                # message not pushed by this replayer
+                pass
+        return _probe_callback
+
+
+def read_records(file_path):
+    """
+    :param file_path: a ChannelsRecorder file path
+    :return: the list of records of the file
+    """
+    with _open_record_file(file_path, "r") as record_file:
+        return [json.loads(line) for line in record_file if line.strip()]
+
+
+def _open_record_file(file_path, mode):
+    if file_path.endswith(".gz"):
+        # gzip files can be appended: each append creates a new gzip member
+        return gzip.open(file_path, f"{mode}t", encoding="utf-8")
+    return open(file_path, mode, encoding="utf-8")
+
+
+def _json_default(value):
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if hasattr(value, "items"):
+        return list(value.items())
+    return str(value)
+
+
+def _latency_stats(latencies):
+    if not latencies:
+        return {"latency_mean": None, "latency_p50": None, "latency_p95": None, "latency_max": None}
+    sorted_latencies = sorted(latencies)
+    count = len(sorted_latencies)
+    return {
+        "latency_mean": sum(sorted_latencies) / count * 1000,
+        "latency_p50": sorted_latencies[count // 2] * 1000,
+        "latency_p95": sorted_latencies[min(count - 1, int(count * 0.95))] * 1000,
+        "latency_max": sorted_latencies[-1] * 1000,
+    }
@@ -47,6 +47,7 @@ packages_list = [
     "octobot_trading.octobot_channel_consumer",
     "octobot_trading.util.initializable",
     "octobot_trading.util.config_util",
+    "octobot_trading.util.fixed_point",
     "octobot_trading.exchange_data.exchange_symbols_data",
     "octobot_trading.exchange_data.exchange_symbol_data",
     "octobot_trading.exchange_data.ticker.ticker_manager",
@@ -66,6 +67,7 @@ packages_list = [
     "octobot_trading.exchange_data.kline.channel.kline_updater",
     "octobot_trading.exchange_data.kline.channel.kline_updater_simulator",
     "octobot_trading.exchange_data.recent_trades.recent_trades_manager",
+    "octobot_trading.exchange_data.recent_trades.preloaded_recent_trades",
     "octobot_trading.exchange_data.recent_trades.channel.recent_trade",
     "octobot_trading.exchange_data.recent_trades.channel.recent_trade_updater_simulator",
     "octobot_trading.exchange_data.recent_trades.channel.recent_trade_updater",
@@ -76,6 +78,7 @@ packages_list = [
     "octobot_trading.exchange_data.prices.channel.prices_updater",
     "octobot_trading.exchange_data.ohlcv.candles_manager",
     "octobot_trading.exchange_data.ohlcv.candles_adapter",
+    "octobot_trading.exchange_data.ohlcv.preloaded_candles",
     "octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater",
     "octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator",
     "octobot_trading.exchange_data.ohlcv.channel.ohlcv",
@@ -84,12 +87,14 @@ packages_list = [
     "octobot_trading.personal_data.trades.trades_manager",
     "octobot_trading.personal_data.trades.trade",
     "octobot_trading.personal_data.trades.trade_factory",
+    "octobot_trading.personal_data.trades.trades_history",
     "octobot_trading.personal_data.trades.channel.trades_updater",
     "octobot_trading.personal_data.trades.channel.trades",
     "octobot_trading.personal_data.orders.order",
     "octobot_trading.personal_data.orders.order_adapter",
     "octobot_trading.personal_data.orders.decimal_order_adapter",
     "octobot_trading.personal_data.orders.orders_manager",
+    "octobot_trading.personal_data.orders.candle_fill_engine",
     "octobot_trading.personal_data.orders.order_state",
     "octobot_trading.personal_data.orders.order_util",
     "octobot_trading.personal_data.orders.order_factory",
@@ -114,7 +119,9 @@ packages_list = [
     "octobot_trading.personal_data.orders.channel.orders_updater_simulator",
     "octobot_trading.personal_data.orders.channel.orders",
     "octobot_trading.personal_data.orders.channel.orders_updater",
+    "octobot_trading.personal_data.orders.channel.orders_sync_strategy",
     "octobot_trading.personal_data.portfolios.portfolio_value_holder",
+    "octobot_trading.personal_data.portfolios.currency_conversion_graph",
     "octobot_trading.personal_data.portfolios.portfolio_manager",
     "octobot_trading.personal_data.portfolios.sub_portfolio",
     "octobot_trading.personal_data.portfolios.portfolio",
@@ -164,6 +171,8 @@ packages_list = [
     "octobot_trading.exchanges.traders.trader_simulator",
     "octobot_trading.exchanges.util.exchange_market_status_fixer",
     "octobot_trading.exchanges.util.websockets_util",
+    "octobot_trading.exchanges.util.websocket_micro_batcher",
+    "octobot_trading.exchanges.util.symbols_registry",
     "octobot_trading.exchanges.util.exchange_util",
     "octobot_trading.exchanges.types.spot_exchange",
     "octobot_trading.exchanges.types.margin_exchange",
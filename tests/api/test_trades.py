@@ -14,7 +14,63 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+import decimal
+
 import pytest
 
+import octobot_trading.api as api
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
 # All test coroutines will be treated as marked.
 pytestmark = pytest.mark.asyncio
+
+
+def _add_trade(exchange_manager, trader, trade_id, symbol, executed_time, fee=None):
+    trade = personal_data.Trade(trader)
+    trade.trade_id = trade_id
+    trade.origin_order_id = trade_id
+    trade.symbol = symbol
+    trade.status = enums.OrderStatus.FILLED
+    trade.side = enums.TradeOrderSide.BUY
+    trade.exchange_trade_type = enums.TradeOrderType.LIMIT
+    trade.executed_time = executed_time
+    trade.fee = fee
+    exchange_manager.exchange_personal_data.trades_manager.upsert_trade_instance(trade)
+    return trade
+
+
+async def test_get_trade_history(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    trades = [_add_trade(exchange_manager, trader, str(index), "BTC/USDT", index) for index in range(1, 6)]
+    eth_trade = _add_trade(exchange_manager, trader, "eth", "ETH/USDT", 3)
+    assert api.get_trade_history(exchange_manager, symbol="BTC/USDT") == trades
+    assert api.get_trade_history(exchange_manager, symbol="BTC/USDT", since=2) == trades[2:]
+    assert api.get_trade_history(exchange_manager, symbol="BTC/USDT", since=2, limit=2) == trades[2:4]
+    assert api.get_trade_history(exchange_manager, symbol="BTC/USDT", limit=2, offset=4) == trades[4:]
+    assert api.get_trade_history(exchange_manager, since=2, limit=2) == [trades[2], eth_trade]
+    assert api.get_trade_history(exchange_manager, symbol="BTC/USDT", since=3, as_dict=True) == \
+        [trade.to_dict() for trade in trades[3:]]
+    assert api.get_trade_history(exchange_manager, symbol="BTC/USDT", since=3, as_dict=True,
+                                 include_compacted=True, offset=1) == [trades[4].to_dict()]
+    iterator = api.iter_trade_history(exchange_manager, symbol="BTC/USDT", since=1)
+    assert next(iterator) is trades[1]
+    assert list(iterator) == trades[2:]
+
+
+async def test_get_total_paid_trading_fees(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    assert api.get_total_paid_trading_fees(exchange_manager) == {}
+    _add_trade(exchange_manager, trader, "1", "BTC/USDT", 1, fee={
+        enums.FeePropertyColumns.COST.value: decimal.Decimal("0.1"),
+        enums.FeePropertyColumns.CURRENCY.value: "BTC"
+    })
+    paid_fees = api.get_total_paid_trading_fees(exchange_manager)
+    assert paid_fees == {"BTC": decimal.Decimal("0.1")}
+    # returned fees can't be used to modify trades manager fees
+    paid_fees["BTC"] = decimal.Decimal("1")
+    paid_fees["USDT"] = decimal.Decimal("1")
+    assert api.get_total_paid_trading_fees(exchange_manager) == {"BTC": decimal.Decimal("0.1")}
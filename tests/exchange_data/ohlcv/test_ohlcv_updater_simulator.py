@@ -0,0 +1,143 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import mock
+import pytest
+
+import octobot_backtesting.api as backtesting_api
+from octobot_commons.enums import TimeFrames
+
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator import OHLCVUpdaterSimulator
+from octobot_trading.exchange_data.ohlcv.preloaded_candles import PreloadedCandles
+
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests.exchanges import DEFAULT_BACKTESTING_SYMBOL
+
+pytestmark = pytest.mark.asyncio
+
+HOUR = 3600
+TIME_FRAMES = [TimeFrames.FOUR_HOURS, TimeFrames.ONE_HOUR]
+# candles reaching 90 at 2h
+ONE_HOUR_CANDLES = [
+    [index * HOUR, 100, 101, 90 if index == 2 else 99, 100, 10]
+    for index in range(8)
+]
+FOUR_HOURS_CANDLES = [
+    [index * 4 * HOUR, 100, 101, 90, 100, 40]
+    for index in range(2)
+]
+
+
+async def _get_ohlcv_from_timestamps(exchange_name=None, symbol=None, time_frame=None, limit=-1,
+                                     inferior_timestamp=-1, superior_timestamp=-1):
+    # database rows: most recent first, candle as last element
+    candles = ONE_HOUR_CANDLES if time_frame is TimeFrames.ONE_HOUR else FOUR_HOURS_CANDLES
+    return [
+        [candle[0], exchange_name, symbol, time_frame.value, candle]
+        for candle in reversed(candles)
+        if (inferior_timestamp == -1 or candle[0] >= inferior_timestamp)
+        and (superior_timestamp == -1 or candle[0] <= superior_timestamp)
+    ]
+
+
+@pytest.fixture
+async def ohlcv_updater_simulator(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    exchange_manager.exchange_config.traded_time_frames = TIME_FRAMES
+    # 1h is only used as a real-time time frame
+    exchange_manager.exchange_config.available_required_time_frames = [TimeFrames.FOUR_HOURS]
+    channel = mock.Mock(exchange_manager=exchange_manager, exchange=exchange_manager.exchange)
+    with mock.patch.object(backtesting_api, "get_backtesting_current_time", mock.Mock(return_value=0)), \
+            mock.patch.object(OHLCVUpdaterSimulator, "_get_traded_pairs",
+                              mock.Mock(return_value=[DEFAULT_BACKTESTING_SYMBOL])), \
+            mock.patch.object(OHLCVUpdaterSimulator, "_get_time_frames", mock.Mock(return_value=TIME_FRAMES)):
+        updater = OHLCVUpdaterSimulator(channel, mock.Mock())
+    updater.preloaded_candles = {
+        DEFAULT_BACKTESTING_SYMBOL: {
+            TimeFrames.ONE_HOUR.value: PreloadedCandles(ONE_HOUR_CANDLES),
+            TimeFrames.FOUR_HOURS.value: PreloadedCandles(FOUR_HOURS_CANDLES),
+        }
+    }
+    return exchange_manager, updater
+
+
+async def test_get_next_interesting_timestamp(ohlcv_updater_simulator):
+    exchange_manager, updater = ohlcv_updater_simulator
+    # every evaluated time frame candle close is interesting
+    assert updater.get_next_interesting_timestamp(0, TIME_FRAMES) == HOUR
+    assert updater.get_next_interesting_timestamp(3 * HOUR, TIME_FRAMES) == 4 * HOUR
+    assert updater.get_next_interesting_timestamp(7 * HOUR, TIME_FRAMES) is None
+
+    # configured time frames are evaluated by default: 1h candles are skipped
+    assert updater.get_next_interesting_timestamp(0) == 4 * HOUR
+    assert updater.get_next_interesting_timestamp(0, [TimeFrames.FOUR_HOURS]) == 4 * HOUR
+    # nothing to wait for: go to the last candle
+    assert updater.get_next_interesting_timestamp(4 * HOUR) == 7 * HOUR
+
+    # unless an order can be filled before
+    exchange_manager.get_symbol_data(DEFAULT_BACKTESTING_SYMBOL).price_events_manager \
+        .add_event(decimal.Decimal(95), 0, False)
+    assert updater.get_next_interesting_timestamp(0) == 2 * HOUR
+
+    # candles are not preloaded
+    updater.preloaded_candles = {}
+    assert updater.get_next_interesting_timestamp(0) is None
+
+
+async def test_handle_timestamp_after_skipped_timestamps(ohlcv_updater_simulator):
+    exchange_manager, updater = ohlcv_updater_simulator
+    exchange_manager.exchange.get_current_future_candles()[DEFAULT_BACKTESTING_SYMBOL] = {}
+    updater.last_timestamp_pushed = HOUR
+    with mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock:
+        # 2h and 3h are skipped
+        await updater.handle_timestamp(4 * HOUR)
+        # skipped candles are pushed first, oldest first, then the same candles as when 3h is handled
+        assert push_mock.mock_calls == [
+            mock.call(TimeFrames.ONE_HOUR, DEFAULT_BACKTESTING_SYMBOL,
+                      [ONE_HOUR_CANDLES[2], ONE_HOUR_CANDLES[3]], partial=True),
+            mock.call(TimeFrames.FOUR_HOURS, DEFAULT_BACKTESTING_SYMBOL, [FOUR_HOURS_CANDLES[1]], partial=True),
+            mock.call(TimeFrames.ONE_HOUR, DEFAULT_BACKTESTING_SYMBOL,
+                      [ONE_HOUR_CANDLES[5], ONE_HOUR_CANDLES[4]], partial=True),
+        ]
+        push_mock.reset_mock()
+
+        await updater.handle_timestamp(5 * HOUR)
+        assert push_mock.mock_calls == [
+            mock.call(TimeFrames.ONE_HOUR, DEFAULT_BACKTESTING_SYMBOL,
+                      [ONE_HOUR_CANDLES[6], ONE_HOUR_CANDLES[5]], partial=True),
+        ]
+
+
+async def test_handle_timestamp_with_preloaded_candles(ohlcv_updater_simulator):
+    exchange_manager, updater = ohlcv_updater_simulator
+    exchange_manager.exchange.get_current_future_candles()[DEFAULT_BACKTESTING_SYMBOL] = {}
+    updater.exchange_data_importer.get_ohlcv_from_timestamps = _get_ohlcv_from_timestamps
+    pushes = []
+    for use_preloaded_candles in (False, True):
+        updater.preloaded_candles = {}
+        updater.last_timestamp_pushed = 0
+        if use_preloaded_candles:
+            await updater._preload_candles()
+            assert updater.preloaded_candles
+        with mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock:
+            for timestamp in range(0, 8 * HOUR, HOUR):
+                await updater.handle_timestamp(timestamp)
+            pushes.append(push_mock.mock_calls)
+    # preloaded candles are pushed as when read from database
+    assert pushes[0]
+    assert pushes[0] == pushes[1]
@@ -0,0 +1,67 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_trading.exchange_data.ohlcv.preloaded_candles import PreloadedCandles
+
+CANDLES = [
+    [3600, 1, 2, 0.5, 1.5, 10],
+    [0, 1, 2, 0.5, 1.5, 10],
+    [7200, 1, 2, 0.5, 1.5, 10],
+    [10800, 1, 2, 0.5, 1.5, 10],
+]
+
+
+def test_get_candles_from_timestamps():
+    preloaded_candles = PreloadedCandles(CANDLES)
+    assert len(preloaded_candles) == 4
+    # most recent first, bounds included
+    assert preloaded_candles.get_candles_from_timestamps(0, 3600) == [CANDLES[0], CANDLES[1]]
+    assert preloaded_candles.get_candles_from_timestamps(3601, 7200) == [CANDLES[2]]
+    assert preloaded_candles.cursor == 2
+    assert preloaded_candles.get_candles_from_timestamps(7201, 7300) == []
+    assert preloaded_candles.get_candles_from_timestamps(7201, 20000) == [CANDLES[3]]
+    assert preloaded_candles.get_candles_from_timestamps(10801, 20000) == []
+    # going back in time
+    assert preloaded_candles.get_candles_from_timestamps(1, 3600) == [CANDLES[0]]
+
+
+def test_get_next_candle_time():
+    preloaded_candles = PreloadedCandles(CANDLES)
+    assert preloaded_candles.get_next_candle_time(-1) == 0
+    assert preloaded_candles.get_next_candle_time(0) == 3600
+    assert preloaded_candles.get_next_candle_time(5000) == 7200
+    assert preloaded_candles.get_next_candle_time(10800) is None
+
+
+def test_get_next_candle_time_reaching():
+    candles = [
+        [0, 100, 105, 95, 100, 10],
+        [60, 100, 110, 98, 100, 10],
+        [120, 100, 102, 90, 100, 10],
+        [180, 100, 120, 80, 100, 10],
+    ]
+    preloaded_candles = PreloadedCandles(candles)
+    assert preloaded_candles.get_next_candle_time_reaching(0, None, None) is None
+    assert preloaded_candles.get_next_candle_time_reaching(0, 106, None) == 60
+    assert preloaded_candles.get_next_candle_time_reaching(0, None, 94) == 120
+    assert preloaded_candles.get_next_candle_time_reaching(0, 115, 94) == 120
+    assert preloaded_candles.get_next_candle_time_reaching(120, 115, 94) == 180
+    assert preloaded_candles.get_next_candle_time_reaching(180, 101, 99) is None
+
+
+def test_empty_and_memory_size():
+    assert PreloadedCandles([]).get_candles_from_timestamps(0, 10) == []
+    assert PreloadedCandles([]).get_memory_size() == 0
+    assert PreloadedCandles(CANDLES).get_memory_size() == 4 * 6 * 8 + 4 * 8
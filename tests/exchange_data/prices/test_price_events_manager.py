@@ -19,6 +19,8 @@ import pytest
 from asyncio import Event
 from mock import patch, Mock
 
+from octobot_trading.exchange_data.prices.price_events_manager import PriceEventsManager
+from octobot_trading.util import FixedPointConverter
 from tests.exchange_data import price_events_manager
 from tests import event_loop
 from tests.test_utils.random_numbers import random_recent_trade, decimal_random_price, random_price, random_timestamp
@@ -43,6 +45,16 @@ async def test_add_event(price_events_manager):
         assert len(price_events_manager.events) == 2
 
 
+async def test_get_pending_price_thresholds(price_events_manager):
+    assert price_events_manager.get_pending_price_thresholds() == (None, None)
+    price_events_manager.add_event(decimal.Decimal("110"), random_timestamp(), True)
+    price_events_manager.add_event(decimal.Decimal("105"), random_timestamp(), True)
+    assert price_events_manager.get_pending_price_thresholds() == (decimal.Decimal("105"), None)
+    price_events_manager.add_event(decimal.Decimal("90"), random_timestamp(), False)
+    price_events_manager.add_event(decimal.Decimal("95"), random_timestamp(), False)
+    assert price_events_manager.get_pending_price_thresholds() == (decimal.Decimal("105"), decimal.Decimal("95"))
+
+
 async def test_handle_recent_trades(price_events_manager):
     random_price_1 = random_price(min_value=2)
     random_timestamp_1 = random_timestamp(min_value=2, max_value=1000)
@@ -163,3 +175,38 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+
+
+async def test_fixed_point_price_events():
+    price_events_manager = PriceEventsManager(FixedPointConverter(2))
+    upper_event = price_events_manager.add_event(decimal.Decimal("110.005"), 10, True)
+    lower_event = price_events_manager.add_event(decimal.Decimal("89.995"), 10, False)
+    assert price_events_manager.get_pending_price_thresholds() == (decimal.Decimal("110.01"),
+                                                                   decimal.Decimal("89.99"))
+    price_events_manager.handle_price(110, 10)
+    price_events_manager.handle_price(90, 10)
+    assert not upper_event.is_set()
+    assert not lower_event.is_set()
+    # too early
+    price_events_manager.handle_price(110.01, 9)
+    assert not upper_event.is_set()
+    price_events_manager.handle_price(110.01, 10)
+    assert upper_event.is_set()
+    price_events_manager.handle_recent_trades([random_recent_trade(price=89.99, timestamp=11)])
+    assert lower_event.is_set()
+    assert price_events_manager.get_pending_price_thresholds() == (None, None)
+
+
+async def test_fixed_point_price_events_with_off_tick_prices():
+    price_events_manager = PriceEventsManager(FixedPointConverter(2))
+    upper_event = price_events_manager.add_event(decimal.Decimal("110.01"), 10, True)
+    lower_event = price_events_manager.add_event(decimal.Decimal("89.99"), 10, False)
+    # closest to events prices but not reaching them
+    price_events_manager.handle_price(110.009, 10)
+    price_events_manager.handle_recent_trades([random_recent_trade(price=89.991, timestamp=10)])
+    assert not upper_event.is_set()
+    assert not lower_event.is_set()
+    price_events_manager.handle_price(110.0101, 10)
+    assert upper_event.is_set()
+    price_events_manager.handle_recent_trades([random_recent_trade(price=89.9899, timestamp=10)])
+    assert lower_event.is_set()
@@ -39,10 +39,12 @@ async def test_initialize(prices_manager):
     # should be reset in init
     prices_manager.mark_price = 10
     prices_manager.mark_price_set_time = 10
+    prices_manager.mark_price_source = MarkPriceSources.EXCHANGE_MARK_PRICE.value
     prices_manager.valid_price_received_event.set()
 
     await prices_manager.initialize()
     assert prices_manager.mark_price == prices_manager.mark_price_set_time == 0
+    assert prices_manager.mark_price_source is None
     assert not prices_manager.valid_price_received_event.is_set()
 
 
@@ -58,10 +60,13 @@ async def test_set_mark_price_for_exchange_source(prices_manager):
     check_event_is_set(prices_manager)
     prices_manager.set_mark_price(25, MarkPriceSources.RECENT_TRADE_AVERAGE.value)
     assert prices_manager.mark_price == 10  # Drop first RT update
+    assert prices_manager.mark_price_source == MarkPriceSources.EXCHANGE_MARK_PRICE.value
     prices_manager.set_mark_price(30, MarkPriceSources.RECENT_TRADE_AVERAGE.value)
     assert prices_manager.mark_price == 30
+    assert prices_manager.mark_price_source == MarkPriceSources.RECENT_TRADE_AVERAGE.value
     prices_manager.set_mark_price(20, MarkPriceSources.TICKER_CLOSE_PRICE.value)
     assert prices_manager.mark_price == 30
+    assert prices_manager.mark_price_source == MarkPriceSources.RECENT_TRADE_AVERAGE.value
     prices_manager.set_mark_price(15, MarkPriceSources.EXCHANGE_MARK_PRICE.value)
     assert prices_manager.mark_price == 15
 
@@ -0,0 +1,67 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import sys
+
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
+from octobot_trading.exchange_data.recent_trades.preloaded_recent_trades import PreloadedRecentTrades
+
+RECORDS = [
+    (10, [
+        {ECOC.ID.value: "1", ECOC.TIMESTAMP.value: 5, ECOC.PRICE.value: 100, ECOC.AMOUNT.value: 1,
+         ECOC.SIDE.value: "buy"},
+        {ECOC.ID.value: "2", ECOC.TIMESTAMP.value: 8, ECOC.PRICE.value: 101, ECOC.AMOUNT.value: 2,
+         ECOC.SIDE.value: "sell"},
+    ]),
+    # overlapping record, timestamps in milliseconds
+    (20, [
+        {ECOC.ID.value: "2", ECOC.TIMESTAMP.value: 8000, ECOC.PRICE.value: 101, ECOC.AMOUNT.value: 2,
+         ECOC.SIDE.value: "sell"},
+        {ECOC.ID.value: "3", ECOC.TIMESTAMP.value: 15000, ECOC.PRICE.value: 99, ECOC.AMOUNT.value: 0.5,
+         ECOC.SIDE.value: "buy"},
+        {ECOC.ID.value: "4", ECOC.TIMESTAMP.value: 15000, ECOC.PRICE.value: 98},
+        # no price: ignored
+        {ECOC.ID.value: "5", ECOC.TIMESTAMP.value: 16000},
+    ]),
+]
+
+
+def test_get_recent_trades_until():
+    preloaded_recent_trades = PreloadedRecentTrades("BTC/USDT", RECORDS)
+    assert len(preloaded_recent_trades) == 4
+    assert preloaded_recent_trades.get_recent_trades_until(4) == []
+    assert preloaded_recent_trades.get_recent_trades_until(8) == [
+        {ECOC.TIMESTAMP.value: 5, ECOC.SYMBOL.value: "BTC/USDT", ECOC.ID.value: "1", ECOC.SIDE.value: "buy",
+         ECOC.PRICE.value: 100, ECOC.AMOUNT.value: 1},
+        {ECOC.TIMESTAMP.value: 8, ECOC.SYMBOL.value: "BTC/USDT", ECOC.ID.value: "2", ECOC.SIDE.value: "sell",
+         ECOC.PRICE.value: 101, ECOC.AMOUNT.value: 2},
+    ]
+    assert preloaded_recent_trades.get_recent_trades_until(10) == []
+    assert preloaded_recent_trades.get_next_trade_time() == 15
+    assert [trade[ECOC.ID.value] for trade in preloaded_recent_trades.get_recent_trades_until(30)] == ["3", "4"]
+    assert preloaded_recent_trades.get_next_trade_time() is None
+    assert preloaded_recent_trades.get_recent_trades_until(40) == []
+
+
+def test_empty_and_memory_size():
+    assert PreloadedRecentTrades("BTC/USDT", []).get_recent_trades_until(10) == []
+    assert PreloadedRecentTrades("BTC/USDT", []).get_memory_size() == 2 * sys.getsizeof([])
+    preloaded_recent_trades = PreloadedRecentTrades("BTC/USDT", RECORDS)
+    assert preloaded_recent_trades.get_memory_size() == \
+        3 * 4 * 8 + \
+        sys.getsizeof(preloaded_recent_trades.sides) + \
+        sum(sys.getsizeof(side) for side in ("buy", "sell", None)) + \
+        sys.getsizeof(preloaded_recent_trades.ids) + \
+        sum(sys.getsizeof(trade_id) for trade_id in ("1", "2", "3", "4"))
@@ -14,8 +14,10 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import ccxt
 import mock
 
+import octobot_trading.errors as errors
 import octobot_trading.exchanges.connectors as exchange_connectors
 import pytest
 
@@ -101,3 +103,49 @@ async def test_initialize_impl(exchange_manager):
             "2h",
             "4h",
         }
+
+
+async def test_cancel_orders(exchange_manager):
+    ccxt_exchange = exchange_connectors.CCXTExchange(exchange_manager.config, exchange_manager)
+
+    class MockCCXT:
+        def __init__(self, open_orders_ids):
+            self.has = {"fetchOpenOrders": True, "cancelAllOrders": True, "cancelOrders": True}
+            self.fetch_open_orders = mock.AsyncMock(side_effect=[
+                [{"id": order_id} for order_id in open_orders_ids],
+                [{"id": order_id} for order_id in open_orders_ids if order_id not in ("1", "2")]
+            ])
+            self.cancel_all_orders = mock.AsyncMock()
+            self.cancel_orders = mock.AsyncMock()
+
+    # every open order is to be cancelled: use cancelAllOrders
+    client = MockCCXT(["1", "2"])
+    with mock.patch.object(ccxt_exchange, 'client', new=client):
+        assert await ccxt_exchange.cancel_orders(["1", "2"], symbol="BTC/USDT", cancel_all=True) == \
+            {"1": True, "2": True}
+        client.cancel_all_orders.assert_called_once()
+        client.cancel_orders.assert_not_called()
+
+    # order 3 is not to be cancelled: don't use cancelAllOrders
+    client = MockCCXT(["1", "2", "3"])
+    with mock.patch.object(ccxt_exchange, 'client', new=client):
+        assert await ccxt_exchange.cancel_orders(["1", "2"], symbol="BTC/USDT", cancel_all=True) == \
+            {"1": True, "2": True}
+        client.cancel_all_orders.assert_not_called()
+        client.cancel_orders.assert_called_once()
+
+
+async def test_get_open_orders(exchange_manager):
+    ccxt_exchange = exchange_connectors.CCXTExchange(exchange_manager.config, exchange_manager)
+
+    class MockCCXT:
+        def __init__(self):
+            self.has = {"fetchOpenOrders": True}
+            self.fetch_open_orders = mock.AsyncMock(side_effect=ccxt.ArgumentsRequired("symbol required"))
+
+    with mock.patch.object(ccxt_exchange, 'client', new=MockCCXT()):
+        # exchange requiring a symbol to fetch open orders
+        with pytest.raises(errors.NotSupported):
+            await ccxt_exchange.get_open_orders()
+        with pytest.raises(ccxt.ArgumentsRequired):
+            await ccxt_exchange.get_open_orders(symbol="BTC/USDT")
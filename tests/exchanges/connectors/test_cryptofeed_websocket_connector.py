@@ -0,0 +1,58 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import cryptofeed.defines as cryptofeed_defines
+import cryptofeed.exchanges as cryptofeed_exchanges
+import mock
+import pytest
+
+import octobot_trading.exchanges as exchanges
+import octobot_trading.exchanges.connectors as exchange_connectors
+
+from tests import event_loop
+from tests.exchanges import backtesting_exchange_manager, backtesting_config, fake_backtesting
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+class _WebsocketConnector(exchange_connectors.CryptofeedWebsocketConnector):
+    @classmethod
+    def get_name(cls):
+        return "binance"
+
+    @classmethod
+    def get_feed_name(cls):
+        return cryptofeed_defines.BINANCE
+
+
+async def test_stop_flushes_micro_batchers_before_close(backtesting_exchange_manager):
+    # don't fetch cryptofeed exchange symbols
+    with mock.patch.dict(cryptofeed_exchanges.EXCHANGE_MAP, {cryptofeed_defines.BINANCE: mock.Mock()}):
+        connector = _WebsocketConnector(backtesting_exchange_manager.config, backtesting_exchange_manager)
+    flush_callback = mock.AsyncMock()
+    connector.recent_trades_batcher = exchanges.WebsocketMicroBatcher(flush_callback, window=10)
+    await connector.recent_trades_batcher.add("BTC/USDT", 1)
+    connector.client = mock.Mock(feeds=[], raw_data_collection=None)
+    connector.local_loop = asyncio.get_event_loop()
+
+    await connector.stop()
+    # waiting messages are pushed when stopping
+    flush_callback.assert_awaited_once_with("BTC/USDT", [1])
+    await connector.close()
+    assert connector.recent_trades_batcher.batches == {}
+    assert connector.recent_trades_batcher.flush_handles == {}
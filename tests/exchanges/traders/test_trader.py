@@ -129,6 +129,64 @@ class TestTrader:
 
         await self.stop(exchange_manager)
 
+    async def test_create_orders(self):
+        _, exchange_manager, trader_inst = await self.init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        orders = [
+            create_order_instance(trader=trader_inst,
+                                  order_type=TraderOrderType.BUY_LIMIT,
+                                  symbol=self.DEFAULT_SYMBOL,
+                                  current_price=decimal.Decimal("70"),
+                                  quantity=decimal.Decimal("1"),
+                                  price=price)
+            for price in (decimal.Decimal("60"), decimal.Decimal("50"))
+        ]
+        # simulated orders are not sent to the exchange
+        with patch.object(exchange_manager.exchange, "create_orders", new=AsyncMock()) as create_orders_mock:
+            assert await trader_inst.create_orders(orders) == orders
+            create_orders_mock.assert_not_called()
+        assert all(order in orders_manager.get_open_orders() for order in orders)
+        await self.stop(exchange_manager)
+
+    async def test_create_orders_on_exchange(self):
+        _, exchange_manager, trader_inst = await self.init_default()
+        trader_inst.simulate = False
+        portfolio = exchange_manager.exchange_personal_data.portfolio_manager.portfolio
+        initial_usdt = portfolio.get_currency_portfolio("USDT")
+        orders = [
+            create_order_instance(trader=trader_inst,
+                                  order_type=TraderOrderType.BUY_LIMIT,
+                                  symbol=self.DEFAULT_SYMBOL,
+                                  current_price=decimal.Decimal("70"),
+                                  quantity=decimal.Decimal("1"),
+                                  price=price)
+            for price in (decimal.Decimal("10"), decimal.Decimal("20"))
+        ]
+        exchange_order = {
+            "side": TradeOrderSide.BUY.value,
+            "type": TradeOrderType.LIMIT.value,
+            "symbol": self.DEFAULT_SYMBOL,
+            "amount": 1,
+            "filled": 0,
+            "id": "1546541123",
+            "status": OrderStatus.OPEN.value,
+            "price": 10,
+            "timestamp": time.time()
+        }
+        # second order creation failed
+        with patch.object(exchange_manager.exchange, "create_orders",
+                          new=AsyncMock(return_value=[exchange_order, None])) as create_orders_mock:
+            created_order, failed_order = await trader_inst.create_orders(orders)
+            create_orders_mock.assert_called_once()
+            assert len(create_orders_mock.mock_calls[0].args[0]) == 2
+        assert failed_order is None
+        assert created_order.order_id == "1546541123"
+        assert created_order in exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+        # only the created order funds are reserved
+        assert portfolio.get_currency_portfolio("USDT") == initial_usdt - decimal.Decimal("10")
+        trader_inst.simulate = True
+        await self.stop(exchange_manager)
+
     async def test_cancel_stop_order(self):
         _, exchange_manager, trader_inst = await self.init_default()
         orders_manager = exchange_manager.exchange_personal_data.orders_manager
@@ -227,6 +285,42 @@ class TestTrader:
 
         await self.stop(exchange_manager)
 
+    async def test_cancel_open_orders_on_exchange(self):
+        _, exchange_manager, trader_inst = await self.init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        limit_buy_1 = BuyLimitOrder(trader_inst)
+        limit_buy_1.update(order_type=TraderOrderType.BUY_LIMIT,
+                           symbol=self.DEFAULT_SYMBOL,
+                           current_price=decimal.Decimal("70"),
+                           quantity=decimal.Decimal("10"),
+                           price=decimal.Decimal("70"))
+        limit_buy_2 = BuyLimitOrder(trader_inst)
+        limit_buy_2.update(order_type=TraderOrderType.BUY_LIMIT,
+                           symbol=self.DEFAULT_SYMBOL,
+                           current_price=decimal.Decimal("30"),
+                           quantity=decimal.Decimal("10"),
+                           price=decimal.Decimal("30"))
+        await trader_inst.create_order(limit_buy_1)
+        await trader_inst.create_order(limit_buy_2)
+
+        trader_inst.simulate = False
+        # second order cancel failed
+        with patch.object(exchange_manager.exchange, "cancel_orders",
+                          new=AsyncMock(return_value={limit_buy_1.order_id: True,
+                                                      limit_buy_2.order_id: False})) as cancel_orders_mock, \
+                patch.object(exchange_manager.exchange, "cancel_order", new=AsyncMock()) as cancel_order_mock:
+            assert await trader_inst.cancel_open_orders(self.DEFAULT_SYMBOL) is False
+            # one bulk request, no order by order request
+            cancel_orders_mock.assert_called_once_with([limit_buy_1.order_id, limit_buy_2.order_id],
+                                                       symbol=self.DEFAULT_SYMBOL, cancel_all=True)
+            cancel_order_mock.assert_not_called()
+        trader_inst.simulate = True
+
+        assert limit_buy_1 not in orders_manager.get_open_orders()
+        assert limit_buy_2 in orders_manager.get_open_orders()
+
+        await self.stop(exchange_manager)
+
     async def test_cancel_open_orders_multi_symbol(self):
         config, exchange_manager, trader_inst = await self.init_default()
         orders_manager = exchange_manager.exchange_personal_data.orders_manager
@@ -0,0 +1,59 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+from octobot_trading.exchanges.exchange_manager import ExchangeManager
+from octobot_trading.exchanges.util.symbols_registry import SymbolsRegistry
+
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_symbol(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    registry = exchange_manager.symbols_registry
+    symbol = registry.get_symbol("BTC/USDT")
+    assert symbol.symbol == "BTC/USDT"
+    assert symbol.base == "BTC"
+    assert symbol.quote == "USDT"
+    # interned
+    assert registry.get_symbol("BTC/USDT") is symbol
+    assert registry.get_base_and_quote("BTC/USDT") == ("BTC", "USDT")
+    assert exchange_manager.get_exchange_quote_and_base("ETH/BTC") == ("ETH", "BTC")
+    assert exchange_manager.get_pair_cryptocurrency("ETH/BTC") == "ETH"
+    assert len(registry.symbols) == 2
+
+    registry.clear()
+    assert registry.symbols == {}
+    assert registry.get_symbol("BTC/USDT") is not symbol
+
+
+async def test_get_market_status(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    registry = exchange_manager.symbols_registry
+    market_status = registry.get_market_status("BTC/USDT")
+    assert market_status
+    # cached
+    assert registry.get_market_status("BTC/USDT") is market_status
+    assert registry.get_symbol("BTC/USDT").market_status is market_status
+
+
+async def test_split_symbol_without_exchange(backtesting_config):
+    # exchange is not created before exchange_manager initialization
+    registry = SymbolsRegistry(ExchangeManager(backtesting_config, "binance"))
+    assert registry.get_base_and_quote("BTC/USDT") == ("BTC", "USDT")
@@ -0,0 +1,123 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import mock
+import pytest
+
+from tests import event_loop
+import octobot_trading.exchanges as exchanges
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_add_without_batching():
+    flush_callback = mock.AsyncMock()
+    batcher = exchanges.WebsocketMicroBatcher(flush_callback)
+    assert not batcher.is_enabled()
+    await batcher.add("BTC/USDT", 1)
+    await batcher.add("BTC/USDT", 2)
+    assert flush_callback.mock_calls == [mock.call("BTC/USDT", [1]), mock.call("BTC/USDT", [2])]
+    assert batcher.batches == {}
+
+
+async def test_add_with_max_size():
+    flush_callback = mock.AsyncMock()
+    batcher = exchanges.WebsocketMicroBatcher(flush_callback, max_size=3)
+    await batcher.add("BTC/USDT", 1)
+    await batcher.add("ETH/USDT", 1)
+    await batcher.add("BTC/USDT", 2)
+    flush_callback.assert_not_called()
+    await batcher.add("BTC/USDT", 3)
+    flush_callback.assert_called_once_with("BTC/USDT", [1, 2, 3])
+    assert batcher.batches == {"ETH/USDT": [1]}
+    flush_callback.reset_mock()
+    await batcher.flush_all()
+    flush_callback.assert_called_once_with("ETH/USDT", [1])
+    assert batcher.batches == {}
+
+
+async def test_add_with_window():
+    flush_callback = mock.AsyncMock()
+    batcher = exchanges.WebsocketMicroBatcher(flush_callback, window=0.01)
+    await batcher.add("BTC/USDT", 1)
+    await batcher.add("BTC/USDT", 2)
+    flush_callback.assert_not_called()
+    await asyncio.sleep(0.05)
+    flush_callback.assert_called_once_with("BTC/USDT", [1, 2])
+    assert batcher.batches == {}
+    assert batcher.flush_handles == {}
+
+
+async def test_add_keep_last_only():
+    flush_callback = mock.AsyncMock()
+    batcher = exchanges.WebsocketMicroBatcher(flush_callback, window=10, keep_last_only=True)
+    await batcher.add("BTC/USDT", 1)
+    await batcher.add("BTC/USDT", 2)
+    await batcher.flush("BTC/USDT")
+    flush_callback.assert_called_once_with("BTC/USDT", [2])
+    assert batcher.flush_handles == {}
+
+
+async def test_clear():
+    flush_callback = mock.AsyncMock()
+    batcher = exchanges.WebsocketMicroBatcher(flush_callback, window=0.01)
+    await batcher.add("BTC/USDT", 1)
+    batcher.clear()
+    await asyncio.sleep(0.05)
+    flush_callback.assert_not_called()
+    assert batcher.batches == {}
+
+
+async def test_clear_cancels_flush_tasks():
+    flush_callback = mock.AsyncMock()
+    batcher = exchanges.WebsocketMicroBatcher(flush_callback, window=0.01)
+    await batcher.add("BTC/USDT", 1)
+
+    async def _slow_flush(key):
+        await asyncio.sleep(1)
+
+    with mock.patch.object(batcher, "flush", mock.AsyncMock(side_effect=_slow_flush)):
+        await asyncio.sleep(0.05)
+        # window elapsed: the flush task is running
+        assert batcher.flush_handles == {}
+        assert len(batcher.flush_tasks) == 1
+        flush_task = next(iter(batcher.flush_tasks))
+        batcher.clear()
+        assert batcher.flush_tasks == set()
+        with pytest.raises(asyncio.CancelledError):
+            await flush_task
+
+
+async def test_flush_tasks_are_released():
+    flush_callback = mock.AsyncMock()
+    batcher = exchanges.WebsocketMicroBatcher(flush_callback, window=0.01)
+    await batcher.add("BTC/USDT", 1)
+    await asyncio.sleep(0.05)
+    flush_callback.assert_called_once_with("BTC/USDT", [1])
+    assert batcher.flush_tasks == set()
+
+
+async def test_flush_all_before_clear():
+    flush_callback = mock.AsyncMock()
+    batcher = exchanges.WebsocketMicroBatcher(flush_callback, window=10)
+    await batcher.add("BTC/USDT", 1)
+    await batcher.add("ETH/USDT", 2)
+    await batcher.flush_all()
+    batcher.clear()
+    assert flush_callback.mock_calls == [mock.call("BTC/USDT", [1]), mock.call("ETH/USDT", [2])]
+    assert batcher.flush_handles == {}
+    assert batcher.batches == {}
@@ -0,0 +1,106 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import numpy as np
+import pytest
+
+from octobot_trading.enums import TraderOrderType
+from octobot_trading.personal_data.orders import CandleFillEngine, get_reached_orders_mask
+
+from tests.personal_data import DEFAULT_ORDER_SYMBOL, DEFAULT_SYMBOL_QUANTITY
+from tests import event_loop
+from tests.exchanges import simulated_trader, simulated_exchange_manager
+from tests.personal_data.orders import buy_limit_order, sell_limit_order, stop_loss_sell_order
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_reached_orders_mask():
+    mask = get_reached_orders_mask(
+        np.array([100, 100, 85, 120, 80, 110], dtype=np.float64),
+        np.array([False, False, False, True, True, True]),
+        np.array([10, 30, 10, 10, 10, 20], dtype=np.float64),
+        20,
+        110,
+        90
+    )
+    # 0: reached from above, 1: created after timestamp, 2: price under low price, 3: price over high price,
+    # 4: reached from below, 5: reached at high price by an order created at timestamp
+    assert mask.tolist() == [True, False, False, False, True, True]
+
+
+async def test_fill_orders(buy_limit_order):
+    order_price = decimal.Decimal("100")
+    buy_limit_order.update(
+        price=order_price,
+        quantity=decimal.Decimal("0.1"),
+        symbol=DEFAULT_ORDER_SYMBOL,
+        order_type=TraderOrderType.BUY_LIMIT,
+    )
+    exchange_personal_data = buy_limit_order.exchange_manager.exchange_personal_data
+    candle_fill_engine = CandleFillEngine(exchange_personal_data.orders_manager)
+    exchange_personal_data.candle_fill_engine = candle_fill_engine
+    buy_limit_order.exchange_manager.is_backtesting = True  # force update_order_status
+    await buy_limit_order.initialize()
+    exchange_personal_data.orders_manager.upsert_order_instance(buy_limit_order)
+    # no price event: filled by the candle fill engine
+    assert buy_limit_order.limit_price_hit_event is None
+    assert candle_fill_engine.get_price_thresholds(DEFAULT_ORDER_SYMBOL) == (None, order_price)
+
+    assert await candle_fill_engine.fill_orders(DEFAULT_ORDER_SYMBOL, buy_limit_order.creation_time, 120, 101) == []
+    assert not buy_limit_order.is_filled()
+    # created after candle
+    assert await candle_fill_engine.fill_orders(DEFAULT_ORDER_SYMBOL, buy_limit_order.creation_time - 1, 120, 90) \
+        == []
+    assert await candle_fill_engine.fill_orders(DEFAULT_ORDER_SYMBOL, buy_limit_order.creation_time, 120, 90) \
+        == [buy_limit_order]
+    assert buy_limit_order.is_filled()
+    assert candle_fill_engine.get_price_thresholds(DEFAULT_ORDER_SYMBOL) == (None, None)
+
+
+async def test_fill_orders_with_linked_orders(sell_limit_order, stop_loss_sell_order):
+    quantity = decimal.Decimal(str(DEFAULT_SYMBOL_QUANTITY / 10))
+    sell_limit_order.update(
+        price=decimal.Decimal("120"),
+        quantity=quantity,
+        symbol=DEFAULT_ORDER_SYMBOL,
+        order_type=TraderOrderType.SELL_LIMIT,
+    )
+    stop_loss_sell_order.update(
+        price=decimal.Decimal("80"),
+        quantity=quantity,
+        symbol=DEFAULT_ORDER_SYMBOL,
+        order_type=TraderOrderType.STOP_LOSS,
+        linked_to=sell_limit_order
+    )
+    stop_loss_sell_order.linked_orders.append(sell_limit_order)
+    sell_limit_order.linked_orders.append(stop_loss_sell_order)
+    exchange_personal_data = sell_limit_order.exchange_manager.exchange_personal_data
+    candle_fill_engine = CandleFillEngine(exchange_personal_data.orders_manager)
+    exchange_personal_data.candle_fill_engine = candle_fill_engine
+    sell_limit_order.exchange_manager.is_backtesting = True  # force update_order_status
+    await sell_limit_order.initialize()
+    await stop_loss_sell_order.initialize()
+    exchange_personal_data.orders_manager.upsert_order_instance(sell_limit_order)
+    exchange_personal_data.orders_manager.upsert_order_instance(stop_loss_sell_order)
+
+    # both orders are reached by this candle: the stop loss is cancelled when the limit order is filled
+    candle_time = max(sell_limit_order.creation_time, stop_loss_sell_order.creation_time)
+    assert await candle_fill_engine.fill_orders(DEFAULT_ORDER_SYMBOL, candle_time, 130, 70) == [sell_limit_order]
+    assert sell_limit_order.is_filled()
+    assert stop_loss_sell_order.is_cancelled()
+    assert candle_fill_engine.get_price_thresholds(DEFAULT_ORDER_SYMBOL) == (None, None)
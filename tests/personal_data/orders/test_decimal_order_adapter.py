@@ -19,6 +19,7 @@ import decimal
 
 from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
 import octobot_trading.personal_data as personal_data
+import octobot_trading.util as util
 from tests import event_loop
 
 # All test coroutines will be treated as marked.
@@ -336,6 +337,13 @@ async def test_split_orders():
            == [(decimal.Decimal(str(2.5)), decimal.Decimal(str(0.01)))] + [
                (decimal.Decimal(str(100)), decimal.Decimal(str(0.01)))] * 5
 
+    # same split using fixed point arithmetic
+    assert personal_data.decimal_split_orders(total_price, max_cost, valid_quantity,
+                                              max_quantity, price, valid_quantity, symbol_market,
+                                              util.MarketFixedPoint(symbol_market)) \
+           == [(decimal.Decimal(str(2.5)), decimal.Decimal(str(0.01)))] + [
+               (decimal.Decimal(str(100)), decimal.Decimal(str(0.01)))] * 5
+
     # missing info situation, split because of cost
     max_quantity = None
     total_price = decimal.Decimal(str(100))
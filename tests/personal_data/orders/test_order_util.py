@@ -102,3 +102,35 @@ def test_get_fees_for_currency():
 
     assert personal_data.get_fees_for_currency({}, "BTC") == 0
     assert personal_data.get_fees_for_currency(None, "BTC") == 0
+
+
+def test_get_raw_order_fingerprint():
+    raw_order = {
+        enums.ExchangeConstantsOrderColumns.ID.value: "1",
+        enums.ExchangeConstantsOrderColumns.STATUS.value: enums.OrderStatus.OPEN.value,
+        enums.ExchangeConstantsOrderColumns.AMOUNT.value: 1,
+        enums.ExchangeConstantsOrderColumns.FILLED.value: 0,
+        enums.ExchangeConstantsOrderColumns.PRICE.value: 100,
+        enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: 1,
+        enums.ExchangeConstantsOrderColumns.FEE.value: {
+            enums.FeePropertyColumns.CURRENCY.value: "BTC",
+            enums.FeePropertyColumns.COST.value: 0
+        }
+    }
+    fingerprint = personal_data.get_raw_order_fingerprint(raw_order)
+    # same order values
+    assert personal_data.get_raw_order_fingerprint(
+        {**raw_order, enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: 2}) == fingerprint
+    # updated order values
+    assert personal_data.get_raw_order_fingerprint(
+        {**raw_order, enums.ExchangeConstantsOrderColumns.FILLED.value: 0.5}) != fingerprint
+    assert personal_data.get_raw_order_fingerprint(
+        {**raw_order, enums.ExchangeConstantsOrderColumns.PRICE.value: 101}) != fingerprint
+    assert personal_data.get_raw_order_fingerprint(
+        {**raw_order, enums.ExchangeConstantsOrderColumns.STATUS.value: enums.OrderStatus.CLOSED.value}) != fingerprint
+    assert personal_data.get_raw_order_fingerprint(
+        {**raw_order, enums.ExchangeConstantsOrderColumns.FEE.value: {
+            enums.FeePropertyColumns.CURRENCY.value: "BTC",
+            enums.FeePropertyColumns.COST.value: 0.1
+        }}) != fingerprint
+    assert personal_data.get_raw_order_fingerprint({}) == (None, ) * 7
@@ -0,0 +1,69 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+
+from tests import event_loop
+from tests.exchanges import exchange_manager
+from tests.exchanges.traders import trader_simulator
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _create_order(trader_inst, order_id, symbol):
+    order = personal_data.Order(trader_inst)
+    order.order_id = order_id
+    order.symbol = symbol
+    return order
+
+
+async def test_orders_indexes(trader_simulator):
+    config, exchange_manager_inst, trader_inst = trader_simulator
+    orders_manager = exchange_manager_inst.exchange_personal_data.orders_manager
+    btc_order_1 = _create_order(trader_inst, "1", "BTC/USDT")
+    eth_order = _create_order(trader_inst, "2", "ETH/USDT")
+    btc_order_2 = _create_order(trader_inst, "3", "BTC/USDT")
+    for order in (btc_order_1, eth_order, btc_order_2):
+        assert orders_manager.upsert_order_instance(order)
+    assert not orders_manager.upsert_order_instance(btc_order_1)
+
+    assert orders_manager.has_order("1")
+    assert not orders_manager.has_order("4")
+    assert orders_manager.get_open_orders() == [btc_order_1, eth_order, btc_order_2]
+    assert orders_manager.get_open_orders("BTC/USDT") == [btc_order_1, btc_order_2]
+    assert orders_manager.get_open_orders("BTC/USDT", limit=1) == [btc_order_1]
+    assert orders_manager.get_open_orders("XRP/USDT") == []
+    assert list(orders_manager.iter_open_orders("ETH/USDT")) == [eth_order]
+    assert list(orders_manager.iter_orders("BTC/USDT")) == [btc_order_1, btc_order_2]
+    assert orders_manager.get_open_orders_count() == 3
+
+    # status updates are taken into account
+    btc_order_1.status = enums.OrderStatus.CLOSED
+    assert orders_manager.get_open_orders("BTC/USDT") == [btc_order_2]
+    assert orders_manager.get_open_orders() == [eth_order, btc_order_2]
+    assert orders_manager.get_closed_orders() == [btc_order_1]
+    assert orders_manager.get_all_orders("BTC/USDT") == [btc_order_1, btc_order_2]
+
+    # removed orders are not indexed anymore
+    orders_manager.remove_order_instance(btc_order_2)
+    assert not orders_manager.has_order("3")
+    assert orders_manager.get_open_orders("BTC/USDT") == []
+    assert orders_manager.get_all_orders("BTC/USDT") == [btc_order_1]
+    assert orders_manager.get_open_orders_count("ETH/USDT") == 1
+
@@ -0,0 +1,91 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+from mock import AsyncMock, Mock
+import pytest
+
+import octobot_trading.errors as errors
+from octobot_trading.personal_data.orders import ConcurrentOrdersSyncStrategy, SymbolLessOrdersSyncStrategy, \
+    create_orders_sync_strategy
+
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "ETH/BTC"]
+LIMIT = 100
+
+
+def _exchange_manager(open_orders, known_orders_symbols, are_exchange_orders_initialized=True):
+    exchange_manager = Mock()
+    exchange_manager.exchange.get_open_orders = AsyncMock(side_effect=open_orders)
+    exchange_manager.exchange.get_closed_orders = AsyncMock(return_value=[])
+    exchange_manager.exchange.parse_order_symbol = lambda order: order["symbol"]
+    exchange_manager.get_exchange_symbol = lambda symbol: symbol
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    orders_manager.are_exchange_orders_initialized = are_exchange_orders_initialized
+    orders_manager.get_open_orders = lambda symbol=None: ["order"] if symbol in known_orders_symbols else []
+    orders_manager.get_all_orders = orders_manager.get_open_orders
+    return exchange_manager
+
+
+async def test_symbol_less_fetch_open_orders():
+    open_orders = [{"symbol": "BTC/USDT", "id": "1"}, {"symbol": "ETH/BTC", "id": "2"}, {"symbol": "XRP/BTC"}]
+    exchange_manager = _exchange_manager([open_orders], [])
+    strategy = SymbolLessOrdersSyncStrategy(exchange_manager)
+    assert await strategy.fetch_open_orders(SYMBOLS, LIMIT) == {
+        "BTC/USDT": [open_orders[0]],
+        "ETH/USDT": [],
+        "ETH/BTC": [open_orders[1]],
+    }
+    # a single request
+    # a single request, without the by symbol limit
+    exchange_manager.exchange.get_open_orders.assert_called_once_with(symbol=None)
+
+
+async def test_concurrent_fetch_open_orders():
+    exchange_manager = _exchange_manager(lambda symbol, limit: [{"symbol": symbol}], ["ETH/USDT"])
+    strategy = ConcurrentOrdersSyncStrategy(exchange_manager)
+    # first sync: every symbol
+    assert list(await strategy.fetch_open_orders(SYMBOLS, LIMIT)) == SYMBOLS
+    # then only symbols with known open orders until the next full sync
+    for _ in range(strategy.FULL_SYNC_INTERVAL - 1):
+        assert await strategy.fetch_open_orders(SYMBOLS, LIMIT) == {"ETH/USDT": [{"symbol": "ETH/USDT"}]}
+    assert list(await strategy.fetch_open_orders(SYMBOLS, LIMIT)) == SYMBOLS
+    assert await strategy.fetch_closed_orders(SYMBOLS, LIMIT) == {"ETH/USDT": []}
+
+
+async def test_create_orders_sync_strategy():
+    exchange_manager = _exchange_manager([[]], [])
+    strategy, open_orders_by_symbol = await create_orders_sync_strategy(exchange_manager, SYMBOLS, LIMIT)
+    assert isinstance(strategy, SymbolLessOrdersSyncStrategy)
+    assert open_orders_by_symbol == {symbol: [] for symbol in SYMBOLS}
+
+    def _get_open_orders(symbol, limit=None):
+        if symbol is None:
+            raise errors.NotSupported("symbol required")
+        return []
+    exchange_manager = _exchange_manager(_get_open_orders, [])
+    strategy, open_orders_by_symbol = await create_orders_sync_strategy(exchange_manager, SYMBOLS, LIMIT)
+    assert type(strategy) is ConcurrentOrdersSyncStrategy
+    assert open_orders_by_symbol == {symbol: [] for symbol in SYMBOLS}
+
+    # other errors are not a reason to select another strategy
+    exchange_manager = _exchange_manager(asyncio.TimeoutError(), [])
+    with pytest.raises(asyncio.TimeoutError):
+        await create_orders_sync_strategy(exchange_manager, SYMBOLS, LIMIT)
+    exchange_manager.exchange.get_open_orders.assert_called_once_with(symbol=None)
@@ -0,0 +1,151 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+from mock import AsyncMock, Mock, patch, call
+
+import octobot_trading.constants as constants
+import octobot_trading.exchange_channel as exchange_channel
+from octobot_trading.personal_data.portfolios.channel.balance_updater import BalanceProfitabilityUpdater
+
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def balance_profitability_updater(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    channel = exchange_channel.get_chan(constants.BALANCE_PROFITABILITY_CHANNEL, exchange_manager.id)
+    updater = BalanceProfitabilityUpdater(channel)
+    await channel.register_producer(updater)
+    await updater.start()
+    yield exchange_manager, updater
+    await updater.stop()
+
+
+async def _push_mark_price(exchange_manager, updater, symbol, mark_price):
+    await updater.handle_mark_price_update(exchange_manager.exchange_name, exchange_manager.id,
+                                           symbol.split("/")[0], symbol, mark_price)
+
+
+def _patch_profitability_update(exchange_manager):
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    profitability_producer = exchange_channel.get_chan(constants.BALANCE_PROFITABILITY_CHANNEL,
+                                                       exchange_manager.id).get_internal_producer()
+    return patch.object(portfolio_manager, "handle_mark_price_update", new=AsyncMock()), \
+        patch.object(portfolio_manager, "handle_balance_updated", new=AsyncMock()), \
+        patch.object(profitability_producer, "send", new=AsyncMock())
+
+
+async def test_handle_mark_price_update_in_backtesting(balance_profitability_updater):
+    exchange_manager, updater = balance_profitability_updater
+    # backtesting: every mark price is synchronously processed
+    assert updater.update_delay is None
+    mark_price_patch, balance_patch, send_patch = _patch_profitability_update(exchange_manager)
+    with mark_price_patch as handle_mark_price_update_mock, balance_patch, send_patch as send_mock:
+        await _push_mark_price(exchange_manager, updater, "BTC/USDT", 10)
+        handle_mark_price_update_mock.assert_awaited_once_with(symbol="BTC/USDT", mark_price=10)
+        send_mock.assert_awaited_once()
+        await _push_mark_price(exchange_manager, updater, "BTC/USDT", 11)
+        assert handle_mark_price_update_mock.await_count == 2
+        assert send_mock.await_count == 2
+    assert updater.pending_mark_prices == {}
+    assert updater.update_task is None
+
+
+async def test_handle_mark_price_update_coalesces_updates(balance_profitability_updater):
+    exchange_manager, updater = balance_profitability_updater
+    updater.update_delay = 0
+    mark_price_patch, balance_patch, send_patch = _patch_profitability_update(exchange_manager)
+    with mark_price_patch as handle_mark_price_update_mock, balance_patch, send_patch as send_mock:
+        await _push_mark_price(exchange_manager, updater, "BTC/USDT", 10)
+        await _push_mark_price(exchange_manager, updater, "ETH/USDT", 2)
+        await _push_mark_price(exchange_manager, updater, "BTC/USDT", 11)
+        handle_mark_price_update_mock.assert_not_awaited()
+        send_mock.assert_not_awaited()
+        assert updater.pending_mark_prices == {"BTC/USDT": 11, "ETH/USDT": 2}
+
+        await updater.update_task
+        # only the latest mark price of each symbol is used and profitability is sent once
+        assert handle_mark_price_update_mock.mock_calls == [
+            call(symbol="BTC/USDT", mark_price=11),
+            call(symbol="ETH/USDT", mark_price=2),
+        ]
+        send_mock.assert_awaited_once()
+        assert updater.pending_mark_prices == {}
+
+
+async def test_handle_balance_update_flushes_pending_mark_prices(balance_profitability_updater):
+    exchange_manager, updater = balance_profitability_updater
+    updater.update_delay = 10
+    mark_price_patch, balance_patch, send_patch = _patch_profitability_update(exchange_manager)
+    with mark_price_patch as handle_mark_price_update_mock, balance_patch as handle_balance_updated_mock, \
+            send_patch as send_mock:
+        await _push_mark_price(exchange_manager, updater, "BTC/USDT", 10)
+        handle_mark_price_update_mock.assert_not_awaited()
+
+        await updater.handle_balance_update(exchange_manager.exchange_name, exchange_manager.id, {})
+        handle_mark_price_update_mock.assert_awaited_once_with(symbol="BTC/USDT", mark_price=10)
+        handle_balance_updated_mock.assert_awaited_once()
+        # profitability is sent once for both the balance and the pending mark price
+        send_mock.assert_awaited_once()
+        assert updater.pending_mark_prices == {}
+
+
+async def test_handle_portfolio_update_from_order_flushes_pending_mark_prices(balance_profitability_updater):
+    exchange_manager, updater = balance_profitability_updater
+    updater.update_delay = 10
+    exchange_personal_data = exchange_manager.exchange_personal_data
+    mark_price_patch, balance_patch, send_patch = _patch_profitability_update(exchange_manager)
+    with mark_price_patch as handle_mark_price_update_mock, balance_patch, send_patch as send_mock:
+        await _push_mark_price(exchange_manager, updater, "BTC/USDT", 10)
+
+        with patch.object(exchange_personal_data.portfolio_manager, "handle_balance_update_from_order",
+                          new=AsyncMock(return_value=False)):
+            # portfolio did not change
+            assert await exchange_personal_data.handle_portfolio_update_from_order(Mock(), should_notify=False) \
+                is False
+            handle_mark_price_update_mock.assert_not_awaited()
+
+        with patch.object(exchange_personal_data.portfolio_manager, "handle_balance_update_from_order",
+                          new=AsyncMock(return_value=True)):
+            assert await exchange_personal_data.handle_portfolio_update_from_order(Mock(), should_notify=False) \
+                is True
+            handle_mark_price_update_mock.assert_awaited_once_with(symbol="BTC/USDT", mark_price=10)
+            # notified by the balance update
+            send_mock.assert_not_awaited()
+            assert updater.pending_mark_prices == {}
+
+
+async def test_stop_cancels_pending_update(balance_profitability_updater):
+    exchange_manager, updater = balance_profitability_updater
+    updater.update_delay = 10
+    mark_price_patch, balance_patch, send_patch = _patch_profitability_update(exchange_manager)
+    with mark_price_patch as handle_mark_price_update_mock, balance_patch, send_patch as send_mock:
+        await _push_mark_price(exchange_manager, updater, "BTC/USDT", 10)
+        update_task = updater.update_task
+        assert not update_task.done()
+
+        await updater.stop()
+        with pytest.raises(asyncio.CancelledError):
+            await update_task
+        assert updater.update_task is None
+        assert updater.pending_mark_prices == {}
+        handle_mark_price_update_mock.assert_not_awaited()
+        send_mock.assert_not_awaited()
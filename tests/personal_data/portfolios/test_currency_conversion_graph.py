@@ -0,0 +1,83 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import pytest
+
+import octobot_trading.constants as constants
+from octobot_trading.exchanges.exchange_manager import ExchangeManager
+from octobot_trading.exchanges.util.symbols_registry import SymbolsRegistry, Symbol
+from octobot_trading.personal_data import CurrencyConversionGraph
+
+from tests import event_loop
+from tests.exchanges import backtesting_config
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOLS = ["BTC/USDT", "ETH/BTC", "ETH/USDT", "USDT/DAI", "XRP/ETH", "XRP/BTC", "DOT/XRP", "NANO/DOT", "ADA/BNB"]
+
+
+@pytest.fixture
+async def symbols_registry(backtesting_config):
+    return SymbolsRegistry(ExchangeManager(backtesting_config, "binance"))
+
+
+async def test_conversion_paths(symbols_registry):
+    graph = CurrencyConversionGraph(SYMBOLS, "USDT", symbols_registry)
+    assert graph.get_conversion_path("USDT") == ()
+    assert graph.get_conversion_path("BTC") == (("BTC/USDT", False), )
+    assert graph.get_conversion_path("DAI") == (("USDT/DAI", True), )
+    assert graph.get_conversion_path("ETH") == (("ETH/USDT", False), )
+    # both XRP/ETH and XRP/BTC are shortest paths: BTC is the preferred bridge currency
+    assert graph.get_conversion_path("XRP") == (("XRP/BTC", False), ("BTC/USDT", False))
+    assert graph.get_conversion_path("DOT") == (("DOT/XRP", False), ("XRP/BTC", False), ("BTC/USDT", False))
+    # too many hops
+    assert graph.get_conversion_path("NANO") is None
+    # not connected
+    assert graph.get_conversion_path("ADA") is None
+    assert graph.get_dependent_currencies("BTC/USDT") == {"BTC", "XRP", "DOT"}
+    assert graph.get_dependent_currencies("ETH/BTC") == set()
+
+
+async def test_get_currency_value(symbols_registry):
+    graph = CurrencyConversionGraph(SYMBOLS, "USDT", symbols_registry)
+    last_prices = {"BTC/USDT": decimal.Decimal(10000), "USDT/DAI": decimal.Decimal(2)}
+    assert graph.get_currency_value("USDT", last_prices) == constants.ONE
+    assert graph.get_currency_value("ADA", last_prices) is None
+    assert graph.get_currency_value("DAI", last_prices) == decimal.Decimal("0.5")
+    with pytest.raises(KeyError):
+        graph.get_currency_value("XRP", last_prices)
+    last_prices["XRP/BTC"] = decimal.Decimal("0.0001")
+    assert graph.get_currency_value("XRP", last_prices) == decimal.Decimal(1)
+
+    # cached until a path price is updated
+    last_prices["BTC/USDT"] = decimal.Decimal(20000)
+    assert graph.get_currency_value("XRP", last_prices) == decimal.Decimal(1)
+    graph.on_price_update("BTC/USDT")
+    assert graph.get_currency_value("XRP", last_prices) == decimal.Decimal(2)
+    assert graph.get_currency_value("DAI", last_prices) == decimal.Decimal("0.5")
+
+    last_prices["USDT/DAI"] = constants.ZERO
+    graph.on_price_update("USDT/DAI")
+    with pytest.raises(KeyError):
+        graph.get_currency_value("DAI", last_prices)
+
+
+async def test_conversion_paths_use_symbols_registry(symbols_registry):
+    # exchange specific trading pair that can't be split from its name
+    symbols_registry.symbols["BTCUSDT"] = Symbol("BTCUSDT", "BTC", "USDT")
+    graph = CurrencyConversionGraph(["BTCUSDT", "ETH/BTC"], "USDT", symbols_registry)
+    assert graph.get_conversion_path("BTC") == (("BTCUSDT", False), )
+    assert graph.get_conversion_path("ETH") == (("ETH/BTC", False), ("BTCUSDT", False))
@@ -1135,3 +1135,54 @@ async def test_update_portfolio_data(backtesting_trader):
                               price=decimal.Decimal("10"))
 
         portfolio_manager.portfolio.update_portfolio_available(btc_limit_buy2, True)
+
+
+async def test_copy(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio = exchange_manager.exchange_personal_data.portfolio_manager.portfolio
+    copied_portfolio = await portfolio.copy()
+
+    portfolio.reset_portfolio_available("BTC", decimal.Decimal(-1))
+    assert portfolio.get_currency_portfolio("BTC") == decimal.Decimal('9')
+    assert copied_portfolio.get_currency_portfolio("BTC") == decimal.Decimal('10')
+
+    copied_portfolio.reset_portfolio_available("USDT", decimal.Decimal(-100))
+    assert copied_portfolio.get_currency_portfolio("USDT") == decimal.Decimal('900')
+    assert portfolio.get_currency_portfolio("USDT") == decimal.Decimal('1000')
+    portfolio.reset_portfolio_available()
+    assert portfolio.get_currency_portfolio("BTC") == decimal.Decimal('10')
+    assert copied_portfolio.get_currency_portfolio("USDT") == decimal.Decimal('900')
+    assert portfolio.portfolio == {
+        'BTC': {'available': decimal.Decimal('10'), 'total': decimal.Decimal('10')},
+        'USDT': {'available': decimal.Decimal('1000'), 'total': decimal.Decimal('1000')}
+    }
+    assert copied_portfolio.portfolio == {
+        'BTC': {'available': decimal.Decimal('10'), 'total': decimal.Decimal('10')},
+        'USDT': {'available': decimal.Decimal('900'), 'total': decimal.Decimal('1000')}
+    }
+
+    # direct portfolio dict updates are not shared either
+    copied_portfolio = await portfolio.copy()
+    copied_portfolio.portfolio["BTC"]["available"] = decimal.Decimal('1')
+    copied_portfolio.portfolio["ETH"] = {'available': decimal.Decimal('1'), 'total': decimal.Decimal('1')}
+    assert portfolio.get_currency_portfolio("BTC") == decimal.Decimal('10')
+    assert "ETH" not in portfolio.portfolio
+    portfolio.portfolio["USDT"]["total"] = decimal.Decimal('1')
+    assert copied_portfolio.get_currency_portfolio("USDT", "total") == decimal.Decimal('1000')
+    assert copied_portfolio.get_currency_portfolio("BTC") == decimal.Decimal('1')
+    assert portfolio.get_currency_portfolio("USDT") == decimal.Decimal('1000')
+    portfolio.reset_portfolio_available()
+    assert portfolio.get_currency_portfolio("BTC") == decimal.Decimal('10')
+    assert portfolio.get_currency_portfolio("USDT") == decimal.Decimal('1')
+    assert copied_portfolio.get_currency_portfolio("USDT") == decimal.Decimal('1000')
+
+    # read only accesses are not copying shared content
+    copied_portfolio = await portfolio.copy()
+    assert copied_portfolio.get_read_only_portfolio() is portfolio.get_read_only_portfolio()
+    assert copied_portfolio.get_read_only_portfolio()["BTC"] is portfolio.get_read_only_portfolio()["BTC"]
+    copied_portfolio.reset_portfolio_available("BTC", decimal.Decimal(-1))
+    # only the updated currency is copied
+    assert copied_portfolio.get_read_only_portfolio()["BTC"] is not portfolio.get_read_only_portfolio()["BTC"]
+    assert copied_portfolio.get_read_only_portfolio()["USDT"] is portfolio.get_read_only_portfolio()["USDT"]
+    assert copied_portfolio.get_currency_portfolio("BTC") == decimal.Decimal('9')
+    assert portfolio.get_currency_portfolio("BTC") == decimal.Decimal('10')
@@ -199,3 +199,63 @@ async def test_update_origin_crypto_currencies_values(backtesting_trader):
     assert portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT", decimal.Decimal(str(100))) is True
     assert portfolio_value_holder.origin_crypto_currencies_values["USDT"] == decimal.Decimal(constants.ONE / decimal.Decimal(100))
     assert portfolio_value_holder.last_prices_by_trading_pair["BTC/USDT"] == decimal.Decimal(str(100))
+
+
+async def test_update_current_values_from_mark_price(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+
+    exchange_manager.client_symbols.append("BTC/USDT")
+    # first price: evaluate the whole portfolio
+    await portfolio_manager.handle_mark_price_update("BTC/USDT", 100)
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal(20)
+    assert portfolio_value_holder.conversion_graph.get_conversion_path("USDT") == (("BTC/USDT", True), )
+
+    # incremental update
+    assert portfolio_value_holder.update_current_values_from_mark_price("ETH/USDT", decimal.Decimal(10)) is True
+    await portfolio_manager.handle_mark_price_update("BTC/USDT", 200)
+    assert portfolio_value_holder.current_holdings_values["USDT"] == decimal.Decimal(5)
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal(15)
+    assert portfolio_value_holder.origin_portfolio_current_value == decimal.Decimal(15)
+    assert portfolio_value_holder.current_crypto_currencies_values["USDT"] == constants.ONE / decimal.Decimal(200)
+    incremental_profitability = portfolio_manager.portfolio_profitability.profitability
+
+    # same values as when evaluating the whole portfolio
+    await portfolio_manager.handle_balance_updated()
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal(15)
+    assert portfolio_value_holder.get_origin_portfolio_current_value() == decimal.Decimal(15)
+    assert portfolio_manager.portfolio_profitability.profitability == incremental_profitability
+
+    # portfolio changed: evaluate the whole portfolio
+    portfolio_value_holder.invalidate_current_holdings_values()
+    assert portfolio_value_holder.update_current_values_from_mark_price("BTC/USDT", decimal.Decimal(100)) is False
+
+
+async def test_multi_hop_currency_values(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+
+    portfolio_manager.reference_market = "USDT"
+    exchange_manager.client_symbols.extend(["BTC/USDT", "XRP/BTC"])
+    update_portfolio_balance({
+        'BTC': {'available': decimal.Decimal("1"), 'total': decimal.Decimal("1")},
+        'XRP': {'available': decimal.Decimal("1000"), 'total': decimal.Decimal("1000")},
+        'USDT': {'available': decimal.Decimal("100"), 'total': decimal.Decimal("100")}
+    }, exchange_manager)
+    await portfolio_manager.handle_mark_price_update("BTC/USDT", 10000)
+    await portfolio_manager.handle_mark_price_update("XRP/BTC", decimal.Decimal("0.0001"))
+    await portfolio_manager.handle_balance_updated()
+    # XRP is evaluated through BTC
+    assert portfolio_value_holder.conversion_graph.get_conversion_path("XRP") == \
+        (("XRP/BTC", False), ("BTC/USDT", False))
+    assert portfolio_value_holder.get_current_crypto_currencies_values()["XRP"] == decimal.Decimal(1)
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal(11100)
+
+    # both BTC and XRP values are updated from BTC/USDT
+    assert portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT", decimal.Decimal(20000)) is False
+    assert portfolio_value_holder.update_current_values_from_mark_price("BTC/USDT", decimal.Decimal(20000)) is True
+    assert portfolio_value_holder.current_crypto_currencies_values["XRP"] == decimal.Decimal(2)
+    assert portfolio_value_holder.current_holdings_values["XRP"] == decimal.Decimal(2000)
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal(22100)
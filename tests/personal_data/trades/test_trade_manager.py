@@ -13,11 +13,14 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
+
 import pytest
 
 from tests import event_loop
 from tests.exchanges import simulated_exchange_manager, simulated_trader
 
+import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
 
 pytestmark = pytest.mark.asyncio
@@ -33,17 +36,141 @@ def test_has_closing_trade_with_order_id(trade_manager_and_trader):
     trade_manager, trader = trade_manager_and_trader
     assert trade_manager.has_closing_trade_with_order_id(None) is False
     assert trade_manager.has_closing_trade_with_order_id("None") is False
-    trade = personal_data.Trade(trader)
-    trade.trade_id = "id"
-    trade.is_closing_order = False
-    trade.origin_order_id = "None"
-    trade_manager.trades["id"] = trade
+    trade = _create_trade(trader, "id", "None", False)
+    trade_manager.upsert_trade_instance(trade)
     # trade is not closing order not has the right origin_order_id
     assert trade_manager.has_closing_trade_with_order_id("id") is False
     # trade does not has the right origin_order_id
     trade.is_closing_order = True
     assert trade_manager.has_closing_trade_with_order_id("id2") is False
     assert trade_manager.has_closing_trade_with_order_id("id") is False
-    trade.origin_order_id = "id"
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id2", "id", True))
     # trade is closing this order
     assert trade_manager.has_closing_trade_with_order_id("id") is True
+
+
+def test_has_closing_trade_with_order_id_after_oldest_trades_removal(simulated_trader):
+    _, _, trader = simulated_trader
+
+    class SmallTradesManager(personal_data.TradesManager):
+        MAX_TRADES_COUNT = 20
+
+    trade_manager = SmallTradesManager(trader)
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id1", "order_1", True))
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id2", "order_2", True))
+    for index in range(3, 21):
+        trade_manager.upsert_trade_instance(_create_trade(trader, f"id{index}", "order_2", False))
+    assert trade_manager.has_closing_trade_with_order_id("order_1") is True
+    assert trade_manager.has_closing_trade_with_order_id("order_2") is True
+    # 21st trade: remove the 2 oldest trades
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id21", "order_3", False))
+    assert len(trade_manager.trades) == 19
+    # removed trades are compacted
+    assert len(trade_manager.compacted_trades) == 2
+    assert trade_manager.has_closing_trade_with_order_id("order_1") is False
+    assert trade_manager.has_closing_trade_with_order_id("order_2") is False
+    assert "order_1" not in trade_manager.trades_by_origin_order_id
+    assert len(trade_manager.trades_by_origin_order_id["order_2"]) == 18
+
+
+def test_aggregates(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    assert trade_manager.get_total_paid_fees() == {}
+    assert trade_manager.get_trades_count() == 0
+    trade_manager.upsert_trade_instance(
+        _create_filled_trade(trader, "1", "BTC/USDT", enums.TradeOrderSide.BUY, "1", "0.1", "BTC"))
+    trade_manager.upsert_trade_instance(
+        _create_filled_trade(trader, "2", "BTC/USDT", enums.TradeOrderSide.SELL, "0.5", "10", "USDT"))
+    trade_manager.upsert_trade_instance(
+        _create_filled_trade(trader, "3", "ETH/USDT", enums.TradeOrderSide.BUY, "3", "0.2", "BTC"))
+    # already added
+    trade_manager.upsert_trade_instance(
+        _create_filled_trade(trader, "3", "ETH/USDT", enums.TradeOrderSide.BUY, "3", "0.2", "BTC"))
+    cancelled_trade = _create_filled_trade(trader, "4", "ETH/USDT", enums.TradeOrderSide.BUY, "3", "0.2", "BTC")
+    cancelled_trade.status = enums.OrderStatus.CANCELED
+    cancelled_trade.fee = None
+    trade_manager.upsert_trade_instance(cancelled_trade)
+
+    assert trade_manager.get_total_paid_fees() == {"BTC": decimal.Decimal("0.3"), "USDT": decimal.Decimal("10")}
+    # returned fees are a copy
+    trade_manager.get_total_paid_fees()["BTC"] = decimal.Decimal("1")
+    trade_manager.get_total_paid_fees().pop("USDT")
+    assert trade_manager.get_total_paid_fees() == {"BTC": decimal.Decimal("0.3"), "USDT": decimal.Decimal("10")}
+    assert trade_manager.get_traded_volume("BTC/USDT", enums.TradeOrderSide.BUY) == decimal.Decimal("1")
+    assert trade_manager.get_traded_volume("BTC/USDT", enums.TradeOrderSide.SELL) == decimal.Decimal("0.5")
+    assert trade_manager.get_traded_volume("ETH/USDT", enums.TradeOrderSide.BUY) == decimal.Decimal("3")
+    assert trade_manager.get_traded_volume("ETH/USDT", enums.TradeOrderSide.SELL) == decimal.Decimal("0")
+    assert trade_manager.get_trades_count("BTC/USDT") == 2
+    assert trade_manager.get_trades_count("ETH/USDT") == 1
+    assert trade_manager.get_trades_count("XRP/USDT") == 0
+    assert trade_manager.get_trades_count() == 3
+
+    trade_manager.clear()
+    assert trade_manager.get_total_paid_fees() == {}
+    assert trade_manager.get_trades_count() == 0
+
+
+def test_iter_trades(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    trades = [
+        _create_timed_trade(trader, "1", "BTC/USDT", 30),
+        _create_timed_trade(trader, "2", "ETH/USDT", 10),
+        _create_timed_trade(trader, "3", "BTC/USDT", 20),
+        _create_timed_trade(trader, "4", "BTC/USDT", 40),
+    ]
+    trades[3].status = enums.OrderStatus.CANCELED
+    for trade in trades:
+        trade_manager.upsert_trade_instance(trade)
+    # sorted by time
+    assert list(trade_manager.iter_trades()) == [trades[1], trades[2], trades[0]]
+    assert list(trade_manager.iter_trades(include_cancelled=True)) == [trades[1], trades[2], trades[0], trades[3]]
+    assert list(trade_manager.iter_trades(symbol="BTC/USDT")) == [trades[2], trades[0]]
+    assert list(trade_manager.iter_trades(symbol="BTC/USDT", since=20)) == [trades[0]]
+    assert list(trade_manager.iter_trades(since=5)) == [trades[1], trades[2], trades[0]]
+    assert list(trade_manager.iter_trades(since=40, include_cancelled=True)) == []
+    assert list(trade_manager.iter_trades(symbol="XRP/USDT")) == []
+
+
+def test_iter_trades_after_oldest_trades_removal(simulated_trader):
+    _, _, trader = simulated_trader
+
+    class SmallTradesManager(personal_data.TradesManager):
+        MAX_TRADES_COUNT = 10
+
+    trade_manager = SmallTradesManager(trader)
+    # first added trades are the most recent ones
+    trades = [_create_timed_trade(trader, str(index), "BTC/USDT", 100 - index) for index in range(11)]
+    for trade in trades:
+        trade_manager.upsert_trade_instance(trade)
+    # first trade has been removed
+    assert list(trade_manager.iter_trades()) == trades[:0:-1]
+    assert list(trade_manager.iter_trades(symbol="BTC/USDT", since=98)) == [trades[1]]
+
+
+def _create_timed_trade(trader, trade_id, symbol, executed_time):
+    trade = _create_trade(trader, trade_id, trade_id, True)
+    trade.symbol = symbol
+    trade.executed_time = executed_time
+    trade.canceled_time = executed_time
+    return trade
+
+
+def _create_filled_trade(trader, trade_id, symbol, side, quantity, fee_cost, fee_currency):
+    trade = _create_trade(trader, trade_id, trade_id, True)
+    trade.symbol = symbol
+    trade.side = side
+    trade.status = enums.OrderStatus.FILLED
+    trade.executed_quantity = decimal.Decimal(quantity)
+    trade.fee = {
+        enums.FeePropertyColumns.COST.value: decimal.Decimal(fee_cost),
+        enums.FeePropertyColumns.CURRENCY.value: fee_currency
+    }
+    return trade
+
+
+def _create_trade(trader, trade_id, origin_order_id, is_closing_order):
+    trade = personal_data.Trade(trader)
+    trade.trade_id = trade_id
+    trade.origin_order_id = origin_order_id
+    trade.is_closing_order = is_closing_order
+    return trade
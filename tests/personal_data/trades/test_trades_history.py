@@ -0,0 +1,147 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import os
+
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+pytestmark = pytest.mark.asyncio
+
+
+def _create_trade(trader, trade_id, symbol, executed_time, status=enums.OrderStatus.FILLED, fee_cost="0.1"):
+    trade = personal_data.Trade(trader)
+    trade.trade_id = trade_id
+    trade.origin_order_id = trade_id
+    trade.symbol = symbol
+    trade.status = status
+    trade.side = enums.TradeOrderSide.BUY
+    trade.exchange_trade_type = enums.TradeOrderType.LIMIT
+    trade.taker_or_maker = enums.ExchangeConstantsMarketPropertyColumns.MAKER.value
+    trade.executed_price = decimal.Decimal("100.5")
+    trade.executed_quantity = decimal.Decimal("2")
+    trade.origin_quantity = decimal.Decimal("2")
+    trade.total_cost = decimal.Decimal("201")
+    trade.executed_time = executed_time
+    trade.canceled_time = executed_time
+    trade.fee = {
+        enums.FeePropertyColumns.COST.value: decimal.Decimal(fee_cost),
+        enums.FeePropertyColumns.CURRENCY.value: "USDT"
+    }
+    return trade
+
+
+def test_get_trades(simulated_trader):
+    _, _, trader = simulated_trader
+    history = personal_data.CompactTradesHistory()
+    trades = [
+        _create_trade(trader, "1", "BTC/USDT", 10),
+        _create_trade(trader, "2", "ETH/USDT", 20),
+        _create_trade(trader, "3", "BTC/USDT", 30, status=enums.OrderStatus.CANCELED),
+        _create_trade(trader, "4", "BTC/USDT", 40),
+    ]
+    for trade in trades:
+        history.add_trade(trade)
+    assert len(history) == 4
+    assert history.get_trades() == [trade.to_dict() for trade in trades if trade.trade_id != "3"]
+    assert history.get_trades(include_cancelled=True) == [trade.to_dict() for trade in trades]
+    assert history.get_trades(symbol="BTC/USDT", since=10) == [trades[3].to_dict()]
+    assert history.get_trades(symbol="XRP/USDT") == []
+    history.clear()
+    assert len(history) == 0
+    assert history.get_trades() == []
+
+
+def test_get_trades_from_database(simulated_trader, tmp_path):
+    _, _, trader = simulated_trader
+    database_path = os.path.join(tmp_path, "trades.sqlite")
+    history = personal_data.CompactTradesHistory(memory_size=4, database_path=database_path)
+    trades = [_create_trade(trader, str(index), "BTC/USDT", index) for index in range(1, 11)]
+    for trade in trades:
+        history.add_trade(trade)
+    assert 0 < history.size <= 4
+    assert history.database_trades_count == 10 - history.size
+    assert len(history) == 10
+    assert history.get_trades() == [trade.to_dict() for trade in trades]
+    assert history.get_trades(since=8) == [trade.to_dict() for trade in trades[8:]]
+    assert history.get_trades(since=1, symbol="BTC/USDT") == [trade.to_dict() for trade in trades[1:]]
+    history.clear()
+    # database is not temporary: keep it
+    assert os.path.isfile(database_path)
+
+
+def test_get_trades_exact_values(simulated_trader):
+    _, _, trader = simulated_trader
+    history = personal_data.CompactTradesHistory(memory_size=2)
+    trades = [_create_trade(trader, str(index), "BTC/USDT", index, fee_cost="0.000000012345678901234567")
+              for index in range(4)]
+    trades[0].executed_price = decimal.Decimal("12345.123456789012345678")
+    trades[0].total_cost = decimal.Decimal("24690.246913578024691356")
+    trades[3].executed_price = decimal.Decimal("0.1000000000000000055511")
+    trades[3].fee = None
+    for trade in trades:
+        history.add_trade(trade)
+    # trades[0] is in database, trades[3] in memory
+    assert history.database_trades_count > 0
+    assert history.size > 0
+    stored_trades = history.get_trades()
+    assert stored_trades == [trade.to_dict() for trade in trades]
+    assert stored_trades[0][enums.ExchangeConstantsOrderColumns.PRICE.value] == \
+        decimal.Decimal("12345.123456789012345678")
+    assert stored_trades[0][enums.ExchangeConstantsOrderColumns.FEE.value][enums.FeePropertyColumns.COST.value] == \
+        decimal.Decimal("0.000000012345678901234567")
+    assert stored_trades[3][enums.ExchangeConstantsOrderColumns.PRICE.value] == \
+        decimal.Decimal("0.1000000000000000055511")
+    assert stored_trades[3][enums.ExchangeConstantsOrderColumns.FEE.value] is None
+    history.clear()
+
+
+def test_reused_database(simulated_trader, tmp_path):
+    _, _, trader = simulated_trader
+    database_path = os.path.join(tmp_path, "trades.sqlite")
+    history = personal_data.CompactTradesHistory(memory_size=2, database_path=database_path)
+    for index in range(4):
+        history.add_trade(_create_trade(trader, str(index), "BTC/USDT", index))
+    assert history.database_trades_count > 0
+    history.clear()
+    assert history.get_trades() == []
+
+    # trades from the previous history are removed
+    history = personal_data.CompactTradesHistory(memory_size=2, database_path=database_path)
+    assert len(history) == 0
+    assert history.get_trades() == []
+    trades = [_create_trade(trader, str(index), "ETH/USDT", index) for index in range(10, 14)]
+    for trade in trades:
+        history.add_trade(trade)
+    assert len(history) == 4
+    assert history.get_trades() == [trade.to_dict() for trade in trades]
+    history.clear()
+
+
+def test_temporary_database(simulated_trader):
+    _, _, trader = simulated_trader
+    history = personal_data.CompactTradesHistory(memory_size=2)
+    for index in range(4):
+        history.add_trade(_create_trade(trader, str(index), "BTC/USDT", index))
+    database_path = history.database_path
+    assert os.path.isfile(database_path)
+    history.clear()
+    assert not os.path.isfile(database_path)
@@ -0,0 +1,66 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+import async_channel.enums as channel_enums
+
+import octobot_trading.exchange_data as exchange_data
+
+from tests import event_loop
+from tests.exchanges import exchange_manager
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_ticker_channel_with_consumers(exchange_manager, calls):
+    channel = exchange_data.TickerChannel(exchange_manager)
+    channel.is_synchronized = True
+
+    async def optional_callback(**kwargs):
+        calls.append(("optional", kwargs["ticker"]))
+
+    async def high_callback(**kwargs):
+        calls.append(("high", kwargs["ticker"]))
+
+    await channel.new_consumer(optional_callback,
+                               priority_level=channel_enums.ChannelConsumerPriorityLevels.OPTIONAL.value)
+    await channel.new_consumer(high_callback,
+                               priority_level=channel_enums.ChannelConsumerPriorityLevels.HIGH.value)
+    return channel
+
+
+async def test_send_to_consumers_with_queues(exchange_manager):
+    calls = []
+    channel = await _create_ticker_channel_with_consumers(exchange_manager, calls)
+    assert not channel.is_direct_dispatch()
+    await exchange_data.TickerProducer(channel).send("BTC", "BTC/USDT", {"close": 1})
+    # data is waiting in consumers queues
+    assert calls == []
+    assert all(consumer.queue.qsize() == 1 for consumer in channel.consumers)
+
+
+async def test_send_to_consumers_with_direct_dispatch(exchange_manager):
+    calls = []
+    channel = await _create_ticker_channel_with_consumers(exchange_manager, calls)
+    channel.use_direct_dispatch = True
+    assert channel.is_direct_dispatch()
+    await exchange_data.TickerProducer(channel).send("BTC", "BTC/USDT", {"close": 1})
+    # consumers are called inline by priority level
+    assert calls == [("high", {"close": 1}), ("optional", {"close": 1})]
+    assert all(consumer.queue.empty() for consumer in channel.consumers)
+
+    # direct dispatch is only available on synchronized channels
+    channel.is_synchronized = False
+    assert not channel.is_direct_dispatch()
@@ -0,0 +1,161 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import json
+import os
+
+import pytest
+
+import octobot_trading.constants as trading_constants
+import octobot_trading.enums as enums
+import octobot_trading.exchange_channel as exchange_channel
+import octobot_trading.util.test_tools.channels_recorder as channels_recorder
+
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+
+pytestmark = pytest.mark.asyncio
+
+REPLAYED_CHANNELS = [trading_constants.MARK_PRICE_CHANNEL, trading_constants.OHLCV_CHANNEL]
+
+
+def test_record_and_read_records(tmp_path):
+    for file_name in ("records.jsonl", "records.jsonl.gz"):
+        file_path = os.path.join(tmp_path, file_name)
+        recorder = channels_recorder.ChannelsRecorder(None, file_path)
+        recorder._file = channels_recorder._open_record_file(file_path, "a")
+        recorder.record(trading_constants.MARK_PRICE_CHANNEL, {
+            "exchange": "binance",
+            "exchange_id": "1",
+            "cryptocurrency": "BTC",
+            "symbol": "BTC/USDT",
+            "mark_price": decimal.Decimal("10.5")
+        })
+        recorder.record(trading_constants.OHLCV_CHANNEL, {
+            "symbol": "BTC/USDT",
+            "time_frame": "1h",
+            "candle": [1, 2, 3, 4, 5, 6]
+        })
+        recorder._file.close()
+        assert recorder.recorded_messages_count == 2
+
+        records = channels_recorder.read_records(file_path)
+        assert [record[channels_recorder.RECORD_CHANNEL_INDEX] for record in records] == \
+               [trading_constants.MARK_PRICE_CHANNEL, trading_constants.OHLCV_CHANNEL]
+        assert records[0][channels_recorder.RECORD_DATA_INDEX] == {"symbol": "BTC/USDT", "mark_price": 10.5}
+        assert records[1][channels_recorder.RECORD_DATA_INDEX] == \
+               {"symbol": "BTC/USDT", "time_frame": "1h", "candle": [1, 2, 3, 4, 5, 6]}
+        assert records[0][channels_recorder.RECORD_TIMESTAMP_INDEX] <= \
+               records[1][channels_recorder.RECORD_TIMESTAMP_INDEX]
+
+
+async def test_record_mark_price_source(backtesting_trader, tmp_path):
+    _, exchange_manager, _ = backtesting_trader
+    file_path = os.path.join(tmp_path, "records.jsonl")
+    recorder = channels_recorder.ChannelsRecorder(exchange_manager, file_path)
+    recorder._file = channels_recorder._open_record_file(file_path, "a")
+    exchange_manager.get_symbol_data("BTC/USDT").prices_manager \
+        .set_mark_price(10, enums.MarkPriceSources.TICKER_CLOSE_PRICE.value)
+    await recorder._get_channel_callback(trading_constants.MARK_PRICE_CHANNEL)(
+        exchange="binance", exchange_id=exchange_manager.id, cryptocurrency="BTC", symbol="BTC/USDT", mark_price=10
+    )
+    recorder._file.close()
+    assert channels_recorder.read_records(file_path)[0][channels_recorder.RECORD_DATA_INDEX] == {
+        "symbol": "BTC/USDT",
+        "mark_price": 10,
+        "mark_price_source": enums.MarkPriceSources.TICKER_CLOSE_PRICE.value
+    }
+
+
+def _write_records(file_path, records):
+    with open(file_path, "w") as record_file:
+        for record in records:
+            record_file.write(json.dumps(record))
+            record_file.write("\n")
+
+
+async def _add_replay_consumers(exchange_manager, received_messages):
+    for channel_name in REPLAYED_CHANNELS:
+        channel = exchange_channel.get_chan(channel_name, exchange_manager.id)
+        # call consumers when messages are pushed
+        channel.use_direct_dispatch = True
+
+        async def _callback(channel_name=channel_name, **kwargs):
+            received_messages.append((channel_name, kwargs))
+        await channel.new_consumer(_callback)
+
+
+async def test_replay(backtesting_trader, tmp_path):
+    _, exchange_manager, _ = backtesting_trader
+    received_messages = []
+    await _add_replay_consumers(exchange_manager, received_messages)
+    file_path = os.path.join(tmp_path, "records.jsonl")
+    records = [
+        [1000, trading_constants.MARK_PRICE_CHANNEL,
+         {"symbol": "BTC/USDT", "mark_price": 10.5,
+          "mark_price_source": enums.MarkPriceSources.TICKER_CLOSE_PRICE.value}],
+        [1000.1, trading_constants.OHLCV_CHANNEL,
+         {"symbol": "BTC/USDT", "time_frame": "1h", "candle": [3600, 10, 12, 9, 11, 100]}],
+        [1000.2, trading_constants.MARK_PRICE_CHANNEL,
+         {"symbol": "BTC/USDT", "mark_price": 11,
+          "mark_price_source": enums.MarkPriceSources.TICKER_CLOSE_PRICE.value}],
+    ]
+    _write_records(file_path, records)
+
+    replayer = channels_recorder.ChannelsReplayer(exchange_manager, file_path, speed=2)
+    report = await replayer.replay()
+    # consumers received every recorded message in order
+    assert [
+        (channel_name, {key: value for key, value in kwargs.items()
+                        if key not in channels_recorder._IGNORED_DATA_KEYS})
+        for channel_name, kwargs in received_messages
+    ] == [
+        (channel_name, {key: value for key, value in data.items() if key != "mark_price_source"})
+        for _, channel_name, data in records
+    ]
+    # mark prices are replayed from their recorded source
+    assert exchange_manager.get_symbol_data("BTC/USDT").prices_manager.mark_price_source == \
+        enums.MarkPriceSources.TICKER_CLOSE_PRICE.value
+
+    # records are 0.2 seconds apart: replayed in 0.1 seconds at speed 2
+    assert report["duration"] >= 0.1
+    assert report["messages"] == 3
+    assert report["throughput"] == 3 / report["duration"]
+    assert set(report["channels"]) == set(REPLAYED_CHANNELS)
+    mark_price_report = report["channels"][trading_constants.MARK_PRICE_CHANNEL]
+    assert mark_price_report["messages"] == mark_price_report["received"] == 2
+    assert 0 <= mark_price_report["latency_p50"] <= mark_price_report["latency_max"]
+    ohlcv_report = report["channels"][trading_constants.OHLCV_CHANNEL]
+    assert ohlcv_report["messages"] == ohlcv_report["received"] == 1
+    # probe consumers are removed
+    assert replayer._consumers == {}
+
+
+async def test_replay_as_fast_as_possible(backtesting_trader, tmp_path):
+    _, exchange_manager, _ = backtesting_trader
+    received_messages = []
+    await _add_replay_consumers(exchange_manager, received_messages)
+    file_path = os.path.join(tmp_path, "records.jsonl")
+    _write_records(file_path, [
+        [1000, trading_constants.MARK_PRICE_CHANNEL, {"symbol": "BTC/USDT", "mark_price": 10}],
+        [1100, trading_constants.MARK_PRICE_CHANNEL, {"symbol": "BTC/USDT", "mark_price": 11}],
+    ])
+    report = await channels_recorder.ChannelsReplayer(exchange_manager, file_path, speed=0).replay()
+    assert report["duration"] < 100
+    assert [kwargs["mark_price"] for _, kwargs in received_messages] == [10, 11]
+    # records without mark price source are replayed as exchange mark prices
+    assert exchange_manager.get_symbol_data("BTC/USDT").prices_manager.mark_price_source == \
+        enums.MarkPriceSources.EXCHANGE_MARK_PRICE.value
@@ -0,0 +1,66 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import octobot_trading.constants as constants
+import octobot_trading.personal_data as personal_data
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+from octobot_trading.util import FixedPointConverter, MarketFixedPoint
+
+
+def test_fixed_point_converter():
+    converter = FixedPointConverter(4)
+    assert converter.to_fixed(decimal.Decimal("56.5128597145")) == 565128
+    assert converter.to_fixed(decimal.Decimal("-56.5128597145")) == -565128
+    assert converter.to_fixed(decimal.Decimal("56.5128597145"), round_up=True) == 565129
+    assert converter.to_fixed(decimal.Decimal("56.5128"), round_up=True) == 565128
+    assert converter.to_fixed(decimal.Decimal("-56.5128597145"), round_up=True) == -565128
+    assert converter.to_decimal(565128) == decimal.Decimal("56.5128")
+    assert converter.from_float(56.51286) == 565129
+    assert converter.from_float(0.1 + 0.2) == 3000
+    assert converter.from_float(56.51286, round_up=False) == 565128
+    assert converter.from_float(56.51281, round_up=True) == 565129
+    # float representation errors are not rounded
+    assert converter.from_float(0.1 + 0.2, round_up=False) == 3000
+    assert converter.from_float(0.1 + 0.2, round_up=True) == 3000
+    assert FixedPointConverter(3).from_float(101.016, round_up=False) == 101016
+    assert converter.float_to_decimal(56.51281) == decimal.Decimal("56.5128")
+    assert converter.to_decimal(0) is constants.ZERO
+
+    assert converter.trunc(decimal.Decimal("56.5128597145")) == decimal.Decimal("56.5128")
+    assert converter.trunc(decimal.Decimal("-56.5128597145")) == decimal.Decimal("-56.5128")
+    value = decimal.Decimal("56.5")
+    assert converter.trunc(value) is value
+    assert converter.trunc(decimal.Decimal("9.1E-7")) == constants.ZERO
+    assert converter.trunc(decimal.Decimal("nan")).is_nan()
+
+    assert FixedPointConverter(0).trunc(decimal.Decimal("1.99")) == constants.ONE
+    assert FixedPointConverter(-2).digits == 0
+
+
+def test_market_fixed_point():
+    symbol_market = {
+        Ecmsc.PRECISION.value: {Ecmsc.PRECISION_PRICE.value: 4, Ecmsc.PRECISION_AMOUNT.value: 2}
+    }
+    market_fixed_point = MarketFixedPoint(symbol_market)
+    for value in ("0.00015", "1", "56.5128597145", "1251.0000014576121234854513", "0.1"):
+        value = decimal.Decimal(value)
+        assert market_fixed_point.adapt_price(value) == personal_data.decimal_adapt_price(symbol_market, value)
+        assert market_fixed_point.adapt_quantity(value) == personal_data.decimal_adapt_quantity(symbol_market, value)
+    # use default precisions
+    market_fixed_point = MarketFixedPoint({Ecmsc.PRECISION.value: {}})
+    assert market_fixed_point.price.digits == constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS
+    assert market_fixed_point.amount.digits == 0
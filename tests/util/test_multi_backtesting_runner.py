@@ -0,0 +1,146 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+import octobot_trading.api.portfolio as portfolio_api
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import octobot_trading.util.multi_backtesting_runner as multi_backtesting_runner
+
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+
+pytestmark = pytest.mark.asyncio
+
+CANDLES = [
+    [3600, 1, 2, 0.5, 1.5, 10],
+    [0, 1, 2, 0.5, 1.5, 10],
+]
+
+
+async def _backtesting_function(run_config, shared_candles):
+    if run_config < 0:
+        raise ValueError("negative config")
+    candles = shared_candles.get_candles("binance", "BTC/USDT", "1h")
+    return {
+        "profitability": float(candles[:, 4].sum()) * run_config,
+        "profitability_percent": float(run_config),
+        "trades_count": len(candles),
+    }
+
+
+async def _exiting_backtesting_function(run_config, shared_candles):
+    # backtesting process crash
+    os._exit(1)
+
+
+@pytest.fixture
+def shared_candles():
+    shared_candles = multi_backtesting_runner.SharedCandles.create({
+        ("binance", "BTC/USDT", "1h"): CANDLES,
+        ("binance", "ETH/USDT", "1h"): [],
+    })
+    yield shared_candles
+    shared_candles.unlink()
+
+
+def test_shared_candles(shared_candles):
+    candles = shared_candles.get_candles("binance", "BTC/USDT", "1h")
+    # sorted by time
+    assert candles.tolist() == [CANDLES[1], CANDLES[0]]
+    with pytest.raises(ValueError):
+        candles[0, 0] = 1
+    assert shared_candles.get_candles("binance", "ETH/USDT", "1h").shape == (0, 6)
+    assert shared_candles.get_candles("binance", "BTC/USDT", "4h") is None
+    assert shared_candles.get_preloaded_candles("binance", "BTC/USDT", "1h") \
+        .get_candles_from_timestamps(0, 0) == [CANDLES[1]]
+
+    # pickled as a reference to the shared memory block
+    attached_candles = pickle.loads(pickle.dumps(shared_candles))
+    assert np.array_equal(attached_candles.get_candles("binance", "BTC/USDT", "1h"), candles)
+    assert attached_candles.close() is True
+
+    # candles (or views of them) are still referenced: stay attached
+    attached_candles = pickle.loads(pickle.dumps(shared_candles))
+    attached_preloaded_candles = attached_candles.get_preloaded_candles("binance", "BTC/USDT", "1h")
+    attached_view = attached_candles.get_candles("binance", "BTC/USDT", "1h")[1:, 4]
+    assert attached_candles.close() is False
+    assert attached_view.tolist() == [CANDLES[0][4]]
+    assert attached_preloaded_candles.get_candles_from_timestamps(0, 3600) == [CANDLES[0], CANDLES[1]]
+    del attached_view
+    assert attached_candles.close() is False
+    del attached_preloaded_candles
+    assert attached_candles.close() is True
+    # already detached
+    assert attached_candles.close() is True
+
+
+def test_run(shared_candles):
+    runner = multi_backtesting_runner.MultiBacktestingRunner(_backtesting_function, shared_candles, max_workers=2)
+    results = runner.run({"run_1": 1, "run_2": 2, "failing_run": -1})
+    assert len(results) == 3
+    assert results.get_column("run_id") == ["run_1", "run_2", "failing_run"]
+    assert results.get_column("profitability") == [3, 6, None]
+    assert results.get_column("trades_count") == [2, 2, None]
+    assert results.get_column("error") == [None, None, "ValueError: negative config"]
+    assert results.get_best_row()[0] == "run_2"
+    assert results.to_dicts()[0]["profitability_percent"] == 1
+
+
+def test_run_with_broken_process_pool(shared_candles):
+    runner = multi_backtesting_runner.MultiBacktestingRunner(_exiting_backtesting_function, shared_candles,
+                                                             max_workers=1)
+    results = runner.run({"run_1": 1, "run_2": 2})
+    assert results.get_column("run_id") == ["run_1", "run_2"]
+    assert results.get_column("profitability") == [None, None]
+    assert all(error.startswith("BrokenProcessPool") for error in results.get_column("error"))
+    assert results.get_best_row() is None
+
+
+async def test_get_backtesting_run_result(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    trades_manager = exchange_manager.exchange_personal_data.trades_manager
+    for trade_id, fee_cost in (("1", "0.1"), ("2", "0.2")):
+        trade = personal_data.Trade(trader)
+        trade.trade_id = trade_id
+        trade.symbol = "BTC/USDT"
+        trade.side = enums.TradeOrderSide.BUY
+        trade.status = enums.OrderStatus.FILLED
+        trade.executed_quantity = decimal.Decimal("1")
+        trade.fee = {
+            enums.FeePropertyColumns.CURRENCY.value: "BTC",
+            enums.FeePropertyColumns.COST.value: decimal.Decimal(fee_cost),
+        }
+        trades_manager.upsert_trade_instance(trade)
+
+    result = multi_backtesting_runner.get_backtesting_run_result(exchange_manager)
+    assert result["profitability"] == 0
+    assert result["profitability_percent"] == 0
+    assert result["trades_count"] == 2
+    assert result["paid_fees"] == {"BTC": pytest.approx(0.3)}
+    assert result["end_portfolio"] == {
+        currency: float(amounts[constants.CONFIG_PORTFOLIO_TOTAL])
+        for currency, amounts in portfolio_api.get_portfolio(exchange_manager).items()
+    }
+    assert result["end_portfolio"]
+    # results can be sent from backtesting processes
+    assert pickle.loads(pickle.dumps(result)) == result
@@ -0,0 +1,134 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import os
+
+import numpy as np
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.util.simulation_checkpoint as simulation_checkpoint
+from octobot_trading.enums import TraderOrderType
+from octobot_trading.exchange_data import CandlesManager
+from octobot_trading.personal_data import create_order_instance
+
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests.personal_data import DEFAULT_ORDER_SYMBOL
+
+pytestmark = pytest.mark.asyncio
+
+CANDLES = [
+    [0, 100, 110, 90, 105, 10],
+    [3600, 105, 115, 95, 110, 20],
+]
+
+
+async def _init_simulated_state(exchange_manager, trader):
+    symbol_data = exchange_manager.exchange_symbols_data.get_exchange_symbol_data(DEFAULT_ORDER_SYMBOL)
+    candles_manager = CandlesManager()
+    await candles_manager.initialize()
+    candles_manager.replace_all_candles(CANDLES)
+    symbol_data.symbol_candles[commons_enums.TimeFrames.ONE_HOUR] = candles_manager
+    symbol_data.order_book_manager.handle_new_books(asks=[[111, 1]], bids=[[109, 2]], timestamp=3600)
+    return await trader.create_order(create_order_instance(trader=trader,
+                                                           order_type=TraderOrderType.BUY_LIMIT,
+                                                           symbol=DEFAULT_ORDER_SYMBOL,
+                                                           current_price=decimal.Decimal("110"),
+                                                           quantity=decimal.Decimal("0.1"),
+                                                           price=decimal.Decimal("100")))
+
+
+async def test_get_and_restore_simulation_state(backtesting_trader):
+    _, exchange_manager, trader = backtesting_trader
+    order = await _init_simulated_state(exchange_manager, trader)
+    portfolio = exchange_manager.exchange_personal_data.portfolio_manager.portfolio
+    saved_portfolio = {currency: dict(amounts) for currency, amounts in portfolio.portfolio.items()}
+    state = simulation_checkpoint.loads_simulation_state(
+        simulation_checkpoint.dumps_simulation_state(simulation_checkpoint.get_simulation_state(exchange_manager))
+    )
+
+    # lose the simulated state
+    await trader.cancel_order(order)
+    symbol_data = exchange_manager.exchange_symbols_data.get_exchange_symbol_data(DEFAULT_ORDER_SYMBOL)
+    symbol_data.symbol_candles.clear()
+    symbol_data.order_book_manager.reset_order_book()
+    assert exchange_manager.exchange_personal_data.orders_manager.get_open_orders() == []
+
+    await simulation_checkpoint.restore_simulation_state(exchange_manager, state)
+    candles_manager = symbol_data.symbol_candles[commons_enums.TimeFrames.ONE_HOUR]
+    assert np.array_equal(candles_manager.get_symbol_close_candles(), np.array([105, 110], dtype=np.float64))
+    assert symbol_data.order_book_manager.get_ask()[0] == 111
+    assert symbol_data.order_book_manager.timestamp == 3600
+    restored_order, = exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+    assert restored_order is not order
+    assert restored_order.order_id == order.order_id
+    assert restored_order.origin_price == order.origin_price
+    assert restored_order.creation_time == order.creation_time
+    # price event registered again
+    assert restored_order.limit_price_hit_event is not None
+    assert portfolio.portfolio == saved_portfolio
+
+
+async def test_simulation_checkpointer(backtesting_trader, tmp_path):
+    _, exchange_manager, trader = backtesting_trader
+    await _init_simulated_state(exchange_manager, trader)
+    file_path = os.path.join(tmp_path, "checkpoint.bin")
+    checkpointer = simulation_checkpoint.SimulationCheckpointer(exchange_manager, file_path, 3600)
+    assert not checkpointer.on_timestamp(0)
+    assert not checkpointer.on_timestamp(1800)
+    assert not os.path.isfile(file_path)
+    assert checkpointer.on_timestamp(3600)
+    assert checkpointer.checkpoints_count == 1
+    state = simulation_checkpoint.load_checkpoint(file_path)
+    assert state["version"] == simulation_checkpoint.CHECKPOINT_FORMAT_VERSION
+    assert len(state["personal_data"]["orders"]) == 1
+    assert DEFAULT_ORDER_SYMBOL in state["symbols_data"]
+
+
+async def test_restore_linked_orders(backtesting_trader):
+    _, exchange_manager, trader = backtesting_trader
+    await _init_simulated_state(exchange_manager, trader)
+    sell_limit = await trader.create_order(create_order_instance(trader=trader,
+                                                                order_type=TraderOrderType.SELL_LIMIT,
+                                                                symbol=DEFAULT_ORDER_SYMBOL,
+                                                                current_price=decimal.Decimal("110"),
+                                                                quantity=decimal.Decimal("0.1"),
+                                                                price=decimal.Decimal("130")))
+    stop_loss = await trader.create_order(create_order_instance(trader=trader,
+                                                               order_type=TraderOrderType.STOP_LOSS,
+                                                               symbol=DEFAULT_ORDER_SYMBOL,
+                                                               current_price=decimal.Decimal("110"),
+                                                               quantity=decimal.Decimal("0.1"),
+                                                               price=decimal.Decimal("90"),
+                                                               linked_to=sell_limit))
+    state = simulation_checkpoint.loads_simulation_state(
+        simulation_checkpoint.dumps_simulation_state(simulation_checkpoint.get_simulation_state(exchange_manager))
+    )
+    # linked orders are restored first
+    state["personal_data"]["orders"].reverse()
+    await trader.cancel_open_orders(DEFAULT_ORDER_SYMBOL)
+    assert exchange_manager.exchange_personal_data.orders_manager.get_open_orders() == []
+
+    await simulation_checkpoint.restore_simulation_state(exchange_manager, state)
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    restored_sell_limit = orders_manager.get_order(sell_limit.order_id)
+    restored_stop_loss = orders_manager.get_order(stop_loss.order_id)
+    assert restored_stop_loss.linked_to is restored_sell_limit
+    assert restored_stop_loss.linked_orders == [restored_sell_limit]
+    assert restored_sell_limit.linked_to is None
+    assert restored_sell_limit.linked_orders == [restored_stop_loss]